@@ -0,0 +1,60 @@
+# benchmarks/bench_bulk_import.py
+"""
+Compares importing tasks one save per task (what the GUI path does) with the batched
+import used by cli.py, for each storage backend.
+
+Run from the project root:
+    python -m benchmarks.bench_bulk_import
+"""
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from core.transfer import import_tasks
+from models.records import Task
+from core.sqlite_task_store import SqliteTaskStore
+from core.task_journal import JournalTaskStore
+from core.task_store import TaskStore
+
+TASK_COUNT = 5_000
+DATES = 365
+
+
+def records():
+    keys = [(date(2025, 1, 1) + timedelta(days=i)).isoformat() for i in range(DATES)]
+    for n in range(TASK_COUNT):
+        yield keys[n % DATES], Task(f"Imported task {n}")
+
+
+def per_task(store):
+    for key, task in records():
+        store.save(key, store.load(key) + [task])
+
+
+def batched(store):
+    import_tasks(store, records())
+
+
+def main():
+    backends = (
+        ("json", lambda folder: TaskStore(os.path.join(folder, "tasks.json"))),
+        ("journal", lambda folder: JournalTaskStore(os.path.join(folder, "tasks.json"))),
+        ("sqlite", lambda folder: SqliteTaskStore(os.path.join(folder, "tasks.db"))),
+    )
+    print(f"{TASK_COUNT} tasks over {DATES} dates")
+    print(f"{'backend':>8} {'per task s':>11} {'batched s':>10}")
+    for name, open_store in backends:
+        timings = []
+        for importer in (per_task, batched):
+            with tempfile.TemporaryDirectory() as folder:
+                store = open_store(folder)
+                start = time.perf_counter()
+                importer(store)
+                store.close()
+                timings.append(time.perf_counter() - start)
+        print(f"{name:>8} {timings[0]:>11.2f} {timings[1]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
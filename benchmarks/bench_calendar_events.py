@@ -0,0 +1,99 @@
+# benchmarks/bench_calendar_events.py
+"""
+Measures calendar event queries at 100k events.
+
+Compares the interval index behind CalendarModel with scanning a plain list (the
+previous storage) for: one-day overlap queries, conflict checks for a new event, and
+removal of an event by its ID.
+
+Run from the project root:
+    python -m benchmarks.bench_calendar_events
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+from models.calendar_model import CalendarModel
+
+EVENT_COUNT = 100_000
+QUERIES = 1_000
+REMOVALS = 1_000
+SPAN_DAYS = 4 * 365
+
+
+def make_events(rng):
+    """
+    Returns EVENT_COUNT events spread over SPAN_DAYS: mostly short classes and meetings,
+    with some all-day and multi-day events.
+    """
+    origin = datetime(2024, 1, 1)
+    events = []
+    for i in range(EVENT_COUNT):
+        start = origin + timedelta(minutes=rng.randrange(SPAN_DAYS * 24 * 4) * 15)
+        kind = rng.random()
+        if kind < 0.9:
+            length = timedelta(minutes=rng.choice((30, 60, 90, 120)))
+        elif kind < 0.99:
+            length = timedelta(days=1)
+        else:
+            length = timedelta(days=rng.randint(2, 14))
+        events.append({"title": f"Event {i}", "start": start, "end": start + length})
+    return events
+
+
+def random_windows(rng, length):
+    origin = datetime(2024, 1, 1)
+    windows = []
+    for _ in range(QUERIES):
+        start = origin + timedelta(minutes=rng.randrange(SPAN_DAYS * 24 * 4) * 15)
+        windows.append((start, start + length))
+    return windows
+
+
+def timed(function, items):
+    """
+    Returns (mean microseconds per call, results) for calling `function` on every item.
+    """
+    start = time.perf_counter()
+    results = [function(*item) for item in items]
+    return (time.perf_counter() - start) / len(items) * 1e6, results
+
+
+def main():
+    rng = random.Random(7)
+    events = make_events(rng)
+
+    start = time.perf_counter()
+    for event in events:
+        CalendarModel.add_event(event)
+    build_seconds = time.perf_counter() - start
+    baseline = CalendarModel.get_events()
+    print(f"{EVENT_COUNT:,} events, index built in {build_seconds:.2f} s ({build_seconds / EVENT_COUNT * 1e6:.1f} us/event)")
+    print()
+    print(f"{'operation':>22} {'list scan us':>13} {'index us':>9} {'speedup':>8} {'avg results':>12}")
+
+    def scan(start, end):
+        return [event for event in baseline if event.start < end and event.end > start]
+
+    for label, length in (("day overlap query", timedelta(days=1)), ("week overlap query", timedelta(days=7))):
+        windows = random_windows(rng, length)
+        scan_us, expected = timed(scan, windows[:50])
+        index_us, results = timed(CalendarModel.get_events_between, windows)
+        assert results[:50] == expected
+        average = sum(map(len, results)) / len(results)
+        print(f"{label:>22} {scan_us:>13.1f} {index_us:>9.1f} {scan_us / index_us:>7.0f}x {average:>12.1f}")
+
+    slots = random_windows(rng, timedelta(hours=1))
+    scan_us, _ = timed(lambda start, end: any(True for _ in scan(start, end)), slots[:50])
+    index_us, _ = timed(CalendarModel.has_conflict, slots)
+    print(f"{'conflict check':>22} {scan_us:>13.1f} {index_us:>9.1f} {scan_us / index_us:>7.0f}x {'':>12}")
+
+    victims = rng.sample(baseline, REMOVALS)
+    remaining = list(baseline)
+    scan_us, _ = timed(lambda event: remaining.remove(event), [(event,) for event in victims[:50]])
+    index_us, _ = timed(CalendarModel.remove_event, [(event.id,) for event in victims])
+    print(f"{'remove by ID':>22} {scan_us:>13.1f} {index_us:>9.1f} {scan_us / index_us:>7.0f}x {'':>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_core_import.py
+"""
+Measures how long the Qt-free core takes to import, and checks that it stays Qt-free.
+
+Each run imports the core modules (task storage, notes, logging and the write queue) in a
+fresh interpreter and reports the import time and whether PyQt5 was loaded. The core loads
+its storage engines and models on first use, so they are timed separately, as is
+PyQt5.QtWidgets, which the GUI needs.
+
+Run from the project root:
+    python -m benchmarks.bench_core_import
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 9
+
+CORE_MODULES = [
+    "core.tasks",
+    "core.notes",
+    "core.log",
+    "core.write_queue",
+]
+
+# Loaded by the core on first use.
+ENGINE_MODULES = [
+    "core.task_store",
+    "core.sqlite_task_store",
+    "models.notes_model",
+    "models.note_store",
+    "models.calendar_model",
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+print((time.perf_counter() - start) * 1e3, any(name.startswith("PyQt5") for name in sys.modules))
+"""
+
+
+def time_import(modules):
+    """
+    Imports `modules` in a fresh interpreter and returns (milliseconds, PyQt5 loaded).
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(modules=modules)],
+        cwd=os.getcwd(), capture_output=True, text=True, check=True,
+    )
+    milliseconds, qt_loaded = result.stdout.split()
+    return float(milliseconds), qt_loaded == "True"
+
+
+def main():
+    print(f"{'imports':>16} {'median ms':>10} {'PyQt5 loaded':>13}")
+    for name, modules in (
+        ("core", CORE_MODULES),
+        ("engines, models", ENGINE_MODULES),
+        ("PyQt5.QtWidgets", ["PyQt5.QtWidgets"]),
+    ):
+        runs = [time_import(modules) for _ in range(RUNS)]
+        median = statistics.median(milliseconds for milliseconds, _ in runs)
+        print(f"{name:>16} {median:>10.1f} {str(any(loaded for _, loaded in runs)):>13}")
+
+
+if __name__ == "__main__":
+    main()
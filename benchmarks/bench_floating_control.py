@@ -0,0 +1,102 @@
+# benchmarks/bench_floating_control.py
+"""
+Measures the per-frame cost of the floating control's expand/collapse animation.
+
+"stylesheet" replays the previous per-frame work (a new style sheet with the current
+border radius and showing/hiding the buttons on every tick); "painted" is the current
+FloatingControl, which repaints a cached outline and only toggles the buttons when the
+reveal height is crossed. Both run the real animation inside the main window with frame
+profiling on.
+
+Run from the project root:
+    python -m benchmarks.bench_floating_control
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.getcwd())
+
+from PyQt5.QtWidgets import QApplication
+
+CYCLES = 10
+
+
+def make_stylesheet_control(base):
+    class StyleSheetFloatingControl(base):
+        def update_position_and_style(self):
+            self.frame_timer.begin_frame()
+            if self.parent():
+                self.move(self.x(), self.parent().height() - self.height() - 25)
+            radius = self.height() / 2
+            self.setStyleSheet(f"""
+                QWidget#FloatingControl {{
+                    background-color: #3498DB;
+                    border: none;
+                    border-radius: {radius}px;
+                }}
+            """)
+            for btn in (self.btn_calendar, self.btn_notes, self.btn_home):
+                btn.setVisible(self.height() > 90)
+            self.label_toggle.show()
+            self.frame_timer.end_frame()
+
+    return StyleSheetFloatingControl
+
+
+def run_cycles(app, control):
+    """
+    Expands and collapses `control` CYCLES times and returns the frame reports.
+    """
+    reports = []
+    for _ in range(CYCLES * 2):
+        if control.expanded:
+            control.collapse()
+        else:
+            control.expand()
+        deadline = time.perf_counter() + 2
+        while control.animation.state() and time.perf_counter() < deadline:
+            app.processEvents()
+        app.processEvents()
+        reports.append(control.last_frame_report)
+    return reports
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    # Images are loaded relative to the working directory.
+    os.symlink(os.path.join(root, "resources"), "resources")
+    from utils.style_engine import apply_styles
+    apply_styles(app)
+
+    from components.floating_control import FloatingControl
+    from main import MainWindow
+
+    window = MainWindow()
+    window.resize(1200, 700)
+    window.show()
+    app.processEvents()
+    window.floating_control.hide()
+
+    print(f"{'mode':>11} {'frames':>7} {'mean ms':>8} {'p95 ms':>7} {'max ms':>7}")
+    for mode, cls in (("stylesheet", make_stylesheet_control(FloatingControl)), ("painted", FloatingControl)):
+        control = cls(window)
+        control.set_frame_profiling(True)
+        control.show()
+        app.processEvents()
+        reports = [r for r in run_cycles(app, control) if r and r["frames"]]
+        frames = sum(r["frames"] for r in reports)
+        mean = sum(r["mean_ms"] * r["frames"] for r in reports) / max(frames, 1)
+        p95 = max(r["p95_ms"] for r in reports)
+        worst = max(r["max_ms"] for r in reports)
+        print(f"{mode:>11} {frames:>7} {mean:>8.3f} {p95:>7.3f} {worst:>7.3f}")
+        control.hide()
+        control.deleteLater()
+
+
+if __name__ == "__main__":
+    main()
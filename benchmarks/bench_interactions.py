@@ -0,0 +1,331 @@
+# benchmarks/bench_interactions.py
+"""
+Measures input-to-paint latency of scripted user sessions against the main window.
+
+A session driver replays realistic sessions on Qt's offscreen platform: opening the
+calendar from the floating control, clicking dates and paging months, typing and adding
+tasks, switching to the notes, creating a note and typing into it, and going home. Input
+is synthesized with QTest; each interaction is timed from just before the input event is
+delivered until the event loop has painted the widget that shows the result (the task
+list after a date click, the new view after a switch, the editor after a keystroke).
+Latencies are reported per interaction as p50, p95, p99 and max.
+
+Runs in a temporary working directory filled with a synthetic dataset (see
+benchmarks/datasets.py), so the real storage folder is not touched.
+
+    python -m benchmarks.bench_interactions --sessions 10 --size medium --json latency.json
+
+Run from the project root:
+    python -m benchmarks.bench_interactions
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.getcwd())
+
+from PyQt5.QtCore import QDate, QEvent, QObject, Qt
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication, QPushButton, QTableView, QToolButton
+
+from benchmarks import datasets
+from benchmarks.suite import SIZES
+
+# An interaction whose result is not painted within this time is counted as timed out.
+PAINT_TIMEOUT_MS = 2000
+# Longest wait for the floating control's expand animation.
+ANIMATION_TIMEOUT_MS = 2000
+
+
+class PaintProbe(QObject):
+    """
+    Event filter noting when a watched widget receives a paint event.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.widget = None
+        self.painted = False
+
+    def watch(self, widget):
+        if self.widget is not None:
+            self.widget.removeEventFilter(self)
+        self.widget = widget
+        self.painted = False
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QEvent.Paint:
+            self.painted = True
+        return False
+
+
+class LatencyRecorder:
+    """
+    Collects latency samples by interaction name and summarizes them as percentiles.
+    """
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.timeouts = defaultdict(int)
+
+    def add(self, name, milliseconds):
+        self.samples[name].append(milliseconds)
+
+    def timed_out(self, name):
+        self.timeouts[name] += 1
+
+    def report(self):
+        """
+        Returns:
+            dict: For each interaction, the number of samples and timeouts and the p50,
+            p95, p99 and max latency in milliseconds.
+        """
+        report = {}
+        for name in sorted(set(self.samples) | set(self.timeouts)):
+            samples = self.samples.get(name, [])
+            report[name] = {
+                "count": len(samples),
+                "timeouts": self.timeouts.get(name, 0),
+                "p50_ms": percentile(samples, 50),
+                "p95_ms": percentile(samples, 95),
+                "p99_ms": percentile(samples, 99),
+                "max_ms": max(samples, default=0.0),
+            }
+        return report
+
+
+def percentile(samples, p):
+    if not samples:
+        return 0.0
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[p - 1]
+
+
+class SessionDriver:
+    """
+    Replays user actions against a MainWindow and records input-to-paint latencies.
+    """
+
+    def __init__(self, app, window, recorder):
+        self.app = app
+        self.window = window
+        self.recorder = recorder
+        self.probe = PaintProbe()
+
+    # -- Event loop -----------------------------------------------------------------
+
+    def settle(self):
+        """
+        Runs pending events (including deferred deletes) so earlier work is not charged
+        to the next interaction.
+        """
+        for _ in range(3):
+            self.app.processEvents()
+            self.app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def interact(self, name, action, target):
+        """
+        Performs one timed interaction.
+
+        Args:
+            name (str): The interaction name the latency is recorded under.
+            action (callable): Delivers the input (e.g. a QTest click).
+            target (callable): Returns the widget whose paint shows the result; called
+                               after the input, so it may be a widget the input created.
+        """
+        self.settle()
+        start = time.perf_counter()
+        action()
+        self.probe.watch(target())
+        while True:
+            self.app.processEvents()
+            elapsed = (time.perf_counter() - start) * 1e3
+            if self.probe.painted:
+                self.recorder.add(name, elapsed)
+                return
+            if elapsed > PAINT_TIMEOUT_MS:
+                self.recorder.timed_out(name)
+                return
+
+    def wait_until(self, condition, timeout_ms):
+        deadline = time.perf_counter() + timeout_ms / 1e3
+        while not condition() and time.perf_counter() < deadline:
+            self.app.processEvents()
+            time.sleep(0.001)
+
+    # -- Views ----------------------------------------------------------------------
+
+    def section(self):
+        """
+        Returns the widget shown in the dashboard's right section.
+        """
+        return self.window.dashboard_view.current_view()
+
+    # -- Actions --------------------------------------------------------------------
+
+    def switch_to(self, section):
+        """
+        Opens a dashboard section ("calendar", "notes" or "home") from the floating control.
+        """
+        control = self.window.floating_control
+        if not control.expanded:
+            self.interact("floating_control.expand", lambda: QTest.mouseClick(control.label_toggle, Qt.LeftButton),
+                          lambda: control)
+            self.wait_until(lambda: control.animation.state() == control.animation.Stopped, ANIMATION_TIMEOUT_MS)
+        button = {"calendar": control.btn_calendar, "notes": control.btn_notes, "home": control.btn_home}[section]
+        self.interact(f"switch.{section}", lambda: QTest.mouseClick(button, Qt.LeftButton), self.section)
+
+    def click_date(self, date):
+        """
+        Clicks a date of the month shown in the calendar.
+        """
+        calendar = self.section().view.calendar
+        table = calendar.findChild(QTableView)
+        cell = self.date_cell(calendar, table, date)
+        task_view = self.section().view.task_list.task_list.viewport()
+        self.interact("calendar.click_date",
+                      lambda: QTest.mouseClick(table.viewport(), Qt.LeftButton, pos=table.visualRect(cell).center()),
+                      lambda: task_view)
+
+    @staticmethod
+    def date_cell(calendar, table, date):
+        """
+        Returns the calendar grid index showing a day of the current month. Days from the
+        neighbouring months share the grid: early days are matched first, late days last.
+        """
+        model = table.model()
+        # The first row holds the day names and the first column the week numbers, when shown.
+        first_row = 0 if calendar.horizontalHeaderFormat() == calendar.NoHorizontalHeader else 1
+        first_column = 0 if calendar.verticalHeaderFormat() == calendar.NoVerticalHeader else 1
+        matches = [
+            model.index(row, column)
+            for row in range(first_row, model.rowCount())
+            for column in range(first_column, model.columnCount())
+            if model.index(row, column).data() == date.day()
+        ]
+        return matches[0] if date.day() < 15 else matches[-1]
+
+    def page_month(self, forward=True):
+        """
+        Clicks the calendar's next (or previous) month arrow.
+        """
+        calendar = self.section().view.calendar
+        button = calendar.findChild(QToolButton, "qt_calendar_nextmonth" if forward else "qt_calendar_prevmonth")
+        table = calendar.findChild(QTableView)
+        self.interact("calendar.page_month", lambda: QTest.mouseClick(button, Qt.LeftButton), table.viewport)
+
+    def add_task(self, text):
+        """
+        Types a task into the task input key by key, then clicks "Add Task".
+        """
+        task_list = self.section().view.task_list
+        QTest.mouseClick(task_list.task_input, Qt.LeftButton)
+        for character in text:
+            self.interact("task.keystroke", lambda: QTest.keyClick(task_list.task_input, character),
+                          lambda: task_list.task_input)
+        self.interact("task.add", lambda: QTest.mouseClick(task_list.add_task_button, Qt.LeftButton),
+                      task_list.task_list.viewport)
+
+    def write_note(self, notebook_row, text):
+        """
+        Selects a notebook, clicks "New Note" and types into the editor key by key.
+        """
+        view = self.section()
+        view.notebook_list.setCurrentIndex(view.notebook_model.index(notebook_row))
+        new_note = next(button for button in view.findChildren(QPushButton) if button.text() == "New Note")
+        editor = view.note_editor.text_edit
+        self.interact("note.new", lambda: QTest.mouseClick(new_note, Qt.LeftButton), editor.viewport)
+        for character in text:
+            self.interact("note.keystroke", lambda: QTest.keyClick(editor, character), editor.viewport)
+
+
+def run_session(driver, rng, dates, notebooks, clicks=12, tasks=2, note_words=12):
+    """
+    Replays one session: plan in the calendar, add tasks, write a note, go home.
+    """
+    driver.switch_to("calendar")
+    calendar = driver.section().view.calendar
+    start = QDate.fromString(rng.choice(dates), "yyyy-MM-dd")
+    calendar.setCurrentPage(start.year(), start.month())
+    driver.settle()
+    for click in range(clicks):
+        if click and click % 5 == 0:
+            driver.page_month(forward=rng.random() < 0.7)
+        page = QDate(calendar.yearShown(), calendar.monthShown(), 1)
+        # Clicking the date that is already selected changes nothing, so nothing is painted.
+        day = calendar.selectedDate()
+        while day == calendar.selectedDate():
+            day = page.addDays(rng.randrange(page.daysInMonth()))
+        driver.click_date(day)
+    for _ in range(tasks):
+        driver.add_task(datasets.sentence(rng, rng.randint(2, 4)))
+    driver.switch_to("notes")
+    driver.write_note(rng.randrange(notebooks), datasets.sentence(rng, note_words))
+    driver.switch_to("home")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_interactions",
+                                     description="Input-to-paint latency of scripted user sessions.")
+    parser.add_argument("--sessions", type=int, default=5, help="number of sessions to replay")
+    parser.add_argument("--size", choices=SIZES, default="small", help="dataset size preset")
+    parser.add_argument("--dates", type=int, help="N: dates with tasks")
+    parser.add_argument("--tasks-per-date", type=int, help="M: tasks per date")
+    parser.add_argument("--notebooks", type=int, help="K: notebooks")
+    parser.add_argument("--notes-per-notebook", type=int, help="L: notes per notebook")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="write the report to this file")
+    args = parser.parse_args(argv)
+    sizes = dict(SIZES[args.size])
+    for key in sizes:
+        if getattr(args, key) is not None:
+            sizes[key] = getattr(args, key)
+
+    app = QApplication.instance() or QApplication([])
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="bench-interactions-"))
+    os.symlink(os.path.join(root, "resources"), "resources")
+
+    from core import notes as notes_api
+    from core.tasks import get_default_task_store
+    from main import MainWindow
+    from utils.style_engine import apply_styles
+
+    tasks = datasets.task_dataset(sizes["dates"], sizes["tasks_per_date"])
+    datasets.fill_task_store(get_default_task_store(), tasks)
+    datasets.fill_notes(notes_api, datasets.note_dataset(sizes["notebooks"], sizes["notes_per_notebook"]))
+
+    apply_styles(app, root)
+    window = MainWindow()
+    window.show()
+    recorder = LatencyRecorder()
+    driver = SessionDriver(app, window, recorder)
+    driver.settle()
+
+    rng = random.Random(args.seed)
+    for _ in range(args.sessions):
+        run_session(driver, rng, list(tasks), sizes["notebooks"])
+
+    report = recorder.report()
+    print(f"sizes: {sizes}, sessions: {args.sessions}")
+    print(f"{'interaction':>26} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'timeouts':>9}")
+    for name, summary in report.items():
+        print(f"{name:>26} {summary['count']:>6} {summary['p50_ms']:>8.2f} {summary['p95_ms']:>8.2f} "
+              f"{summary['p99_ms']:>8.2f} {summary['max_ms']:>8.2f} {summary['timeouts']:>9}")
+    if args.json:
+        with open(os.path.join(root, args.json), "w") as file:
+            json.dump({"sizes": sizes, "sessions": args.sessions, "seed": args.seed, "interactions": report}, file, indent=4)
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_note_images.py
+"""
+Measures a note editor holding many large photos.
+
+Generates IMAGES noisy 4000x3000 JPEGs (about 12 megapixels, like phone photos) and
+inserts them into a NoteEditor two ways: "original" references the files themselves, as
+insert_image used to; "ingested" goes through the image ingest pipeline, which inserts a
+placeholder at once and stores display-resolution copies in the background. Reports the
+time to insert all images, the time until the copies are ready, and the median time to
+resize and repaint the editor afterwards. Uses a temporary working directory so the real
+storage folder is not touched.
+
+Run from the project root:
+    python -m benchmarks.bench_note_images
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.getcwd())
+
+from PyQt5.QtCore import QUrl
+from PyQt5.QtGui import QColor, QImage, QPixmap, QTextDocument
+from PyQt5.QtWidgets import QApplication
+
+IMAGES = 12
+PHOTO_SIZE = (4000, 3000)
+RESIZES = 10
+
+
+def make_photos(folder):
+    """
+    Writes IMAGES large JPEGs with enough detail that they do not compress to nothing.
+    """
+    rng = random.Random(7)
+    paths = []
+    for i in range(IMAGES):
+        image = QImage(PHOTO_SIZE[0], PHOTO_SIZE[1], QImage.Format_RGB32)
+        image.fill(QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        for _ in range(2000):
+            x, y = rng.randrange(PHOTO_SIZE[0] - 64), rng.randrange(PHOTO_SIZE[1] - 64)
+            color = QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            for dx in range(0, 64, 8):
+                image.setPixelColor(x + dx, y + dx // 2, color)
+        path = os.path.join(folder, f"photo{i}.jpg")
+        image.save(path, "JPG", 90)
+        paths.append(path)
+    return paths
+
+
+def time_resizes(app, editor):
+    """
+    Returns the median time in milliseconds to resize the editor and let it relayout and repaint.
+    """
+    latencies = []
+    for i in range(RESIZES):
+        start = time.perf_counter()
+        editor.resize(700 + 100 * (i % 2), 600)
+        editor.text_edit.viewport().repaint()
+        app.processEvents()
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(latencies)
+
+
+def resource_megabytes(editor, sources):
+    """
+    Returns the memory held by the decoded images of the editor's document, in megabytes.
+    """
+    document = editor.text_edit.document()
+    total = 0
+    for source in sources:
+        image = document.resource(QTextDocument.ImageResource, QUrl(source))
+        if isinstance(image, QPixmap):
+            image = image.toImage()
+        if isinstance(image, QImage):
+            total += image.sizeInBytes()
+    return total / 1e6
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    os.chdir(tempfile.mkdtemp())
+    photos = make_photos(os.getcwd())
+
+    from components.note_editor import NoteEditor
+    from utils.image_ingest import get_image_ingest
+    import components.note_editor as note_editor
+
+    print(f"{'mode':>9} {'insert ms':>10} {'ready ms':>9} {'resize ms':>10} {'pixels MB':>10}")
+    for mode in ("original", "ingested"):
+        editor = NoteEditor()
+        editor.resize(800, 600)
+        editor.show()
+        app.processEvents()
+        sources = []
+        start = time.perf_counter()
+        for path in photos:
+            if mode == "original":
+                editor.text_edit.insertHtml(f'<img src="{path}" alt="Image">')
+                sources.append(path)
+            else:
+                note_editor.import_image = lambda path=path: path
+                editor.insert_image()
+                sources.append(get_image_ingest().stored_path(path))
+        app.processEvents()
+        inserted = (time.perf_counter() - start) * 1e3
+        get_image_ingest().wait()
+        app.processEvents()
+        ready = (time.perf_counter() - start) * 1e3
+        resize = time_resizes(app, editor)
+        megabytes = resource_megabytes(editor, sources)
+        print(f"{mode:>9} {inserted:>10.1f} {ready:>9.1f} {resize:>10.1f} {megabytes:>10.1f}")
+        editor.close()
+
+
+if __name__ == "__main__":
+    main()
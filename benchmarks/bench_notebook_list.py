@@ -0,0 +1,93 @@
+# benchmarks/bench_notebook_list.py
+"""
+Measures the cost of adding one notebook as the number of notebooks grows.
+
+Compares rebuilding the whole QListWidget after every insert (the previous
+NotesView.load_notebooks behaviour) with NotebookListModel applying the batched
+change notifications from NotesModel. A NoteStore is open in a temporary folder, as in
+the application, so each add also queues its metadata record (see models/note_store.py).
+The "flush ms" column is the time to write the queued records for all the adds, which
+happens on the write queue's worker thread in the application.
+
+Run from the project root:
+    python -m benchmarks.bench_notebook_list
+"""
+import os
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QListView, QListWidget, QListWidgetItem
+
+from components.notebook_list import NotebookListModel
+from models.note_store import NoteStore
+from models.notes_model import NotesModel
+from utils.change_batcher import ChangeBatcher
+
+NOTEBOOK_COUNTS = (5, 500, 5_000, 50_000)
+INSERTS = 20
+
+
+def rebuild(widget):
+    widget.clear()
+    for notebook_id, notebook in NotesModel.get_notebooks().items():
+        item = QListWidgetItem(f"{notebook_id}: {notebook.name}")
+        item.setData(Qt.UserRole, notebook_id)
+        widget.addItem(item)
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as folder:
+        run(app, folder)
+
+
+def run(app, folder):
+    print(f"{'notebooks':>10} {'rebuild ms/add':>15} {'diff ms/add':>12} {'flush ms':>9}")
+    for count in NOTEBOOK_COUNTS:
+        NotesModel.open_store(NoteStore(os.path.join(folder, str(count))))
+        for i in range(count):
+            NotesModel.add_notebook(f"Notebook {i}")
+        NotesModel.flush()
+
+        widget = QListWidget()
+        widget.show()
+        rebuild(widget)
+        start = time.perf_counter()
+        for i in range(INSERTS):
+            NotesModel.add_notebook(f"Rebuilt {i}")
+            rebuild(widget)
+            app.processEvents()
+        rebuild_ms = (time.perf_counter() - start) / INSERTS * 1e3
+        widget.deleteLater()
+
+        model = NotebookListModel(NotesModel.get_notebooks)
+        view = QListView()
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.Batched)
+        view.setModel(model)
+        view.show()
+        batcher = ChangeBatcher()
+        batcher.changesReady.connect(model.apply_changes)
+        NotesModel.subscribe(batcher.add)
+        app.processEvents()
+        start = time.perf_counter()
+        for i in range(INSERTS):
+            NotesModel.add_notebook(f"Diffed {i}")
+            app.processEvents()
+        diff_ms = (time.perf_counter() - start) / INSERTS * 1e3
+        start = time.perf_counter()
+        NotesModel.flush()
+        flush_ms = (time.perf_counter() - start) * 1e3
+        NotesModel.unsubscribe(batcher.add)
+        assert model.rowCount() == len(NotesModel.get_notebooks())
+        view.deleteLater()
+        app.processEvents()
+
+        print(f"{count:>10,} {rebuild_ms:>15.2f} {diff_ms:>12.3f} {flush_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_notes_search.py
+"""
+Measures NotesModel full-text search latency over 50k synthetic notes.
+
+Run from the project root:
+    python -m benchmarks.bench_notes_search
+"""
+import random
+import time
+
+from models.notes_model import NotesModel
+
+NOTE_COUNT = 50_000
+WORDS_PER_NOTE = (40, 120)
+VOCABULARY_SIZE = 20_000
+REPEATS = 200
+
+QUERIES = (
+    ("single word", "lecture", "and"),
+    ("two words AND", "exam chapter", "and"),
+    ("two words OR", "exam chapter", "or"),
+    ("prefix (typing)", "photosyn", "and"),
+    ("other word", "mitochondria", "and"),
+    ("word + prefix", "lecture revi", "and"),
+)
+
+COMMON_WORDS = ["lecture", "exam", "chapter", "review", "revision", "notes", "homework", "photosynthesis",
+                "mitochondria", "theorem", "essay", "lab"]
+
+
+def build_corpus(rng):
+    """
+    Fills NotesModel with NOTE_COUNT notes whose words follow a Zipf-like distribution.
+    """
+    # Course words sit in the mid-frequency band; filler words take the most common ranks.
+    vocabulary = [f"w{i}" for i in range(50)] + COMMON_WORDS + [f"w{i}" for i in range(50, VOCABULARY_SIZE)]
+    cumulative, total = [], 0.0
+    for rank in range(len(vocabulary)):
+        total += 1 / (rank + 1)
+        cumulative.append(total)
+    notebooks = [NotesModel.add_notebook(f"Course {i}") for i in range(50)]
+    start = time.perf_counter()
+    for n in range(NOTE_COUNT):
+        words = rng.choices(vocabulary, cum_weights=cumulative, k=rng.randint(*WORDS_PER_NOTE))
+        NotesModel.add_note(rng.choice(notebooks), {"title": f"Note {n}", "body": " ".join(words)})
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(42)
+    build_seconds = build_corpus(rng)
+    print(f"indexed {NOTE_COUNT} notes in {build_seconds:.2f}s "
+          f"({build_seconds / NOTE_COUNT * 1e6:.1f} us per add_note)")
+    print(f"{'query':>16} {'hits':>7} {'mean ms':>8} {'p95 ms':>8}")
+    for name, query, mode in QUERIES:
+        hits = len(NotesModel.search_notes(query, mode=mode, limit=None))
+        samples = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            NotesModel.search_notes(query, mode=mode, limit=20)
+            samples.append((time.perf_counter() - start) * 1e3)
+        samples.sort()
+        print(f"{name:>16} {hits:>7} {sum(samples) / len(samples):>8.3f} {samples[int(len(samples) * 0.95)]:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
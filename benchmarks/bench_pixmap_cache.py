@@ -0,0 +1,66 @@
+# benchmarks/bench_pixmap_cache.py
+"""
+Measures the cost of loading the application's icons with and without the pixmap cache.
+
+"uncached" decodes and scales the image on every call, as load_image and FloatingControl
+used to; "cached" goes through load_image. Also times building a FloatingControl, which
+loads its icon on construction, and reports the cache statistics.
+
+Run from the project root:
+    python -m benchmarks.bench_pixmap_cache
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.getcwd())
+
+from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication
+
+ROUNDS = 500
+IMAGE = "resources/images/home-64.png"
+SIZES = [(30, 30), (24, 24), (48, 48)]
+
+
+def time_calls(call):
+    """
+    Returns the median latency of `call()` in microseconds.
+    """
+    latencies = []
+    for i in range(ROUNDS):
+        start = time.perf_counter()
+        call(i)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(latencies)
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    from components.floating_control import FloatingControl
+    from utils.resource_loader import get_pixmap_cache, load_image
+
+    def uncached(i):
+        width, height = SIZES[i % len(SIZES)]
+        QPixmap(IMAGE).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def cached(i):
+        load_image(IMAGE, SIZES[i % len(SIZES)], smooth=True, keep_aspect=True)
+
+    def build_control(i):
+        control = FloatingControl()
+        control.deleteLater()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    print(f"{'load':>16} {'median us':>10}")
+    print(f"{'uncached':>16} {time_calls(uncached):>10.1f}")
+    print(f"{'cached':>16} {time_calls(cached):>10.1f}")
+    print(f"{'FloatingControl':>16} {time_calls(build_control):>10.1f}")
+    print(get_pixmap_cache().stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/bench_records.py
+"""
+Compares the memory and conversion cost of the slotted record types in models.records
+with the plain dictionaries they replaced.
+
+For each record type, builds RECORD_COUNT instances both ways and reports the bytes
+allocated per instance (measured with tracemalloc) and the time to convert them from and
+to their JSON form.
+
+Run from the project root:
+    python -m benchmarks.bench_records
+"""
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from models.records import Event, Note, Notebook, Task
+
+RECORD_COUNT = 100_000
+
+
+def task_json(i):
+    return f"Task {i}"
+
+
+def note_json(i):
+    return {"title": f"Note {i}", "body": f"Body of note {i}"}
+
+
+def notebook_json(i):
+    return {"name": f"Notebook {i}", "notes": {}}
+
+
+def event_json(i):
+    start = datetime(2024, 1, 1) + timedelta(minutes=30 * i)
+    return {"title": f"Event {i}", "start": start.isoformat(), "end": (start + timedelta(hours=1)).isoformat(), "location": ""}
+
+
+def task_dict(value):
+    return {"text": value}
+
+
+def note_dict(i, data):
+    return {"id": i, "notebook_id": 1, "title": data["title"], "body": data["body"]}
+
+
+def notebook_dict(i, data):
+    return {"id": i, "name": data["name"], "notes": {}}
+
+
+def event_dict(i, data):
+    return {
+        "id": i,
+        "title": data["title"],
+        "start": datetime.fromisoformat(data["start"]),
+        "end": datetime.fromisoformat(data["end"]),
+        "location": data["location"],
+    }
+
+
+# name -> (JSON generator, dict builder, record builder, record serializer)
+CASES = {
+    "Task": (task_json, lambda i, data: task_dict(data), lambda i, data: Task.from_json(data), Task.to_json),
+    "Note": (note_json, note_dict, lambda i, data: Note.from_json(i, 1, data), Note.to_json),
+    "Notebook": (notebook_json, notebook_dict, Notebook.from_json, Notebook.to_json),
+    "Event": (event_json, event_dict, Event.from_json, Event.to_json),
+}
+
+
+def measure(build, sources):
+    """
+    Builds one object per source under tracemalloc and returns the bytes allocated per object.
+    The list holding the objects is the same size either way.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(i, data) for i, data in enumerate(sources)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / len(sources)
+
+
+def main():
+    print(f"{RECORD_COUNT:,} instances of each type")
+    print(f"{'type':>9} {'dict B':>8} {'record B':>9} {'saved':>6} {'from JSON ms':>13} {'to JSON ms':>11}")
+    for name, (make_json, build_dict, build_record, to_json) in CASES.items():
+        sources = [make_json(i) for i in range(RECORD_COUNT)]
+        dict_bytes = measure(build_dict, sources)
+        record_bytes = measure(build_record, sources)
+        start = time.perf_counter()
+        records = [build_record(i, data) for i, data in enumerate(sources)]
+        load_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for record in records:
+            to_json(record)
+        dump_seconds = time.perf_counter() - start
+        del records
+        print(
+            f"{name:>9} {dict_bytes:>8.0f} {record_bytes:>9.0f} {1 - record_bytes / dict_bytes:>6.0%}"
+            f" {load_seconds * 1e3:>13.1f} {dump_seconds * 1e3:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_recurrence.py
+"""
+Measures month and agenda queries over repeating events.
+
+Stores SERIES_COUNT repeating events (weekly lectures, daily reminders, monthly
+meetings), most of them without an end, and times month-view and one-week agenda
+queries at increasing distances from the series' first occurrence. With lazy expansion
+the cost should stay flat however far into the series the query lands. For comparison,
+the same series are materialized one occurrence at a time for a 10-year horizon.
+
+Run from the project root:
+    python -m benchmarks.bench_recurrence
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+from models.calendar_model import CalendarModel
+from models.recurrence import RecurrenceRule
+
+SERIES_COUNT = 2_000
+REPEATS = 50
+MATERIALIZED_YEARS = 10
+ORIGIN = datetime(2024, 9, 2)
+
+
+def make_series(rng):
+    """
+    Returns event dictionaries for SERIES_COUNT repeating events.
+    """
+    events = []
+    for i in range(SERIES_COUNT):
+        start = ORIGIN + timedelta(days=rng.randrange(28), hours=rng.randrange(8, 20))
+        kind = rng.random()
+        if kind < 0.6:
+            rule = {"frequency": "weekly", "weekdays": rng.sample(range(5), 2)}
+        elif kind < 0.85:
+            rule = {"frequency": "daily", "interval": rng.choice((1, 2, 3))}
+        else:
+            rule = {"frequency": "monthly"}
+        if rng.random() < 0.2:
+            rule["count"] = rng.randint(10, 40)
+        events.append({"title": f"Series {i}", "start": start, "end": start + timedelta(hours=1), "recurrence": rule})
+    return events
+
+
+def materialize(events):
+    """
+    Expands every series into concrete occurrences up to MATERIALIZED_YEARS ahead by
+    walking the rule, as storing one entry per occurrence would require.
+    """
+    horizon = ORIGIN + timedelta(days=365 * MATERIALIZED_YEARS)
+    occurrences = []
+    for event in events:
+        rule = RecurrenceRule.coerce(event["recurrence"])
+        duration = event["end"] - event["start"]
+        n = 0
+        while rule.count is None or n < rule.count:
+            start = rule.nth_start(event["start"], n)
+            if start >= horizon:
+                break
+            occurrences.append((start, start + duration))
+            n += 1
+    occurrences.sort()
+    return occurrences
+
+
+def time_query(start, end):
+    """
+    Returns (mean milliseconds, occurrence count) for a range query.
+    """
+    began = time.perf_counter()
+    for _ in range(REPEATS):
+        results = CalendarModel.get_events_between(start, end)
+    return (time.perf_counter() - began) / REPEATS * 1e3, len(results)
+
+
+def main():
+    rng = random.Random(11)
+    events = make_series(rng)
+    for event in events:
+        CalendarModel.add_event(event)
+
+    began = time.perf_counter()
+    materialized = materialize(events)
+    materialize_seconds = time.perf_counter() - began
+    print(f"{SERIES_COUNT:,} series stored as {SERIES_COUNT:,} events")
+    print(f"materializing {MATERIALIZED_YEARS} years instead: {len(materialized):,} occurrences in {materialize_seconds:.2f} s")
+    print()
+    print(f"{'years ahead':>11} {'month ms':>9} {'occurrences':>12} {'week ms':>8} {'occurrences':>12}")
+    for years in (0, 1, 5, 20, 50):
+        month_start = ORIGIN.replace(year=ORIGIN.year + years, day=1)
+        month_end = month_start.replace(month=month_start.month % 12 + 1, year=month_start.year + month_start.month // 12)
+        month_ms, month_count = time_query(month_start, month_end)
+        week_ms, week_count = time_query(month_start, month_start + timedelta(days=7))
+        print(f"{years:>11} {month_ms:>9.2f} {month_count:>12,} {week_ms:>8.2f} {week_count:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_startup.py
+"""
+Measures cold start: runs `main.py --profile-startup=json` in fresh processes and reports
+the median duration of each startup phase, the time to first paint, and the modules that
+took longest to import.
+
+Each run starts in a temporary working directory (with the resources folder linked in)
+so the real storage folder is not touched.
+
+Run from the project root:
+    python -m benchmarks.bench_startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+
+RUNS = 7
+TOP_IMPORTS = 10
+
+
+def profile_once(root, workdir):
+    """
+    Starts the application once and returns its startup timeline.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = subprocess.run(
+        [sys.executable, os.path.join(root, "main.py"), "--profile-startup=json"],
+        cwd=workdir, env=env, capture_output=True, text=True, timeout=60,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(f"No startup profile in the output:\n{result.stderr}")
+
+
+def main():
+    root = os.getcwd()
+    workdir = tempfile.mkdtemp()
+    os.symlink(os.path.join(root, "resources"), os.path.join(workdir, "resources"))
+
+    phases = defaultdict(list)
+    first_paint = []
+    imports = defaultdict(list)
+    for _ in range(RUNS):
+        timeline = profile_once(root, workdir)
+        for phase in timeline["phases"]:
+            phases[phase["name"]].append(phase["ms"])
+        first_paint.append(timeline["phases"][-1]["end_ms"])
+        for entry in timeline["imports"]:
+            if entry["depth"] == 0:
+                imports[entry["module"]].append(entry["cumulative_ms"])
+
+    print(f"{'phase':>14} {'median ms':>10}")
+    for name, durations in phases.items():
+        print(f"{name:>14} {statistics.median(durations):>10.1f}")
+    print(f"{'to first paint':>14} {statistics.median(first_paint):>10.1f}")
+    print()
+    print(f"{'top-level import':>32} {'median ms':>10}")
+    slowest = sorted(imports.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for module, durations in slowest[:TOP_IMPORTS]:
+        print(f"{module:>32} {statistics.median(durations):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_storage_backends.py
+"""
+Compares the JSON and SQLite task backends at 10k, 100k and 1M tasks.
+
+For each size it reports the time to open the store and read the first date, the mean
+single-date read and write latency, and the time to read one month of dates.
+
+Run from the project root:
+    python -m benchmarks.bench_storage_backends
+"""
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from core.task_store import TaskStore
+from core.sqlite_task_store import SqliteTaskStore, migrate_json_to_sqlite
+
+TASK_COUNTS = (10_000, 100_000, 1_000_000)
+TASKS_PER_DATE = 10
+READS = 200
+WRITES = 5
+
+
+def write_tasks_file(path, task_count):
+    """
+    Writes a synthetic tasks.json holding `task_count` tasks and returns the date keys.
+    """
+    start = date(1990, 1, 1)
+    keys = [(start + timedelta(days=i)).isoformat() for i in range(task_count // TASKS_PER_DATE)]
+    data = {key: [f"Task {n} for {key}" for n in range(TASKS_PER_DATE)] for key in keys}
+    with open(path, "w") as file:
+        json.dump(data, file, indent=4)
+    return keys
+
+
+def mean_ms(operation, arguments):
+    start = time.perf_counter()
+    for argument in arguments:
+        operation(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e3
+
+
+def measure(store, keys):
+    """
+    Returns (open_ms, read_ms, write_ms, month_ms) for a store.
+    """
+    start = time.perf_counter()
+    store.load(keys[0])
+    open_ms = (time.perf_counter() - start) * 1e3
+
+    step = max(1, len(keys) // READS)
+    read_ms = mean_ms(store.load, keys[::step][:READS])
+    write_keys = keys[::max(1, len(keys) // WRITES)][:WRITES]
+    write_ms = mean_ms(lambda key: store.save(key, ["Rewritten task"] * TASKS_PER_DATE), write_keys)
+    month = keys[len(keys) // 2:len(keys) // 2 + 31]
+    start = time.perf_counter()
+    for key in month:
+        store.load(key)
+    month_ms = (time.perf_counter() - start) * 1e3
+    return open_ms, read_ms, write_ms, month_ms
+
+
+def main():
+    print(f"{'tasks':>9} {'backend':>8} {'open ms':>9} {'read ms':>9} {'write ms':>9} {'month ms':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for task_count in TASK_COUNTS:
+            json_path = os.path.join(tmp, f"tasks_{task_count}.json")
+            keys = write_tasks_file(json_path, task_count)
+
+            sqlite_store = SqliteTaskStore(os.path.join(tmp, f"tasks_{task_count}.db"))
+            migrate_json_to_sqlite(json_path, sqlite_store)
+            sqlite_store.close()
+
+            for name, store in (("json", TaskStore(json_path)), ("sqlite", sqlite_store)):
+                open_ms, read_ms, write_ms, month_ms = measure(store, keys)
+                store.close()
+                print(f"{task_count:>9} {name:>8} {open_ms:>9.2f} {read_ms:>9.3f} {write_ms:>9.2f} {month_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
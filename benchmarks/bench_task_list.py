@@ -0,0 +1,61 @@
+# benchmarks/bench_task_list.py
+"""
+Measures how long the task list takes to show and save a long list of tasks.
+
+Compares the previous QListWidget implementation (one QListWidgetItem per task, with a
+walk over every item on save) with the model-backed TaskList.
+
+Run from the project root:
+    python -m benchmarks.bench_task_list
+"""
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QListWidget, QListWidgetItem
+
+from components.task_list import TaskList
+from models.records import Task
+
+TASK_COUNTS = (100, 1_000, 10_000, 100_000)
+
+
+def widget_set(widget, tasks):
+    widget.clear()
+    for task in tasks:
+        widget.addItem(QListWidgetItem(task.text))
+
+
+def widget_get(widget):
+    items = (widget.item(i) for i in range(widget.count()))
+    return [Task(item.text()) for item in items]
+
+
+def timed_ms(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1e3
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    widget = QListWidget()
+    widget.resize(400, 600)
+    widget.show()
+    task_list = TaskList()
+    task_list.resize(400, 600)
+    task_list.show()
+
+    print(f"{'tasks':>8} {'widget set ms':>14} {'widget get ms':>14} {'model set ms':>13} {'model get ms':>13}")
+    for count in TASK_COUNTS:
+        tasks = [Task(f"Read chapter {i}") for i in range(count)]
+        widget_set_ms = timed_ms(lambda: (widget_set(widget, tasks), app.processEvents()))
+        widget_get_ms = timed_ms(widget_get, widget)
+        model_set_ms = timed_ms(lambda: (task_list.set_tasks(tasks), app.processEvents()))
+        model_get_ms = timed_ms(task_list.get_tasks)
+        print(f"{count:>8} {widget_set_ms:>14.1f} {widget_get_ms:>14.1f} {model_set_ms:>13.1f} {model_get_ms:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
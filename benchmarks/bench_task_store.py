@@ -0,0 +1,77 @@
+# benchmarks/bench_task_store.py
+"""
+Measures per-click task loading latency as tasks.json grows.
+
+Compares reparsing the whole file on every date selection (the previous behaviour of
+utils.file_utils.load_tasks) with the cached TaskStore.
+
+Run from the project root:
+    python -m benchmarks.bench_task_store
+"""
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from core.task_store import TaskStore
+
+DATE_COUNTS = (100, 1_000, 10_000, 50_000)
+TASKS_PER_DATE = 5
+CLICKS = 200
+
+
+def write_tasks_file(path, date_count):
+    """
+    Writes a synthetic tasks.json with `date_count` dates and returns the date keys.
+    """
+    start = date(2000, 1, 1)
+    keys = [(start + timedelta(days=i)).isoformat() for i in range(date_count)]
+    data = {key: [f"Task {n} for {key}" for n in range(TASKS_PER_DATE)] for key in keys}
+    with open(path, "w") as file:
+        json.dump(data, file, indent=4)
+    return keys
+
+
+def reparse_load(path, key):
+    """
+    The uncached read path: parse the full file for a single date.
+    """
+    with open(path, "r") as file:
+        return json.load(file).get(key, [])
+
+
+def time_clicks(load, keys):
+    """
+    Returns the mean latency in microseconds of `CLICKS` date selections.
+    """
+    step = max(1, len(keys) // CLICKS)
+    clicks = [keys[(i * step) % len(keys)] for i in range(CLICKS)]
+    start = time.perf_counter()
+    for key in clicks:
+        load(key)
+    return (time.perf_counter() - start) / len(clicks) * 1e6
+
+
+def main():
+    print(f"{'dates':>8} {'file MB':>8} {'reparse us/click':>17} {'store us/click':>15} {'hits':>6} {'misses':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for date_count in DATE_COUNTS:
+            path = os.path.join(tmp, f"tasks_{date_count}.json")
+            keys = write_tasks_file(path, date_count)
+            size_mb = os.path.getsize(path) / 1e6
+
+            reparse_us = time_clicks(lambda key: reparse_load(path, key), keys)
+
+            store = TaskStore(path)
+            store.load(keys[0])  # Pay the one-time parse outside the timed loop.
+            store.reset_stats()
+            store_us = time_clicks(store.load, keys)
+            stats = store.stats()
+
+            print(f"{date_count:>8} {size_mb:>8.2f} {reparse_us:>17.1f} {store_us:>15.1f} "
+                  f"{stats['hits']:>6} {stats['misses']:>7}")
+
+
+if __name__ == "__main__":
+    main()
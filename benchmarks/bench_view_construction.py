@@ -0,0 +1,87 @@
+# benchmarks/bench_view_construction.py
+"""
+Measures how long the main views take to build and polish.
+
+Each round constructs a DashboardView, a NotesView or a CalendarController inside the
+main window, shows it and lets the event loop process the resulting polish, layout and paint events. Style
+sheets are applied as the application does at startup. Uses a temporary working
+directory so the real storage folder is not touched.
+
+To compare with an older revision, run this file from a checkout of that revision.
+
+Run from the project root:
+    python -m benchmarks.bench_view_construction
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.getcwd())
+
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QApplication
+
+ROUNDS = 100
+
+
+def apply_application_styles(app, root):
+    """
+    Installs the application-level style sheet the same way main.py does. Falls back to
+    the plain resources/styles.css of trees without the style engine, so the benchmark can
+    also be run on older checkouts for comparison.
+    """
+    try:
+        from utils.style_engine import apply_styles
+    except ImportError:
+        from utils.resource_loader import load_stylesheet
+        app.setStyleSheet(load_stylesheet(os.path.join(root, "resources", "styles.css")))
+        return
+    apply_styles(app, root)
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    root = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    apply_application_styles(app, root)
+
+    from controllers.calendar_controller import CalendarController
+    from main import MainWindow
+    from views.dashboard_view import DashboardView
+    from views.notes_view import NotesView
+
+    # Views are built inside the main window, where they inherit its styling.
+    window = MainWindow()
+    window.resize(1200, 700)
+    window.show()
+    app.processEvents()
+    host = window.central_widget
+
+    builders = {
+        "dashboard": lambda: DashboardView(window),
+        "notes": lambda: NotesView(window),
+        "calendar": lambda: CalendarController(host),
+    }
+    print(f"{'view':>10} {'first ms':>9} {'median ms':>10} {'p95 ms':>7}")
+    for name, build in builders.items():
+        latencies = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            view = build()
+            window.layout.addWidget(view)
+            view.show()
+            app.processEvents()
+            latencies.append((time.perf_counter() - start) * 1e3)
+            window.layout.removeWidget(view)
+            view.deleteLater()
+            # Deferred deletes are not run by processEvents() outside exec_().
+            app.sendPostedEvents(None, QEvent.DeferredDelete)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{name:>10} {latencies[0]:>9.2f} {statistics.median(latencies[1:]):>10.2f} {p95:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_view_switch.py
+"""
+Measures the latency of switching the dashboard between the calendar and notes views.
+
+"Cold" switches build a new view every time (the view cache disabled, as before);
+"warm" switches reuse the cached views. Each switch is timed until the event loop has
+processed the resulting layout and paint events. Uses a temporary working directory so
+the real storage folder is not touched.
+
+Run from the project root:
+    python -m benchmarks.bench_view_switch
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.getcwd())
+
+from PyQt5.QtWidgets import QApplication
+
+SWITCHES = 40
+
+
+def time_switches(app, dashboard):
+    """
+    Returns the switch latencies in milliseconds, alternating calendar and notes.
+    """
+    latencies = []
+    for i in range(SWITCHES):
+        start = time.perf_counter()
+        if i % 2:
+            dashboard.show_notes()
+        else:
+            dashboard.show_calendar()
+        app.processEvents()
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return latencies
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    os.chdir(tempfile.mkdtemp())
+    from utils.config_manager import set_config
+    from views.dashboard_view import DashboardView
+
+    print(f"{'mode':>5} {'first ms':>9} {'median ms':>10} {'p95 ms':>7}")
+    for mode, max_views in (("cold", 0), ("warm", 4)):
+        set_config("VIEW_CACHE_MAX_VIEWS", max_views)
+        dashboard = DashboardView(None)
+        dashboard.resize(1200, 700)
+        dashboard.show()
+        app.processEvents()
+        latencies = time_switches(app, dashboard)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{mode:>5} {latencies[0]:>9.2f} {statistics.median(latencies[2:]):>10.2f} {p95:>7.2f}")
+        dashboard.close()
+        dashboard.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
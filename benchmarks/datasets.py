@@ -0,0 +1,92 @@
+# benchmarks/datasets.py
+"""
+Synthetic datasets for the benchmarks: N dates x M tasks and K notebooks x L notes.
+
+Generators are seeded, so the same sizes always produce the same tasks and notes (the
+dates are laid out around a fixed start date unless one is given).
+"""
+import random
+from datetime import date, timedelta
+
+from models.records import Task
+
+# Dates are centred on this day by default; the calendar benchmarks move to it first.
+DEFAULT_CENTER = date(2025, 3, 15)
+
+WORDS = (
+    "lecture exam chapter review revision notes homework photosynthesis mitochondria theorem "
+    "essay lab proof integral derivative vector matrix cell enzyme protein reading summary "
+    "question answer deadline project draft outline source quote figure table"
+).split()
+
+
+def date_keys(count, center=DEFAULT_CENTER):
+    """
+    Returns `count` consecutive date keys (YYYY-MM-DD) centred on `center`.
+    """
+    start = center - timedelta(days=count // 2)
+    return [(start + timedelta(days=i)).isoformat() for i in range(count)]
+
+
+def sentence(rng, words):
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+def task_dataset(dates, tasks_per_date, seed=0, center=DEFAULT_CENTER):
+    """
+    Builds `dates` dates holding `tasks_per_date` tasks each.
+
+    Args:
+        dates (int): The number of dates (N).
+        tasks_per_date (int): The number of tasks per date (M).
+        seed (int): The random seed for the task texts.
+        center (date): The date the range is centred on.
+
+    Returns:
+        dict: Date key -> list of Task records, in date order.
+    """
+    rng = random.Random(seed)
+    return {
+        key: [Task(sentence(rng, rng.randint(2, 6))) for _ in range(tasks_per_date)]
+        for key in date_keys(dates, center)
+    }
+
+
+def note_dataset(notebooks, notes_per_notebook, words_per_note=(40, 120), seed=0):
+    """
+    Yields (notebook name, list of note data) pairs for NotesModel.add_notes.
+
+    Args:
+        notebooks (int): The number of notebooks (K).
+        notes_per_notebook (int): The number of notes in each notebook (L).
+        words_per_note (tuple): The (min, max) number of words in a note body.
+        seed (int): The random seed for the titles and bodies.
+    """
+    rng = random.Random(seed)
+    for n in range(notebooks):
+        yield f"Course {n}", [
+            {"title": f"{sentence(rng, 3).title()} {i}", "body": sentence(rng, rng.randint(*words_per_note))}
+            for i in range(notes_per_notebook)
+        ]
+
+
+def fill_task_store(store, dataset):
+    """
+    Writes a task dataset to a store in one save_many call.
+    """
+    store.save_many(dataset.items())
+
+
+def fill_notes(notes_api, dataset):
+    """
+    Adds a note dataset through core.notes (or any module with add_notebook/add_notes).
+
+    Returns:
+        list: The new notebooks' identifiers.
+    """
+    notebook_ids = []
+    for name, notes in dataset:
+        notebook_id = notes_api.add_notebook(name)
+        notes_api.add_notes(notebook_id, notes)
+        notebook_ids.append(notebook_id)
+    return notebook_ids
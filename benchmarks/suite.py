@@ -0,0 +1,433 @@
+# benchmarks/suite.py
+"""
+Benchmark suite covering task storage, the notes model and view construction and
+navigation, with machine-readable results and regression checks against a baseline.
+
+Every case runs against synthetic data (see benchmarks/datasets.py) in a temporary
+working directory, so the real storage folder is not touched. View cases run on Qt's
+offscreen platform. Results are summarized per case as the first, median, p95, mean and
+minimum latency in milliseconds.
+
+    python -m benchmarks.suite                            # print a table
+    python -m benchmarks.suite --json results.json        # also write the results
+    python -m benchmarks.suite --baseline baseline.json   # flag regressions (exit code 1)
+    python -m benchmarks.suite --size large --filter storage.
+
+A results file doubles as a baseline for later runs. A case regresses when both its median
+and its minimum are more than --threshold (default 25%) above the baseline's, and the
+median by at least MIN_DELTA_MS; requiring both keeps one-off stalls (disk flushes,
+scheduler noise) from being reported.
+
+Run from the project root:
+    python -m benchmarks.suite
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.getcwd())
+
+from benchmarks import datasets
+
+# Dataset sizes: N dates x M tasks per date, K notebooks x L notes per notebook.
+SIZES = {
+    "small": {"dates": 120, "tasks_per_date": 5, "notebooks": 5, "notes_per_notebook": 40},
+    "medium": {"dates": 1000, "tasks_per_date": 10, "notebooks": 20, "notes_per_notebook": 200},
+    "large": {"dates": 10000, "tasks_per_date": 10, "notebooks": 50, "notes_per_notebook": 1000},
+}
+DEFAULT_REPEATS = 50
+DEFAULT_THRESHOLD = 0.25
+# Slowdowns smaller than this are treated as noise, whatever the ratio.
+MIN_DELTA_MS = 0.05
+RESULTS_VERSION = 1
+
+Case = namedtuple("Case", "name setup repeats qt")
+CASES = []
+
+
+def case(name, repeats=DEFAULT_REPEATS, qt=False):
+    """
+    Registers a benchmark case.
+
+    The decorated function is called once as setup(context) and returns the operation to
+    time. The operation is called `repeats` times; if it returns a callable, that is
+    called untimed afterwards to clean up (e.g. to delete a widget).
+
+    Args:
+        name (str): The case name, "<group>.<subject>.<operation>".
+        repeats (int): How many times the operation is timed.
+        qt (bool): Whether the case needs the QApplication and the dataset's views.
+    """
+    def register(setup):
+        CASES.append(Case(name, setup, repeats, qt))
+        return setup
+    return register
+
+
+class Context:
+    """
+    What the cases share: the dataset sizes and keys, a seeded RNG and, for view cases,
+    the QApplication.
+    """
+
+    def __init__(self, sizes, root):
+        self.sizes = sizes
+        self.root = root
+        self.rng = random.Random(0)
+        self.dates = []
+        self.notebook_ids = []
+        self.app = None
+        self.widgets = []  # Top-level widgets a case created; closed when the case ends.
+
+    def close_widgets(self):
+        while self.widgets:
+            widget = self.widgets.pop()
+            widget.close()
+            widget.deleteLater()
+        if self.app is not None:
+            self.process_events()
+
+    def process_events(self):
+        """
+        Runs pending events, including deferred deletes (which processEvents skips outside exec_()).
+        """
+        from PyQt5.QtCore import QEvent
+        self.app.processEvents()
+        self.app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+@case("storage.tasks.open")
+def storage_open(context):
+    from core.tasks import get_default_task_store
+    store = get_default_task_store()
+    store_class, path = type(store), store.path
+    dates = context.dates
+
+    def operation():
+        fresh = store_class(path)
+        fresh.load(dates[len(dates) // 2])
+        return fresh.close
+    return operation
+
+@case("storage.tasks.load_tasks", repeats=500)
+def storage_load(context):
+    from core.tasks import load_tasks
+    dates = context.dates
+    return lambda: load_tasks(context.rng.choice(dates))
+
+@case("storage.tasks.save_tasks", repeats=100)
+def storage_save(context):
+    from core.tasks import load_tasks, save_tasks
+    dates = context.dates
+
+    def operation():
+        date = context.rng.choice(dates)
+        save_tasks(date, load_tasks(date))
+    return operation
+
+@case("storage.tasks.load_month")
+def storage_month(context):
+    from core.tasks import load_tasks_range
+    months = sorted({date[:7] for date in context.dates})
+
+    def operation():
+        month = context.rng.choice(months)
+        return list(load_tasks_range(f"{month}-01", f"{month}-31"))
+    return operation
+
+
+# ---------------------------------------------------------------------------
+# Notes model
+# ---------------------------------------------------------------------------
+
+@case("models.notes.add_note", repeats=200)
+def notes_add(context):
+    from core import notes as notes_api
+    notebook_ids = context.notebook_ids
+    body = datasets.sentence(context.rng, 80)
+    return lambda: notes_api.add_note(context.rng.choice(notebook_ids), {"title": "Benchmark note", "body": body})
+
+@case("models.notes.update_note_body", repeats=200)
+def notes_update(context):
+    from core import notes as notes_api
+    note_ids = [note_id for notebook in notes_api.get_notebooks().values() for note_id in notebook.notes]
+    return lambda: notes_api.update_note_body(context.rng.choice(note_ids), datasets.sentence(context.rng, 80))
+
+@case("models.notes.search_notes", repeats=200)
+def notes_search(context):
+    from models.notes_model import NotesModel
+    queries = ("lecture", "exam chapter", "photosyn", "proof integ")
+    return lambda: NotesModel.search_notes(context.rng.choice(queries), limit=20)
+
+
+# ---------------------------------------------------------------------------
+# Views (offscreen)
+# ---------------------------------------------------------------------------
+
+def shown_dashboard(context):
+    from views.dashboard_view import DashboardView
+    dashboard = DashboardView(None)
+    dashboard.resize(1200, 700)
+    dashboard.show()
+    context.process_events()
+    context.widgets.append(dashboard)
+    return dashboard
+
+@case("views.dashboard.build", repeats=30, qt=True)
+def dashboard_build(context):
+    def operation():
+        shown_dashboard(context)
+        return context.close_widgets
+    return operation
+
+@case("views.dashboard.show_calendar", repeats=30, qt=True)
+def dashboard_show_calendar(context):
+    dashboard = shown_dashboard(context)
+
+    def operation():
+        dashboard.show_calendar()
+        context.process_events()
+        return lambda: (dashboard.show_notes(), context.process_events())
+    return operation
+
+@case("views.dashboard.show_calendar_uncached", repeats=30, qt=True)
+def dashboard_show_calendar_uncached(context):
+    from utils.config_manager import get_config, set_config
+    max_views = get_config("VIEW_CACHE_MAX_VIEWS", 4)
+    set_config("VIEW_CACHE_MAX_VIEWS", 0)
+    try:
+        dashboard = shown_dashboard(context)
+    finally:
+        set_config("VIEW_CACHE_MAX_VIEWS", max_views)
+
+    def operation():
+        dashboard.show_calendar()
+        context.process_events()
+        return lambda: (dashboard.go_back(), context.process_events())
+    return operation
+
+@case("views.dashboard.show_notes", repeats=30, qt=True)
+def dashboard_show_notes(context):
+    dashboard = shown_dashboard(context)
+
+    def operation():
+        dashboard.show_notes()
+        context.process_events()
+        return lambda: (dashboard.show_calendar(), context.process_events())
+    return operation
+
+@case("views.calendar.select_date", repeats=200, qt=True)
+def calendar_select_date(context):
+    from PyQt5.QtCore import QDate
+    dashboard = shown_dashboard(context)
+    dashboard.show_calendar()
+    calendar = dashboard.current_view().view.calendar
+    # Walk forward day by day from the middle of the dataset, crossing month boundaries.
+    start = context.dates[len(context.dates) // 2]
+    day = [QDate.fromString(start, "yyyy-MM-dd")]
+    calendar.setSelectedDate(day[0])
+    context.process_events()
+
+    def operation():
+        day[0] = day[0].addDays(1)
+        calendar.setSelectedDate(day[0])
+        context.process_events()
+    return operation
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def prepare(context):
+    """
+    Writes the task and note datasets to the (temporary) storage folder.
+
+    Returns:
+        float: The time taken, in seconds.
+    """
+    from core import notes as notes_api
+    from core.tasks import get_default_task_store
+
+    sizes = context.sizes
+    start = time.perf_counter()
+    tasks = datasets.task_dataset(sizes["dates"], sizes["tasks_per_date"])
+    datasets.fill_task_store(get_default_task_store(), tasks)
+    context.dates = list(tasks)
+    context.notebook_ids = datasets.fill_notes(
+        notes_api, datasets.note_dataset(sizes["notebooks"], sizes["notes_per_notebook"])
+    )
+    return time.perf_counter() - start
+
+def start_qt(context):
+    """
+    Creates the QApplication and installs the application style sheet, as main.py does.
+    """
+    from PyQt5.QtWidgets import QApplication
+    from utils.style_engine import apply_styles
+    context.app = QApplication.instance() or QApplication([])
+    apply_styles(context.app, context.root)
+
+def summarize(samples):
+    return {
+        "runs": len(samples),
+        "first_ms": samples[0],
+        "median_ms": statistics.median(samples),
+        "p95_ms": statistics.quantiles(samples, n=20)[-1] if len(samples) >= 2 else samples[0],
+        "mean_ms": statistics.fmean(samples),
+        "min_ms": min(samples),
+    }
+
+def run_case(context, bench, repeats):
+    """
+    Times one case.
+
+    Returns:
+        dict: The summary of its latencies (see summarize).
+    """
+    operation = bench.setup(context)
+    samples = []
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            cleanup = operation()
+            samples.append((time.perf_counter() - start) * 1e3)
+            if callable(cleanup):
+                cleanup()
+    finally:
+        context.close_widgets()
+    return summarize(samples)
+
+def run_suite(sizes, name_filter=None, repeats=None, root=None):
+    """
+    Runs the matching cases in a temporary working directory.
+
+    Args:
+        sizes (dict): The dataset sizes (see SIZES).
+        name_filter (str, optional): Only run cases whose name contains this text.
+        repeats (int, optional): Overrides each case's number of repeats.
+        root (str, optional): The project root (for the style sheets); defaults to the working directory.
+
+    Returns:
+        dict: The results document: run metadata plus one summary per case.
+    """
+    from utils.config_manager import get_config
+
+    root = root or os.getcwd()
+    cases = [bench for bench in CASES if not name_filter or name_filter in bench.name]
+    context = Context(sizes, root)
+    previous = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="bench-suite-"))
+    try:
+        setup_seconds = prepare(context)
+        if any(bench.qt for bench in cases):
+            start_qt(context)
+        results = {}
+        for bench in cases:
+            results[bench.name] = run_case(context, bench, repeats or bench.repeats)
+            print(format_row(bench.name, results[bench.name]), file=sys.stderr)
+    finally:
+        os.chdir(previous)
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "storage_mode": get_config("TASK_STORAGE_MODE", "json"),
+        "sizes": sizes,
+        "setup_s": setup_seconds,
+        "results": results,
+    }
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares each case's median and minimum with the baseline's.
+
+    Args:
+        results (dict): A results document from run_suite.
+        baseline (dict): An earlier results document.
+        threshold (float): The relative slowdown that counts as a regression.
+
+    Returns:
+        list: (name, baseline median, median, ratio, regressed) for the cases in both.
+    """
+    rows = []
+    for name, summary in results["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        old, new = before["median_ms"], summary["median_ms"]
+        ratio = new / old if old else float("inf")
+        regressed = (
+            new > old * (1 + threshold) and new - old > MIN_DELTA_MS
+            and summary["min_ms"] > before["min_ms"] * (1 + threshold)
+        )
+        rows.append((name, old, new, ratio, regressed))
+    return rows
+
+def format_row(name, summary):
+    return (f"{name:<42} {summary['first_ms']:>9.2f} {summary['median_ms']:>10.3f} "
+            f"{summary['p95_ms']:>8.3f} {summary['min_ms']:>8.3f}")
+
+def print_comparison(rows, results, baseline):
+    if results["sizes"] != baseline.get("sizes") or results["storage_mode"] != baseline.get("storage_mode"):
+        print("warning: the baseline was recorded with different sizes or storage mode")
+    print(f"{'case':<42} {'base ms':>9} {'now ms':>9} {'ratio':>7}")
+    for name, old, new, ratio, regressed in rows:
+        print(f"{name:<42} {old:>9.3f} {new:>9.3f} {ratio:>6.2f}x{'  REGRESSION' if regressed else ''}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", choices=SIZES, default="small", help="dataset size preset")
+    parser.add_argument("--dates", type=int, help="N: dates with tasks")
+    parser.add_argument("--tasks-per-date", type=int, help="M: tasks per date")
+    parser.add_argument("--notebooks", type=int, help="K: notebooks")
+    parser.add_argument("--notes-per-notebook", type=int, help="L: notes per notebook")
+    parser.add_argument("--storage-mode", choices=("json", "journal", "sqlite"), help="task storage to benchmark")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--repeats", type=int, help="override the number of timed runs per case")
+    parser.add_argument("--json", metavar="PATH", help="write the results to this file")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with an earlier results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="slowdown ratio flagged as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = dict(SIZES[args.size])
+    for key in sizes:
+        if getattr(args, key) is not None:
+            sizes[key] = getattr(args, key)
+    if args.storage_mode:
+        from utils.config_manager import set_config
+        set_config("TASK_STORAGE_MODE", args.storage_mode)
+
+    print(f"sizes: {sizes}", file=sys.stderr)
+    print(f"{'case':<42} {'first ms':>9} {'median ms':>10} {'p95 ms':>8} {'min ms':>8}", file=sys.stderr)
+    results = run_suite(sizes, args.filter, args.repeats)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=4)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        rows = compare(results, baseline, args.threshold)
+        print_comparison(rows, results, baseline)
+        if any(row[-1] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
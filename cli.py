@@ -0,0 +1,228 @@
+# cli.py
+"""
+Command-line tool for working with the app's tasks and notes without the GUI.
+
+Run from the project root (the folder holding the storage folder):
+    python cli.py import syllabus.csv
+    python cli.py import notes.jsonl --kind notes
+    python cli.py export -o backup.jsonl
+    python cli.py query --from 2025-02-01 --to 2025-02-28
+    python cli.py compact
+    python cli.py stats
+    python cli.py migrate --confirm
+
+Does not import Qt. Files are streamed record by record and imports are written in
+batches (see core/transfer.py).
+"""
+import argparse
+import json
+import os
+import sys
+from contextlib import nullcontext
+
+from core import notes as notes_api
+from core import transfer
+from core.tasks import STORAGE_FOLDER, TASKS_DB, TASKS_FILE, get_default_task_store
+from utils.config_manager import get_config
+
+# Date keys bounding every stored task, used when --from/--to are omitted.
+FIRST_DATE = "0001-01-01"
+LAST_DATE = "9999-12-31"
+
+
+def positive_int(value):
+    """
+    argparse type for options that must be a whole number of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive whole number, got {value!r}")
+    return number
+
+
+def open_input(path):
+    if path == "-":
+        return nullcontext(sys.stdin)
+    return open(path, "r", encoding="utf-8", newline="")
+
+def open_output(path):
+    if path in (None, "-"):
+        return nullcontext(sys.stdout)
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def run_import(args):
+    """
+    Imports tasks or notes from a file.
+    """
+    fmt = args.format or transfer.guess_format(args.file)
+    with open_input(args.file) as file:
+        if args.kind == "notes":
+            totals = transfer.import_notes(transfer.read_note_records(file, fmt), batch_size=args.batch_size)
+        else:
+            store = get_default_task_store(args.storage_mode)
+            if getattr(store, "rewrites_file", False):
+                print("note: the json storage mode rewrites tasks.json on every save, so the import is "
+                      "collected in memory and written at once; --batch-size applies to the journal and "
+                      "sqlite modes", file=sys.stderr)
+            try:
+                totals = transfer.import_tasks(
+                    store, transfer.read_task_records(file, fmt), replace=args.replace, batch_size=args.batch_size,
+                )
+            finally:
+                store.close()
+    print(", ".join(f"{count} {name}" for name, count in totals.items()) + " imported", file=sys.stderr)
+
+def run_export(args):
+    """
+    Writes every task (optionally within a date range) or every note to a file.
+    """
+    fmt = args.format or (transfer.guess_format(args.output) if args.output else "jsonl")
+    with open_output(args.output) as file:
+        if args.kind == "notes":
+            count = transfer.write_note_records(file, transfer.iter_notes(), fmt)
+        else:
+            store = get_default_task_store(args.storage_mode)
+            count = transfer.write_task_records(file, store.iter_range(args.start, args.end), fmt)
+    print(f"{count} {args.kind} exported", file=sys.stderr)
+
+def run_query(args):
+    """
+    Prints the tasks between two dates.
+    """
+    items = get_default_task_store(args.storage_mode).iter_range(args.start, args.end)
+    if args.format == "text":
+        for date, tasks in items:
+            for task in tasks:
+                print(f"{date} {task.text}")
+    else:
+        transfer.write_task_records(sys.stdout, items, args.format)
+
+def run_compact(args):
+    """
+    Compacts the task storage: folds the journal, drops empty dates, vacuums the database.
+    """
+    store = get_default_task_store(args.storage_mode)
+    before = folder_bytes(STORAGE_FOLDER)
+    dropped = store.compact()
+    store.close()
+    after = folder_bytes(STORAGE_FOLDER)
+    print(f"{dropped} empty dates dropped, storage {before} -> {after} bytes", file=sys.stderr)
+
+def run_stats(args):
+    """
+    Prints task and note counts, storage size and the store's own counters as JSON.
+    """
+    store = get_default_task_store(args.storage_mode)
+    dates = tasks = 0
+    for _, day_tasks in store.iter_range(FIRST_DATE, LAST_DATE):
+        dates += 1
+        tasks += len(day_tasks)
+    notebooks = notes_api.get_notebooks()
+    stats = {
+        "storage_mode": args.storage_mode or get_config("TASK_STORAGE_MODE", "json"),
+        "dates": dates,
+        "tasks": tasks,
+        "notebooks": len(notebooks),
+        "notes": sum(len(notebook.notes) for notebook in notebooks.values()),
+        "storage_bytes": folder_bytes(STORAGE_FOLDER),
+        "store": store.stats(),
+    }
+    print(json.dumps(stats, indent=4))
+
+def run_migrate(args):
+    """
+    Copies tasks.json (and its journal) into the SQLite database. The JSON files are kept
+    until --confirm, which checks the database holds every task and then renames them.
+    """
+    from core.sqlite_task_store import archive_migrated_json, migrate_json_to_sqlite
+    from core.task_store import get_task_store
+
+    store = get_task_store(TASKS_DB, mode="sqlite")
+    try:
+        dates = migrate_json_to_sqlite(TASKS_FILE, store)
+        print(f"{dates} dates migrated to {TASKS_DB}", file=sys.stderr)
+        if args.confirm:
+            renamed = archive_migrated_json(TASKS_FILE, store)
+            print(f"{len(renamed)} JSON files renamed to *.migrated; set TASK_STORAGE_MODE = \"sqlite\"",
+                  file=sys.stderr)
+    finally:
+        store.close()
+
+def folder_bytes(folder):
+    """
+    Returns the total size of the files under `folder`.
+    """
+    total = 0
+    for directory, _, files in os.walk(folder):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                pass  # Removed while walking, e.g. a finished compaction's log.
+    return total
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="Bulk operations on the app's tasks and notes.")
+    parser.add_argument(
+        "--storage-mode", choices=("json", "journal", "sqlite"),
+        help="task storage to use (default: TASK_STORAGE_MODE from config.py)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import", help="import tasks or notes from a file ('-' for stdin)")
+    importer.add_argument("file")
+    importer.add_argument("--kind", choices=("tasks", "notes"), default="tasks")
+    importer.add_argument("--format", choices=transfer.TASK_FORMATS, help="default: from the file extension, else jsonl")
+    importer.add_argument("--replace", action="store_true", help="replace the tasks of imported dates instead of appending")
+    importer.add_argument("--batch-size", type=positive_int, default=transfer.DEFAULT_BATCH_SIZE, help="records per write")
+    importer.set_defaults(run=run_import)
+
+    exporter = commands.add_parser("export", help="export tasks or notes")
+    exporter.add_argument("-o", "--output", help="output file (default: stdout)")
+    exporter.add_argument("--kind", choices=("tasks", "notes"), default="tasks")
+    exporter.add_argument("--format", choices=transfer.TASK_FORMATS, help="default: from the file extension, else jsonl")
+    exporter.add_argument("--from", dest="start", default=FIRST_DATE)
+    exporter.add_argument("--to", dest="end", default=LAST_DATE)
+    exporter.set_defaults(run=run_export)
+
+    query = commands.add_parser("query", help="print the tasks between two dates")
+    query.add_argument("--from", dest="start", default=FIRST_DATE)
+    query.add_argument("--to", dest="end", default=LAST_DATE)
+    query.add_argument("--format", choices=("text",) + transfer.TASK_FORMATS, default="text")
+    query.set_defaults(run=run_query)
+
+    compact = commands.add_parser("compact", help="compact the task storage")
+    compact.set_defaults(run=run_compact)
+
+    stats = commands.add_parser("stats", help="print storage statistics")
+    stats.set_defaults(run=run_stats)
+
+    migrate = commands.add_parser("migrate", help="copy tasks.json into the SQLite database, keeping the JSON files")
+    migrate.add_argument("--confirm", action="store_true",
+                         help="after checking the database holds every task, rename the JSON files to *.migrated")
+    migrate.set_defaults(run=run_migrate)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        for option, flag in (("start", "--from"), ("end", "--to")):
+            if hasattr(args, option):
+                transfer.check_date(getattr(args, option), flag)
+        args.run(args)
+    except BrokenPipeError:
+        pass  # The output was piped into a command that stopped reading, e.g. head.
+    except (transfer.TransferError, ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,23 +9,8 @@ class CustomTitleBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(30)  # Set the height of the title bar
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2E3440;
-                color: #D8DEE9;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-            }
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                color: #D8DEE9;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background-color: #4C566A;
-            }
-        """)
+        # Styled by the "TitleBar" rules of the application style sheet (utils/style_engine.py).
+        self.setObjectName("TitleBar")
 
         # Layout for the title bar
         layout = QHBoxLayout(self)
@@ -1,6 +1,38 @@
+import logging
+import time
+from functools import lru_cache
+
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor
-from PyQt5.QtCore import Qt, QPropertyAnimation, QSize
+from PyQt5.QtGui import QPainter, QPainterPath, QPen, QColor
+from PyQt5.QtCore import Qt, QPropertyAnimation, QSize, QRectF
+from utils.config_manager import get_config
+from utils.frame_timer import FrameTimer
+from utils.resource_loader import load_image
+
+logger = logging.getLogger(__name__)
+
+# Height above which the calendar, notes and home buttons are shown while animating.
+REVEAL_HEIGHT = 90
+
+# Outline color, matching the buttons (#c9c3be), and its width.
+OUTLINE_COLOR = QColor(201, 195, 190)
+OUTLINE_WIDTH = 2
+
+
+@lru_cache(maxsize=128)
+def pill_path(width, height):
+    """
+    Returns the outline of a widget of the given size: straight sides with circular top
+    and bottom (a circle when the widget is square), inset so the pen stays inside.
+
+    Paths are cached by size, so each animation frame size is only built once.
+    """
+    path = QPainterPath()
+    rect = QRectF(2, 2, width - 4, height - 4)
+    radius = min(rect.width(), rect.height()) / 2
+    path.addRoundedRect(rect, radius, radius)
+    return path
+
 
 class FloatingControl(QWidget):
     """
@@ -13,9 +45,19 @@ class FloatingControl(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.expanded = False
+        self.buttons_visible = False
+        # Per-frame timing of expand/collapse, enabled by FLOATING_CONTROL_FRAME_STATS.
+        self.frame_timer = None
+        self.last_frame_report = None
         self.init_ui()
+        self.set_frame_profiling(get_config("FLOATING_CONTROL_FRAME_STATS", False))
 
     def init_ui(self):
+        # The buttons and toggle label are styled by the "FloatingControl" rules of the
+        # application style sheet (utils/style_engine.py); the toggle label is transparent
+        # there to avoid the blue box.
+        self.setObjectName("FloatingControl")
+
         # Set up a vertical layout with no margins or spacing.
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -28,31 +70,16 @@ class FloatingControl(QWidget):
         self.btn_home = QPushButton("🏠", self)      # Home button with emoji
         for btn in (self.btn_calendar, self.btn_notes, self.btn_home):
             btn.setFixedSize(button_size, button_size)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #c9c3be;
-                    color: white;
-                    border: none;
-                    border-radius: 15px;
-                    font-size: 16px;
-                }
-                QPushButton:hover {
-                    background-color: #a6a19d;
-                }
-            """)
             btn.hide()
 
         # Create the main toggle label (the image as the label).
         self.label_toggle = QLabel(self)
         self.label_toggle.setFixedSize(50, 50)  # Set the size of the label to match the image
 
-        # Load the image and scale it down to 30x30
-        pixmap = QPixmap("resources/images/home-64.png")  # Load the image
-        self.label_toggle.setPixmap(pixmap.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        # Load the image scaled down to 30x30 (decoded and scaled once, then cached).
+        self.label_toggle.setPixmap(load_image("resources/images/home-64.png", (30, 30), smooth=True, keep_aspect=True))
         self.label_toggle.setAlignment(Qt.AlignCenter)
 
-        # Set the background of the label to transparent to avoid the blue box.
-        self.label_toggle.setStyleSheet("background: transparent;")
         self.label_toggle.setAlignment(Qt.AlignCenter)
 
         # Connect the toggle label to expand/collapse.
@@ -76,27 +103,35 @@ class FloatingControl(QWidget):
         self.animation = QPropertyAnimation(self, b"size")
         self.animation.setDuration(300)  # Animation duration in milliseconds.
         self.animation.valueChanged.connect(self.update_position_and_style)  # Update position and style during animation.
+        self.animation.finished.connect(self.on_animation_finished)
 
     def paintEvent(self, event):
         """
-        Override the paint event to draw a circle around the image.
+        Draws the outline: a circle around the image when collapsed, stretching into a
+        pill around the buttons as the widget grows.
         """
-        super().paintEvent(event)
+        start = time.perf_counter() if self.frame_timer is not None else None
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Change the pen color to match the button color
-        pen = QPen(QColor(201, 195, 190))  # Set color to #c9c3be (button color)
-        pen.setWidth(2)  # Set the thickness of the border
+        pen = QPen(OUTLINE_COLOR)
+        pen.setWidth(OUTLINE_WIDTH)
         painter.setPen(pen)
+        painter.drawPath(pill_path(self.width(), self.height()))
+        painter.end()
+        if start is not None:
+            self.frame_timer.add_cost((time.perf_counter() - start) * 1e3)
 
-        # Calculate the position of the label_toggle within the FloatingControl widget
-        label_pos = self.label_toggle.pos()
-        label_size = self.label_toggle.size()
+    def set_frame_profiling(self, enabled):
+        """
+        Turns per-frame timing of the expand/collapse animation on or off. When on, a
+        summary (see FrameTimer.report) is logged and kept in `last_frame_report` after
+        each animation.
 
-        # Draw a circle around the label_toggle
-        painter.drawEllipse(label_pos.x() + 2, label_pos.y() + 2, label_size.width() - 4, label_size.height() - 4)
-        painter.end()
+        The summary is logged at INFO, below the file log's ERROR level (core/log.py), so
+        this module's logger is lowered to INFO while profiling is on.
+        """
+        self.frame_timer = FrameTimer() if enabled else None
+        logger.setLevel(logging.INFO if enabled else logging.NOTSET)
 
     def toggle_expand(self, event):
         if self.expanded:
@@ -113,51 +148,55 @@ class FloatingControl(QWidget):
             self.btn_home.height() +
             15  # Additional spacing for the new button
         )
-        self.animation.setStartValue(self.size())
-        self.animation.setEndValue(QSize(50, expanded_height))
-        self.animation.start()
+        self.start_animation(QSize(50, expanded_height))
         self.expanded = True
 
     def collapse(self):
+        self.start_animation(QSize(50, 50))
+        self.expanded = False
+
+    def start_animation(self, end_size):
+        if self.frame_timer is not None:
+            self.frame_timer.reset()
         self.animation.setStartValue(self.size())
-        self.animation.setEndValue(QSize(50, 50))
+        self.animation.setEndValue(end_size)
         self.animation.start()
-        self.expanded = False
+
+    def on_animation_finished(self):
+        if self.frame_timer is not None:
+            self.last_frame_report = self.frame_timer.report()
+            logger.info("FloatingControl %s: %s", "expand" if self.expanded else "collapse", self.last_frame_report)
 
     def update_position_and_style(self):
         """
-        Dynamically updates the widget's position and style during the animation.
+        Keeps the widget anchored to the bottom while it animates and shows the buttons
+        once it is tall enough. The outline is repainted from a cached path (see paintEvent),
+        and the buttons are only shown or hidden when REVEAL_HEIGHT is crossed.
         """
+        if self.frame_timer is not None:
+            self.frame_timer.begin_frame()
+
         # Update the widget's position to move upwards as it expands.
         if self.parent():
-            parent_height = self.parent().height()      
+            parent_height = self.parent().height()
             margin = 25  # Distance from the bottom.
             y = parent_height - self.height() - margin  # Adjust y position to move upwards.
             self.move(self.x(), y)
 
-        # Update the widget's style to maintain a circular top and bottom.
-        height = self.height()
-        radius = height / 2  # Radius for circular top and bottom.
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: #3498DB;
-                border: none;
-                border-radius: {radius}px;
-            }}
-        """)
-
-        # Show or hide buttons based on the animation progress.
-        if height > 90:  # Threshold to reveal buttons (increased for the new button).
-            self.btn_calendar.show()
-            self.btn_notes.show()
-            self.btn_home.show()
-        else:
-            self.btn_calendar.hide()
-            self.btn_notes.hide()
-            self.btn_home.hide()
+        self.set_buttons_visible(self.height() > REVEAL_HEIGHT)
+
+        if self.frame_timer is not None:
+            self.frame_timer.end_frame()
 
-        # Ensure the label_toggle is always visible and centered.
-        self.label_toggle.show()
+    def set_buttons_visible(self, visible):
+        """
+        Shows or hides the calendar, notes and home buttons if that is a change.
+        """
+        if visible == self.buttons_visible:
+            return
+        self.buttons_visible = visible
+        for btn in (self.btn_calendar, self.btn_notes, self.btn_home):
+            btn.setVisible(visible)
 
     def show_calendar(self):
         """
@@ -1,7 +1,34 @@
 # components/note_editor.py
+import weakref
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton
+from PyQt5.QtGui import QTextDocument, QTextCursor
+from PyQt5.QtCore import QUrl, QTimer
 from utils.file_utils import import_image
+from utils.image_ingest import get_image_ingest
+from utils.config_manager import get_config
+from utils.persistence_queue import add_flush_hook
+from utils.error_utils import show_error_dialog
+from core.log import log_error
 from components.shortcut_manager import register_shortcut
+from core.notes import flush_notes, get_note_body, update_note_body
+
+# Every live editor, so unsaved text can be written when the application closes.
+_editors = weakref.WeakSet()
+
+def save_open_notes():
+    """
+    Saves the note open in every editor, if it was modified.
+    """
+    for editor in list(_editors):
+        try:
+            editor.save_note()
+        except RuntimeError:
+            pass  # The editor's widgets were already deleted.
+
+# MainWindow.closeEvent flushes the persistence queues, which runs these first: the open
+# notes are saved, then the notebook and note metadata queued by the model are written.
+add_flush_hook(save_open_notes)
+add_flush_hook(flush_notes)
 
 class NoteEditor(QWidget):
     def __init__(self, parent=None):
@@ -14,7 +41,9 @@ class NoteEditor(QWidget):
         super().__init__(parent)
         self.bold_active = False  # Tracks whether bold formatting is active.
         self.italic_active = False  # Tracks whether italic formatting is active.
+        self.note_id = None  # The note currently open in the editor, if any.
         self.init_ui()
+        _editors.add(self)
 
     def init_ui(self):
         """
@@ -25,6 +54,14 @@ class NoteEditor(QWidget):
         self.text_edit = QTextEdit(self)
         layout.addWidget(self.text_edit)
 
+        # Edits are saved once typing pauses, as well as on Ctrl+S, when another note is
+        # opened, when the editor is hidden and when the application closes.
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(get_config("NOTE_AUTOSAVE_DELAY_MS", 1000))
+        self.autosave_timer.timeout.connect(self.save_note)
+        self.text_edit.textChanged.connect(self.autosave_timer.start)
+
         # Button to trigger image import.
         image_button = QPushButton("Insert Image", self)
         image_button.clicked.connect(self.insert_image)
@@ -35,6 +72,48 @@ class NoteEditor(QWidget):
         # Register keyboard shortcuts for toggling formatting.
         register_shortcut(self.text_edit, "Ctrl+B", self.toggle_bold)
         register_shortcut(self.text_edit, "Ctrl+I", self.toggle_italic)
+        register_shortcut(self.text_edit, "Ctrl+S", self.save_note)
+
+        # Display copies of inserted images replace their placeholders when they are ready.
+        image_ingest = get_image_ingest()
+        image_ingest.imageReady.connect(self.on_image_ready)
+        image_ingest.imageFailed.connect(self.on_image_failed)
+
+    def open_note(self, note_id):
+        """
+        Saves the note being edited and loads another one.
+        The body is fetched through the notes controller, which reads it from disk on
+        first open and serves it from the body cache afterwards.
+
+        Args:
+            note_id (int): The note to open.
+        """
+        self.save_note()
+        self.note_id = note_id
+        self.text_edit.setHtml(get_note_body(note_id))
+        self.text_edit.document().setModified(False)
+
+    def save_note(self):
+        """
+        Writes the open note back if it was modified. Its first line becomes the title.
+
+        Returns:
+            bool: True if the note was saved.
+        """
+        self.autosave_timer.stop()
+        if self.note_id is None or not self.text_edit.document().isModified():
+            return False
+        first_line = self.text_edit.toPlainText().strip().split("\n", 1)[0][:60]
+        update_note_body(self.note_id, self.text_edit.toHtml(), title=first_line or "Untitled note")
+        self.text_edit.document().setModified(False)
+        return True
+
+    def hideEvent(self, event):
+        """
+        Saves the open note when the editor is hidden (e.g. on switching sections).
+        """
+        self.save_note()
+        super().hideEvent(event)
 
     def toggle_bold(self):
         """
@@ -58,9 +137,67 @@ class NoteEditor(QWidget):
     def insert_image(self):
         """
         Opens a file dialog for image selection and inserts the image into the text editor.
+
+        The note refers to a display-resolution copy in the storage folder rather than the
+        original file. Until the copy is made (in the background, see utils/image_ingest.py)
+        a flat placeholder of the same size is shown, so the text does not reflow when the
+        image arrives.
         """
         image_path = import_image()
-        if image_path:
-            # Insert the image into the QTextEdit using HTML.
-            html_img = f'<img src="{image_path}" alt="Image">'
-            self.text_edit.insertHtml(html_img)
+        if not image_path:
+            return
+        image = get_image_ingest().ingest(image_path)
+        if image is None:
+            # Not an image Qt can read ahead of time; insert it as it is.
+            self.text_edit.insertHtml(f'<img src="{image_path}" alt="Image">')
+            return
+        if image.pending:
+            self.text_edit.document().addResource(QTextDocument.ImageResource, QUrl(image.path), image.placeholder())
+        # Insert the image into the QTextEdit using HTML.
+        html_img = f'<img src="{image.path}" width="{image.width}" height="{image.height}" alt="Image">'
+        self.text_edit.insertHtml(html_img)
+
+    def on_image_ready(self, path, image):
+        """
+        Swaps the placeholder of a newly stored image for the image itself.
+        """
+        self.text_edit.document().addResource(QTextDocument.ImageResource, QUrl(path), image)
+        self.text_edit.viewport().update()
+
+    def on_image_failed(self, path, source):
+        """
+        Points images whose display copy could not be made back at the original file, so
+        the note is not saved with a link to a copy that does not exist, and tells the user.
+        """
+        if not self.replace_image_source(path, source):
+            return  # The image was inserted in another editor.
+        log_error(f"Failed to store a copy of {source} as {path}")
+        show_error_dialog(f"A copy of the image {source} could not be saved.\n\n"
+                          "The note links to the original file instead.")
+
+    def replace_image_source(self, old, new):
+        """
+        Changes the source of every image in the document that refers to `old`.
+
+        Returns:
+            int: The number of images changed.
+        """
+        document = self.text_edit.document()
+        ranges = []
+        block = document.begin()
+        while block.isValid():
+            fragments = block.begin()
+            while not fragments.atEnd():
+                fragment = fragments.fragment()
+                char_format = fragment.charFormat()
+                if char_format.isImageFormat() and char_format.toImageFormat().name() == old:
+                    ranges.append((fragment.position(), fragment.length(), char_format.toImageFormat()))
+                fragments += 1
+            block = block.next()
+        cursor = QTextCursor(document)
+        for position, length, image_format in ranges:
+            image_format.setName(new)
+            cursor.setPosition(position)
+            cursor.setPosition(position + length, QTextCursor.KeepAnchor)
+            cursor.setCharFormat(image_format)
+        return len(ranges)
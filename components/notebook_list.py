@@ -0,0 +1,92 @@
+from bisect import bisect_left
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class NotebookListModel(QAbstractListModel):
+    """
+    Qt list model of notebooks, ordered by notebook ID.
+
+    The model is kept in sync by applying batches of Change records: inserted, removed
+    and renamed notebooks touch only their own rows, so adding a notebook costs the same
+    however many notebooks already exist.
+    """
+
+    def __init__(self, source, parent=None):
+        """
+        Initializes the model.
+
+        Args:
+            source (callable): Returns the current {notebook ID: Notebook} dictionary.
+            parent (QObject, optional): The parent object.
+        """
+        super().__init__(parent)
+        self._source = source
+        self._ids = []
+        self._names = {}
+        self.reload()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        notebook_id = self._ids[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{notebook_id}: {self._names[notebook_id]}"
+        if role == Qt.UserRole:
+            return notebook_id
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemNeverHasChildren
+
+    def reload(self):
+        """
+        Rebuilds every row from the source.
+        """
+        self.beginResetModel()
+        notebooks = self._source()
+        self._ids = sorted(notebooks)
+        self._names = {notebook_id: notebook.name for notebook_id, notebook in notebooks.items()}
+        self.endResetModel()
+
+    def row_of(self, notebook_id):
+        """
+        Returns the row showing a notebook, or -1 if it is not listed.
+        """
+        row = bisect_left(self._ids, notebook_id)
+        return row if row < len(self._ids) and self._ids[row] == notebook_id else -1
+
+    def apply_changes(self, changes):
+        """
+        Applies a batch of Change records, touching only the affected rows.
+        """
+        notebooks = None
+        for change in changes:
+            if change.action == "reset":
+                self.reload()
+                continue
+            if change.kind != "notebook":
+                continue
+            if notebooks is None:
+                notebooks = self._source()
+            row = self.row_of(change.id)
+            if change.action == "inserted" and row < 0 and change.id in notebooks:
+                row = bisect_left(self._ids, change.id)
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._ids.insert(row, change.id)
+                self._names[change.id] = notebooks[change.id].name
+                self.endInsertRows()
+            elif change.action == "removed" and row >= 0:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._ids[row]
+                del self._names[change.id]
+                self.endRemoveRows()
+            elif change.action == "renamed" and row >= 0 and change.id in notebooks:
+                self._names[change.id] = notebooks[change.id].name
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
@@ -1,5 +1,75 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListWidget, QLineEdit, QPushButton, QListWidgetItem
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListView, QLineEdit, QPushButton
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from models.records import Task
+
+# Number of rows the view is given at a time; more are fetched as it scrolls.
+FETCH_BATCH_SIZE = 200
+
+
+class TaskListModel(QAbstractListModel):
+    """
+    Qt list model over a plain list of Task records.
+
+    Rows are handed to the view in batches through canFetchMore/fetchMore, so opening a
+    date with thousands of tasks only lays out the first screenful.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = []
+        self._fetched = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._tasks)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, len(self._tasks) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole):
+            return task.text
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemNeverHasChildren
+
+    def set_tasks(self, tasks):
+        """
+        Replaces every task. Only the first batch of rows is exposed to the view.
+        """
+        self.beginResetModel()
+        self._tasks = list(tasks)
+        self._fetched = min(FETCH_BATCH_SIZE, len(self._tasks))
+        self.endResetModel()
+
+    def append_task(self, task):
+        """
+        Appends a task, exposing every remaining row so the new one is visible.
+        """
+        self._tasks.append(task)
+        self.beginInsertRows(QModelIndex(), self._fetched, len(self._tasks) - 1)
+        self._fetched = len(self._tasks)
+        self.endInsertRows()
+
+    def tasks(self):
+        """
+        Returns the underlying list of Task records. Callers must not modify it.
+        """
+        return self._tasks
 
 
 class TaskList(QWidget):
@@ -22,7 +92,10 @@ class TaskList(QWidget):
         """
         layout = QVBoxLayout(self)
 
-        self.task_list = QListWidget(self)
+        self.model = TaskListModel(self)
+        self.task_list = QListView(self)
+        self.task_list.setUniformItemSizes(True)
+        self.task_list.setModel(self.model)
         layout.addWidget(self.task_list)
 
         self.task_input = QLineEdit(self)
@@ -41,22 +114,35 @@ class TaskList(QWidget):
         """
         task_text = self.task_input.text().strip()
         if task_text:
-            item = QListWidgetItem(task_text)
-            self.task_list.addItem(item)
+            self.model.append_task(Task(task_text))
+            self.task_list.scrollToBottom()
             self.task_input.clear()
             self.taskAdded.emit()
 
     def set_tasks(self, tasks):
         """
-        Sets the tasks for the selected date.
+        Sets the tasks (Task records) for the selected date.
         """
-        self.task_list.clear()
-        for task in tasks:
-            item = QListWidgetItem(task)
-            self.task_list.addItem(item)
+        self.model.set_tasks(tasks)
 
     def get_tasks(self):
         """
-        Returns a list of tasks currently displayed.
+        Returns the tasks currently displayed as Task records.
+        This is the model's own list, not a copy; copy it before keeping it.
+        """
+        return self.model.tasks()
+
+    def first_visible_row(self):
+        """
+        Returns the row shown at the top of the list, or 0 if the list is empty.
+        """
+        return max(0, self.task_list.indexAt(self.task_list.viewport().rect().topLeft()).row())
+
+    def scroll_to_row(self, row):
+        """
+        Scrolls so `row` is at the top, fetching rows up to it first if needed.
         """
-        return [self.task_list.item(i).text() for i in range(self.task_list.count())]
+        while self.model.rowCount() <= row and self.model.canFetchMore():
+            self.model.fetchMore()
+        if row < self.model.rowCount():
+            self.task_list.scrollTo(self.model.index(row), QListView.PositionAtTop)
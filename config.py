@@ -10,3 +10,52 @@ WINDOW_HEIGHT = 700
 # Example shortcut definitions (used elsewhere if needed).
 SHORTCUT_BOLD = "Ctrl+B"
 SHORTCUT_ITALIC = "Ctrl+I"
+
+# How tasks are persisted: "json" rewrites storage/tasks.json on every save,
+# "journal" appends each save to a log that is periodically compacted and
+# "sqlite" keeps them in storage/tasks.db (importing tasks.json on first use; the JSON
+# files are kept until `python cli.py migrate --confirm`).
+TASK_STORAGE_MODE = "json"
+
+# Delay (in milliseconds) used to coalesce repeated task saves before they are written.
+TASK_SAVE_DELAY_MS = 300
+
+# Folder holding notebook metadata and note bodies, and the memory budget (in bytes)
+# for recently opened note bodies.
+NOTES_FOLDER = "storage/notes"
+NOTE_BODY_CACHE_BYTES = 8 * 1024 * 1024
+
+# Delay (in milliseconds) used to coalesce notebook and note metadata changes before
+# they are appended to storage/notes/index.log.
+NOTE_INDEX_SAVE_DELAY_MS = 300
+
+# How long (in milliseconds) typing has to pause before the open note is saved.
+NOTE_AUTOSAVE_DELAY_MS = 1000
+
+# How many dashboard views (calendar, notes, ...) are kept alive after being switched away
+# from, their estimated memory budget in bytes, and which to drop first ("lru" or "largest").
+VIEW_CACHE_MAX_VIEWS = 4
+VIEW_CACHE_MAX_BYTES = 32 * 1024 * 1024
+VIEW_CACHE_POLICY = "lru"
+
+# Navigation history: the maximum number of views "Back" can return to, and how many of the
+# most recent ones stay alive in memory (older ones are kept as small state snapshots and
+# rebuilt when revisited).
+NAVIGATION_DEPTH = 20
+NAVIGATION_LIVE_ENTRIES = 2
+
+# Log per-frame timings of the floating control's expand/collapse animation.
+FLOATING_CONTROL_FRAME_STATS = False
+
+# Memory budget (in bytes) for decoded and scaled images, and the images decoded in the
+# background at startup: (path, (width, height) or None, smooth scaling, keep aspect ratio).
+PIXMAP_CACHE_BYTES = 16 * 1024 * 1024
+PRELOAD_IMAGES = [
+    ("resources/images/home-64.png", (30, 30), True, True),
+]
+
+# Images inserted into notes are stored in this folder at most this many pixels wide,
+# downscaled by this many background threads.
+NOTE_IMAGES_FOLDER = "storage/images"
+NOTE_IMAGE_MAX_WIDTH = 1024
+NOTE_IMAGE_WORKERS = 2
@@ -1,21 +1,102 @@
+from functools import partial
+
 from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import QDate, Qt
 from views.calendar_view import CalendarView
-from utils.date_utils import format_date
-from utils.file_utils import load_tasks, save_tasks
+from utils.date_utils import format_date, month_range
+from core.tasks import get_default_task_store
+from utils.persistence_queue import get_persistence_queue
+from utils.search_runner import SearchRunner
+from core.log import log_error
+from utils.error_utils import show_error_dialog
+from utils.config_manager import get_config
+
+
+def prefetch_tasks(store, request, cancelled):
+    """
+    Reads the tasks of a range of dates and the task counts of the visible day grid.
+    Runs on the prefetch worker; stops as soon as a newer page has been requested.
+
+    Args:
+        store: The task store to read.
+        request (tuple): ((year, month), start, end, grid start, grid end).
+        cancelled (callable): Returns True once the request has been superseded.
+
+    Yields:
+        list: A single [(year, month), (start, end, {date: tasks}, {date: count})] result.
+    """
+    page, start, end, grid_start, grid_end = request
+    if cancelled():
+        return
+    tasks_by_date = {}
+    for date, tasks in store.iter_range(start, end):
+        if cancelled():
+            return
+        tasks_by_date[date] = tasks
+    if cancelled():
+        return
+    counts = store.task_counts(grid_start, grid_end)
+    yield [page, (start, end, tasks_by_date, counts)]
 
 
 class CalendarController(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store=None):
         """
         Initializes the CalendarController and manages the calendar view and tasks.
+
+        Args:
+            parent (QWidget, optional): The parent widget.
+            store (optional): The task store to read and write (defaults to the configured store).
         """
         super().__init__(parent)
+        self.store = store or get_default_task_store()
+        # Saves are written on a worker thread; see utils/persistence_queue.py.
+        self.persistence = get_persistence_queue(self.store, get_config("TASK_SAVE_DELAY_MS", 300))
+        self.persistence.failed.connect(self.on_save_failed)
+        self.persistence.saved.connect(self.on_tasks_written)
+
+        # Tasks of the visible month and its neighbours keyed by date, and the "YYYY-MM" months they cover.
+        self.prefetched = {}
+        self.prefetched_months = set()
+        # Tasks saved from this controller, layered over prefetches that may have started before the save.
+        self.saved_tasks = {}
+        # Dates whose saves have been written, with the latest prefetch requested at that point; once a
+        # later prefetch arrives it already contains the write and the date leaves saved_tasks.
+        self.written_dates = {}
+
+        # One worker runs the prefetches; paging quickly only queries the page shown last.
+        self.prefetch_runner = SearchRunner(partial(prefetch_tasks, self.store))
+        self.prefetch_generation = 0
+        runner = self.prefetch_runner
+        self.destroyed.connect(lambda: runner.stop())
+
         self.view = CalendarView(self)
         self.view.calendar.selectionChanged.connect(self.on_date_selected)
+        self.view.calendar.currentPageChanged.connect(self.prefetch_months)
         self.view.task_list.taskAdded.connect(self.save_tasks)
         self.view.task_list.taskCompleted.connect(self.save_tasks)
+        self.prefetch_runner.resultsReady.connect(self.on_months_prefetched)
+        self.prefetch_runner.failed.connect(self.on_prefetch_failed)
+        self.prefetch_months(self.view.calendar.yearShown(), self.view.calendar.monthShown())
         self.on_date_selected()  # Load tasks for the initial selected date
 
+    def load_tasks(self, date):
+        """
+        Returns the tasks for a date from the save queue, the prefetched months or the store.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+
+        Returns:
+            list: The tasks for that date.
+        """
+        tasks = self.persistence.pending(date)
+        if tasks is not None:
+            return tasks
+        if date[:7] in self.prefetched_months:
+            return list(self.prefetched.get(date, []))
+        return self.store.load(date)
+
     def on_date_selected(self):
         """
         Slot triggered when a date is selected in the calendar.
@@ -25,14 +106,104 @@ class CalendarController(QWidget):
         formatted_date = format_date(selected_date.toPyDate())
         self.view.date_label.setText(f"Selected Date: {formatted_date}")
 
-        # Load and display tasks for the selected date
-        tasks = load_tasks(formatted_date)
+        # Load and display tasks for the selected date, preferring saves that are still queued.
+        tasks = self.load_tasks(formatted_date)
         self.view.task_list.set_tasks(tasks)
 
+    def view_state(self):
+        """
+        Returns a serializable snapshot of what the calendar shows.
+
+        Returns:
+            dict: The view type, selected date and task list scroll position.
+        """
+        return {
+            "view": "calendar",
+            "selected_date": self.view.calendar.selectedDate().toPyDate().isoformat(),
+            "task_row": self.view.task_list.first_visible_row(),
+        }
+
+    def restore_state(self, state):
+        """
+        Reselects the date and scroll position captured by view_state.
+        """
+        selected = QDate.fromString(state.get("selected_date", ""), Qt.ISODate)
+        if selected.isValid():
+            self.view.calendar.setSelectedDate(selected)
+            self.view.calendar.setCurrentPage(selected.year(), selected.month())
+        self.view.task_list.scroll_to_row(state.get("task_row", 0))
+
+    def prefetch_months(self, year, month):
+        """
+        Slot triggered when the calendar page changes.
+        Loads the visible month and its neighbours in one range query, and the task counts of
+        the visible day grid, on the prefetch worker. A request replaces any earlier one that
+        has not finished, so only the page shown last is queried.
+
+        Args:
+            year (int): The year shown.
+            month (int): The month shown (1-12).
+        """
+        start, end = month_range(year, month, before=1, after=1)
+        grid_start, grid_end = (format_date(day.toPyDate()) for day in self.view.visible_date_range())
+        self.prefetch_generation = self.prefetch_runner.start(((year, month), start, end, grid_start, grid_end))
+
+    def on_months_prefetched(self, generation, result):
+        """
+        Slot triggered on the UI thread when a prefetch finishes.
+        Results for a superseded request or a page that is no longer shown are discarded.
+        """
+        page, (start, end, tasks_by_date, counts) = result
+        if generation != self.prefetch_generation:
+            return
+        if page != (self.view.calendar.yearShown(), self.view.calendar.monthShown()):
+            return
+        for date, tasks in self.saved_tasks.items():
+            if start <= date <= end:
+                tasks_by_date[date] = tasks
+                counts[date] = len(tasks)
+        for date, written_before in list(self.written_dates.items()):
+            if written_before < generation:
+                del self.written_dates[date]
+                del self.saved_tasks[date]
+        self.prefetched = tasks_by_date
+        year, month = page
+        self.prefetched_months = {start[:7], f"{year:04d}-{month:02d}", end[:7]}
+        self.view.apply_task_heat(counts)
+
+    def on_prefetch_failed(self, generation, message):
+        """
+        Slot triggered on the UI thread when a prefetch could not be read.
+        The dates are then loaded from the store when they are selected.
+        """
+        log_error(f"Failed to prefetch tasks: {message}")
+
     def save_tasks(self):
         """
-        Saves the tasks whenever they are added or checked off.
+        Queues the tasks to be saved whenever they are added or checked off.
         """
         selected_date = self.view.calendar.selectedDate()
         formatted_date = format_date(selected_date.toPyDate())
-        save_tasks(formatted_date, self.view.task_list.get_tasks())
+        tasks = list(self.view.task_list.get_tasks())
+        self.saved_tasks[formatted_date] = tasks
+        self.written_dates.pop(formatted_date, None)
+        if formatted_date[:7] in self.prefetched_months:
+            self.prefetched[formatted_date] = tasks
+        self.persistence.submit(formatted_date, tasks)
+        self.view.set_day_task_count(selected_date, len(tasks))
+
+    def on_tasks_written(self, date):
+        """
+        Slot triggered on the UI thread when a queued save has been written.
+        Marks the date for removal from saved_tasks once a prefetch requested after the
+        write has arrived, unless a newer save for it is still queued.
+        """
+        if date in self.saved_tasks and self.persistence.pending(date) is None:
+            self.written_dates[date] = self.prefetch_generation
+
+    def on_save_failed(self, date, message):
+        """
+        Slot triggered on the UI thread when a queued save could not be written.
+        """
+        log_error(f"Failed to save tasks for {date}: {message}")
+        show_error_dialog(f"Could not save the tasks for {date}.\n\n{message}")
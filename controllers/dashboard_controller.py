@@ -1,5 +1,5 @@
 # controllers/dashboard_controller.py
-from views.calendar_view import CalendarView
+from controllers.calendar_controller import CalendarController
 from views.notes_view import NotesView
 
 def open_calendar(main_window):
@@ -9,9 +9,10 @@ def open_calendar(main_window):
     Args:
         main_window (MainWindow): The main application window instance.
     """
-    # Instantiate CalendarView and delegate navigation to the main window.
-    calendar_view = CalendarView(main_window)
-    main_window.navigate_to(calendar_view)
+    # Instantiate the calendar (its controller can be snapshotted and rebuilt from the history)
+    # and delegate navigation to the main window.
+    calendar_controller = CalendarController(main_window)
+    main_window.navigate_to(calendar_controller)
 
 def open_notes(main_window):
     """
@@ -0,0 +1,90 @@
+# core/day_count_index.py
+from array import array
+from datetime import date, timedelta
+
+
+class DayCountIndex:
+    """
+    Compact index of how many tasks each day holds.
+
+    Each year is an array of 366 unsigned 16-bit counters (one slot per day of the year),
+    so looking up a calendar page costs one array read per visible day no matter how much
+    history is stored.
+    """
+
+    def __init__(self):
+        self._years = {}
+
+    @staticmethod
+    def _slot(day):
+        return day.timetuple().tm_yday - 1
+
+    def set(self, date_key, count):
+        """
+        Records the number of tasks stored for a date.
+
+        Args:
+            date_key (str): The date key (YYYY-MM-DD).
+            count (int): The number of tasks on that date.
+        """
+        day = date.fromisoformat(date_key)
+        counts = self._years.get(day.year)
+        if counts is None:
+            if not count:
+                return
+            counts = self._years[day.year] = array("H", bytes(2 * 366))
+        counts[self._slot(day)] = min(count, 0xFFFF)
+
+    def get(self, date_key):
+        """
+        Returns the number of tasks stored for a date.
+
+        Args:
+            date_key (str): The date key (YYYY-MM-DD).
+
+        Returns:
+            int: The task count, 0 if none.
+        """
+        day = date.fromisoformat(date_key)
+        counts = self._years.get(day.year)
+        return counts[self._slot(day)] if counts is not None else 0
+
+    def counts_between(self, start, end):
+        """
+        Returns the non-zero task counts for the days between start and end (inclusive).
+
+        Args:
+            start (str): The first date key (YYYY-MM-DD).
+            end (str): The last date key (YYYY-MM-DD).
+
+        Returns:
+            dict: Task counts keyed by date string.
+        """
+        result = {}
+        day = date.fromisoformat(start)
+        last = date.fromisoformat(end)
+        one_day = timedelta(days=1)
+        while day <= last:
+            counts = self._years.get(day.year)
+            if counts is not None:
+                count = counts[self._slot(day)]
+                if count:
+                    result[day.isoformat()] = count
+            day += one_day
+        return result
+
+    @classmethod
+    def from_counts(cls, items):
+        """
+        Builds an index from (date, count) pairs.
+
+        Args:
+            items (iterable): (date key, task count) pairs.
+
+        Returns:
+            DayCountIndex: The populated index.
+        """
+        index = cls()
+        for date_key, count in items:
+            index.set(date_key, count)
+        return index
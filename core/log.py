@@ -0,0 +1,38 @@
+# core/log.py
+"""
+Error logging for the application and for headless tools. Does not depend on Qt.
+"""
+LOG_FILE = 'app.log'
+
+_logging_configured = False
+
+def configure_logging():
+    """
+    Configures logging to write warnings and error messages to a file. Safe to call more than once.
+    The file is opened when the first record is written, not when logging is configured.
+    """
+    import logging  # Imported on first use; most runs never log anything.
+
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    logging.basicConfig(
+        # WARNING rather than ERROR so recoverable data loss, such as a torn task journal
+        # tail being dropped (core/task_journal.py), is recorded too.
+        level=logging.WARNING,
+        format='%(asctime)s:%(levelname)s:%(message)s',
+        handlers=[logging.FileHandler(LOG_FILE, delay=True)],
+    )
+
+def log_error(message):
+    """
+    Logs an error message using Python's logging facility.
+    
+    Args:
+        message (str): The error message to log.
+    """
+    import logging
+
+    configure_logging()
+    logging.error(message)
@@ -0,0 +1,142 @@
+# core/lru_cache.py
+import threading
+from collections import OrderedDict
+
+
+class ByteLRUCache:
+    """
+    Least-recently-used cache bounded by the total size of its values.
+
+    Each entry is stored with its size in bytes; inserting past `max_bytes` evicts the
+    least recently used entries until the total fits again. An entry larger than the
+    whole budget is not cached at all.
+    """
+
+    def __init__(self, max_bytes, on_evict=None):
+        """
+        Initializes the cache.
+
+        Args:
+            max_bytes (int): The total size budget in bytes.
+            on_evict (callable, optional): Called as on_evict(key, value) for every evicted entry.
+        """
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def keys(self):
+        """
+        Returns the cached keys, least recently used first.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Returns a cached value and marks it as most recently used.
+
+        Args:
+            key: The cache key.
+            default: The value returned on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key, default=None):
+        """
+        Returns a cached value without marking it as used or counting a hit or miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return default if entry is None else entry[0]
+
+    def put(self, key, value, size):
+        """
+        Stores a value, evicting older entries if the budget is exceeded.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            size (int): The value's size in bytes.
+        """
+        with self._lock:
+            self.pop(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict(self.max_bytes)
+
+    def pop(self, key, default=None):
+        """
+        Removes an entry without counting it as an eviction.
+
+        Returns:
+            The removed value, or `default` if the key was not cached.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def resize(self, max_bytes):
+        """
+        Changes the byte budget, evicting entries if it shrank.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict(max_bytes)
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _evict(self, budget):
+        while self._bytes > budget and self._entries:
+            key, (value, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(key, value)
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: Entry count, bytes used, byte budget, hits, misses, evictions and hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,228 @@
+# core/notes.py
+"""
+Notebooks and notes for the application and for headless tools. Does not depend on Qt.
+"""
+from utils.config_manager import get_config
+from core.log import log_error
+
+_store_opened = False
+
+def _model():
+    """
+    Returns NotesModel. The notes subsystem is imported on first use, so importing core stays cheap.
+    """
+    from models.notes_model import NotesModel
+    return NotesModel
+
+def ensure_notes_storage():
+    """
+    Loads the saved notebooks and note metadata the first time the notes are used.
+    Note bodies are read later, when a note is opened.
+
+    Raises:
+        OSError, ValueError: If the saved notes cannot be read (e.g. a corrupt index.json).
+            The error is logged and loading is retried on the next call, so notes are
+            never silently kept in memory only.
+    """
+    global _store_opened
+    if _store_opened:
+        return
+    folder = get_config("NOTES_FOLDER", "storage/notes")
+    # Set before opening so listeners notified by open_store do not open it again.
+    _store_opened = True
+    try:
+        from models.note_store import NoteStore
+        _model().open_store(
+            NoteStore(folder, cache_bytes=get_config("NOTE_BODY_CACHE_BYTES", 8 * 1024 * 1024)),
+            delay_ms=get_config("NOTE_INDEX_SAVE_DELAY_MS", 300),
+        )
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        _store_opened = False
+        log_error(f"Could not load the notes from {folder}: {e!r}")
+        raise
+
+def flush_notes():
+    """
+    Writes notebook and note changes still waiting in the background queue.
+    Call before exiting; the queue's worker thread does not keep the process alive.
+    """
+    if _store_opened:
+        _model().flush()
+
+def get_notebooks():
+    """
+    Retrieves all notebooks from the model.
+    
+    Returns:
+        dict: A dictionary of notebooks.
+    """
+    ensure_notes_storage()
+    return _model().get_notebooks()
+
+def add_notebook(name):
+    """
+    Creates a new notebook with the provided name.
+    
+    Args:
+        name (str): The notebook name.
+    
+    Returns:
+        int: The identifier for the new notebook.
+    """
+    ensure_notes_storage()
+    return _model().add_notebook(name)
+
+def remove_notebook(notebook_id):
+    """
+    Deletes a notebook from the model.
+    
+    Args:
+        notebook_id (int): The notebook identifier.
+    
+    Returns:
+        dict or None: The removed notebook data or None if not found.
+    """
+    ensure_notes_storage()
+    return _model().remove_notebook(notebook_id)
+
+def add_note(notebook_id, note_data):
+    """
+    Adds a new note to a specified notebook.
+    
+    Args:
+        notebook_id (int): The identifier of the notebook.
+        note_data (dict): Data for the new note.
+    
+    Returns:
+        int or None: The new note's identifier or None if the notebook was not found.
+    """
+    ensure_notes_storage()
+    return _model().add_note(notebook_id, note_data)
+
+def add_notes(notebook_id, notes_data):
+    """
+    Adds several notes to a notebook at once; the notebook index is saved once.
+
+    Args:
+        notebook_id (int): The identifier of the notebook.
+        notes_data (iterable): Data for the new notes.
+
+    Returns:
+        list or None: The new notes' identifiers or None if the notebook was not found.
+    """
+    ensure_notes_storage()
+    return _model().add_notes(notebook_id, notes_data)
+
+def remove_note(notebook_id, note_id):
+    """
+    Removes a note from a notebook.
+    
+    Args:
+        notebook_id (int): The identifier of the notebook.
+        note_id (int): The identifier of the note.
+    
+    Returns:
+        dict or None: The removed note data or None if not found.
+    """
+    ensure_notes_storage()
+    return _model().remove_note(notebook_id, note_id)
+
+def search_notes(query, mode="and", limit=20):
+    """
+    Searches the text of every note.
+    
+    Args:
+        query (str): The words to look for.
+        mode (str): "and" to require every word, "or" to match any of them.
+        limit (int or None): The maximum number of results.
+    
+    Returns:
+        list: (note ID, score) pairs, best match first.
+    """
+    ensure_notes_storage()
+    return _model().search_notes(query, mode=mode, limit=limit)
+
+def iter_search_notes(query, cancelled=None):
+    """
+    Searches the text of every note, yielding batches of results best first.
+    The first batch is produced before the remaining matches are ranked.
+    
+    Args:
+        query (str): The words to look for.
+        cancelled (callable, optional): Returns True when the search is no longer wanted.
+    
+    Returns:
+        generator: Yields lists of (note ID, score) pairs.
+    """
+    ensure_notes_storage()
+    return _model().iter_search_notes(query, cancelled=cancelled)
+
+def find_note(note_id):
+    """
+    Looks up a note by its ID.
+    
+    Args:
+        note_id (int): The note identifier.
+    
+    Returns:
+        tuple or None: (notebook ID, note data), or None if not found.
+    """
+    ensure_notes_storage()
+    return _model().find_note(note_id)
+
+def get_note_body(note_id):
+    """
+    Retrieves a note's body, loading it from disk on first open.
+    
+    Args:
+        note_id (int): The note identifier.
+    
+    Returns:
+        str: The note body.
+    """
+    ensure_notes_storage()
+    return _model().get_note_body(note_id)
+
+def update_note_body(note_id, body, title=None):
+    """
+    Saves a note's body and, optionally, its title.
+    
+    Args:
+        note_id (int): The note identifier.
+        body (str): The new body.
+        title (str, optional): The new title.
+    
+    Returns:
+        bool: True if the note exists.
+    """
+    ensure_notes_storage()
+    return _model().update_note_body(note_id, body, title=title)
+
+def rename_notebook(notebook_id, name):
+    """
+    Renames a notebook.
+    
+    Args:
+        notebook_id (int): The notebook identifier.
+        name (str): The new name.
+    
+    Returns:
+        bool: True if the notebook exists.
+    """
+    ensure_notes_storage()
+    return _model().rename_notebook(notebook_id, name)
+
+def subscribe_to_notes(listener):
+    """
+    Registers a callable that receives a Change record after every notes modification.
+    
+    Args:
+        listener (callable): Called as listener(change).
+    """
+    _model().subscribe(listener)
+
+def unsubscribe_from_notes(listener):
+    """
+    Removes a listener registered with subscribe_to_notes.
+    """
+    _model().unsubscribe(listener)
@@ -0,0 +1,341 @@
+# core/sqlite_task_store.py
+import os
+import sqlite3
+import threading
+
+from models.records import Task
+from core.day_count_index import DayCountIndex
+from core.task_store import TaskStore
+from core.task_journal import JournalTaskStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (date, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+class SqliteTaskStore:
+    """
+    Task storage backed by an SQLite database.
+
+    Tasks are rows clustered on (date, position), so reading or replacing one date only
+    touches the pages holding that date instead of the whole history. The database runs
+    in WAL mode and a single connection is opened lazily and reused for every call.
+    """
+
+    def __init__(self, path, migrate_from=None):
+        """
+        Initializes the store.
+
+        Args:
+            path (str): The path to the SQLite database file.
+            migrate_from (str, optional): A tasks.json file to import the first time the
+                                          database is opened (see migrate_json_to_sqlite).
+        """
+        self.path = path
+        self.migrate_from = migrate_from
+        self._connection = None
+        self._day_counts = None  # DayCountIndex built on first use and kept up to date by saves.
+        self._lock = threading.RLock()
+        self.reads = 0
+        self.writes = 0
+
+    def _connect(self):
+        """
+        Returns the shared connection, opening and preparing the database on first use.
+        """
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # The connection is guarded by self._lock, so it may be used from worker threads too.
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+            if self.migrate_from:
+                migrate_json_to_sqlite(self.migrate_from, self)
+        return self._connection
+
+    def load(self, date):
+        """
+        Returns the tasks stored for a date.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+
+        Returns:
+            list: The Task records for that date, or an empty list.
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT text FROM tasks WHERE date = ? ORDER BY position", (date,)
+            ).fetchall()
+            self.reads += 1
+        return [Task(text) for (text,) in rows]
+
+    def save(self, date, tasks):
+        """
+        Replaces the tasks for a date in a single transaction.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+            tasks (list): The Task records (or plain strings) to store.
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._replace_date(connection, date, tasks)
+            self.writes += 1
+            if self._day_counts is not None:
+                self._day_counts.set(date, len(tasks))
+
+    def save_many(self, items):
+        """
+        Replaces the tasks for several dates in one transaction.
+
+        Args:
+            items (iterable): (date, tasks) pairs.
+        """
+        with self._lock:
+            connection = self._connect()
+            written = []
+            with connection:
+                for date, tasks in items:
+                    self._replace_date(connection, date, tasks)
+                    written.append((date, len(tasks)))
+            self.writes += len(written)
+            if self._day_counts is not None:
+                for date, count in written:
+                    self._day_counts.set(date, count)
+
+    def append_many(self, items):
+        """
+        Appends tasks to several dates in one transaction, after the tasks already stored.
+
+        Unlike save_many, the existing tasks are neither read nor rewritten, so the cost
+        depends only on the number of tasks added.
+
+        Args:
+            items (iterable): (date, tasks) pairs.
+        """
+        with self._lock:
+            connection = self._connect()
+            written = []
+            with connection:
+                for date, tasks in items:
+                    start = connection.execute(
+                        "SELECT COALESCE(MAX(position) + 1, 0) FROM tasks WHERE date = ?", (date,)
+                    ).fetchone()[0]
+                    connection.executemany(
+                        "INSERT INTO tasks (date, position, text) VALUES (?, ?, ?)",
+                        (
+                            (date, position, task.text)
+                            for position, task in enumerate(map(Task.coerce, tasks), start)
+                        ),
+                    )
+                    written.append((date, start + len(tasks)))
+            self.writes += len(written)
+            if self._day_counts is not None:
+                for date, count in written:
+                    self._day_counts.set(date, count)
+
+    @staticmethod
+    def _replace_date(connection, date, tasks):
+        connection.execute("DELETE FROM tasks WHERE date = ?", (date,))
+        connection.executemany(
+            "INSERT INTO tasks (date, position, text) VALUES (?, ?, ?)",
+            (
+                (date, position, task.text)
+                for position, task in enumerate(map(Task.coerce, tasks))
+            ),
+        )
+
+    def iter_range(self, start, end, chunk_size=500):
+        """
+        Yields the tasks of every date between start and end (inclusive) in date order.
+
+        Rows are streamed from one indexed range scan in chunks, so memory use does not
+        depend on how many dates the range covers.
+
+        Args:
+            start (str): The first date key (YYYY-MM-DD).
+            end (str): The last date key (YYYY-MM-DD).
+            chunk_size (int): The number of rows fetched per step.
+
+        Yields:
+            tuple: (date, tasks) pairs.
+        """
+        with self._lock:
+            cursor = self._connect().execute(
+                "SELECT date, text FROM tasks WHERE date BETWEEN ? AND ? ORDER BY date, position",
+                (start, end),
+            )
+            self.reads += 1
+        current_date, current_tasks = None, []
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for date, text in rows:
+                if date != current_date:
+                    if current_tasks:
+                        yield current_date, current_tasks
+                    current_date, current_tasks = date, []
+                current_tasks.append(Task(text))
+        if current_tasks:
+            yield current_date, current_tasks
+
+    def task_counts(self, start, end):
+        """
+        Returns how many tasks each date between start and end (inclusive) holds.
+
+        Args:
+            start (str): The first date key (YYYY-MM-DD).
+            end (str): The last date key (YYYY-MM-DD).
+
+        Returns:
+            dict: Non-zero task counts keyed by date.
+        """
+        with self._lock:
+            if self._day_counts is None:
+                self._day_counts = DayCountIndex.from_counts(
+                    self._connect().execute("SELECT date, COUNT(*) FROM tasks GROUP BY date")
+                )
+            return self._day_counts.counts_between(start, end)
+
+    def items(self):
+        """
+        Returns every (date, tasks) pair in date order.
+
+        Returns:
+            list: A list of (date, tasks) pairs.
+        """
+        items = []
+        with self._lock:
+            rows = self._connect().execute("SELECT date, text FROM tasks ORDER BY date, position")
+            for date, text in rows:
+                task = Task(text)
+                if items and items[-1][0] == date:
+                    items[-1][1].append(task)
+                else:
+                    items.append((date, [task]))
+        return items
+
+    def compact(self):
+        """
+        Rebuilds the database file to release the space left by deleted rows.
+
+        Returns:
+            int: The number of dates dropped (dates without tasks are never stored, so 0).
+        """
+        with self._lock:
+            self._connect().execute("VACUUM")
+        return 0
+
+    def invalidate(self):
+        """
+        Nothing is cached in memory; every read goes to the database.
+        """
+
+    def close(self):
+        """
+        Closes the shared connection. It is reopened on the next access.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self):
+        """
+        Returns the store counters.
+
+        Returns:
+            dict: The number of reads and writes and the number of stored dates.
+        """
+        with self._lock:
+            (dates,) = self._connect().execute("SELECT COUNT(DISTINCT date) FROM tasks").fetchone()
+            return {"reads": self.reads, "writes": self.writes, "dates": dates}
+
+
+def migrate_json_to_sqlite(json_path, store):
+    """
+    Imports an existing tasks.json (and its journal, if any) into an empty SQLite store.
+
+    The migration runs once; the database records that it happened. The JSON file and its
+    journal are left in place, so the JSON storage modes keep seeing every task until the
+    switch is confirmed with archive_migrated_json.
+
+    Args:
+        json_path (str): The tasks.json path.
+        store (SqliteTaskStore): The destination store.
+
+    Returns:
+        int: The number of dates imported.
+    """
+    log_path = json_path + ".log"
+    if not os.path.exists(json_path) and not os.path.exists(log_path):
+        return 0
+    with store._lock:
+        connection = store._connect()
+        if connection.execute("SELECT 1 FROM meta WHERE key = 'migrated_from'").fetchone():
+            return 0
+        if connection.execute("SELECT 1 FROM tasks LIMIT 1").fetchone():
+            return 0
+        items = _read_json_tasks(json_path)
+        store.save_many(items)
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)", (os.path.abspath(json_path),)
+            )
+    return len(items)
+
+
+def _read_json_tasks(json_path):
+    source = JournalTaskStore(json_path) if os.path.exists(json_path + ".log") else TaskStore(json_path)
+    try:
+        return source.items()
+    finally:
+        source.close()
+
+
+def archive_migrated_json(json_path, store):
+    """
+    Confirms a switch to SQLite: checks that the store holds every task of the JSON files,
+    then renames them with a `.migrated` suffix so they are kept as a backup.
+
+    Args:
+        json_path (str): The tasks.json path passed to migrate_json_to_sqlite.
+        store (SqliteTaskStore): The store the tasks were imported into.
+
+    Returns:
+        list: The paths that were renamed.
+
+    Raises:
+        ValueError: If the JSON files were not imported into the store, or hold tasks the
+                    store does not have; nothing is renamed then.
+    """
+    with store._lock:
+        row = store._connect().execute("SELECT value FROM meta WHERE key = 'migrated_from'").fetchone()
+        if row is None or row[0] != os.path.abspath(json_path):
+            raise ValueError(f"{json_path} has not been migrated to {store.path}")
+        stored = dict(store.items())
+    for date, tasks in _read_json_tasks(json_path):
+        if tasks and stored.get(date) != tasks:
+            raise ValueError(f"{store.path} does not hold the tasks of {date} from {json_path}")
+    renamed = []
+    for path in (json_path, json_path + ".log", json_path + ".log.compacting"):
+        if os.path.exists(path):
+            os.replace(path, path + ".migrated")
+            renamed.append(path)
+    return renamed
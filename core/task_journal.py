@@ -0,0 +1,283 @@
+# core/task_journal.py
+import json
+import logging
+import os
+import threading
+import zlib
+
+from models.records import tasks_to_json
+from core.task_store import TaskStore
+
+logger = logging.getLogger(__name__)
+
+# Default log size (in bytes) at which the log is folded into the snapshot.
+DEFAULT_COMPACT_THRESHOLD = 1024 * 1024
+
+
+def encode_record(date, tasks):
+    """
+    Encodes one save as a journal line: an 8 digit CRC32 followed by compact JSON.
+
+    Args:
+        date (str): The date key (YYYY-MM-DD).
+        tasks (list): The JSON values of the tasks stored for that date.
+
+    Returns:
+        bytes: The encoded line, including the trailing newline.
+    """
+    payload = json.dumps([date, tasks], separators=(",", ":")).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def read_records(path):
+    """
+    Reads the valid records of a journal file.
+
+    Reading stops at the first line that is incomplete or fails its checksum, which is
+    what a write interrupted by a crash leaves behind.
+
+    Args:
+        path (str): The journal file path.
+
+    Returns:
+        tuple: (records, valid_length) where records is a list of (date, tasks) pairs and
+               valid_length is the byte offset just past the last valid record.
+    """
+    records = []
+    valid_length = 0
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return records, valid_length
+    with file:
+        for line in file:
+            if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+                break
+            payload = line[9:-1]
+            try:
+                if int(line[:8], 16) != zlib.crc32(payload):
+                    break
+                date, tasks = json.loads(payload)
+            except ValueError:
+                break
+            records.append((date, tasks))
+            valid_length += len(line)
+    return records, valid_length
+
+
+class JournalTaskStore(TaskStore):
+    """
+    TaskStore variant that appends each save to a write-ahead log instead of rewriting the file.
+
+    The on-disk state is the tasks.json snapshot plus `<path>.log`. Every save appends one
+    compact record to the log; once the log passes a size threshold a background thread
+    folds it into a fresh snapshot. Startup replays the snapshot and then the log, dropping
+    a torn record at the end of the log left by a crash.
+
+    The store is assumed to be the only writer of its files, so after the initial replay
+    reads are served from memory without checking the files again.
+    """
+    rewrites_file = False  # Saves only append to the log.
+
+    def __init__(self, path, compact_threshold=DEFAULT_COMPACT_THRESHOLD, fsync=False):
+        """
+        Initializes the journaled store.
+
+        Args:
+            path (str): The path to the tasks JSON snapshot.
+            compact_threshold (int): Log size in bytes that triggers a compaction.
+            fsync (bool): Whether to fsync the log after every record.
+        """
+        super().__init__(path)
+        self.log_path = path + ".log"
+        # Log being folded into the snapshot; only present while a compaction is running
+        # or after one was interrupted.
+        self.compacting_log_path = path + ".log.compacting"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self._log_file = None
+        self._log_size = 0
+        self._compaction = None
+        self._loaded = False
+
+    def _refresh(self):
+        """
+        Replays the snapshot and the logs on first access.
+        """
+        if self._loaded:
+            self.hits += 1
+            return
+        self.misses += 1
+        self._replay()
+        self._loaded = True
+
+    def _replay(self):
+        """
+        Rebuilds the in-memory data from the snapshot, an interrupted compaction log and the live log.
+        """
+        self._data = {}
+        self._sorted_dates = None
+        self._day_counts = None
+        if os.path.exists(self.path):
+            with open(self.path, "r") as file:
+                self._data = json.load(file)
+
+        for log_path in (self.compacting_log_path, self.log_path):
+            records, valid_length = read_records(log_path)
+            for date, tasks in records:
+                self._data[date] = tasks
+            if os.path.exists(log_path) and os.path.getsize(log_path) > valid_length:
+                logger.warning("Dropping %d bytes of incomplete journal data from %s",
+                               os.path.getsize(log_path) - valid_length, log_path)
+                with open(log_path, "r+b") as file:
+                    file.truncate(valid_length)
+
+        self._log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        if os.path.exists(self.compacting_log_path) or self._log_size >= self.compact_threshold:
+            self._start_compaction()
+
+    def _open_log(self):
+        """
+        Returns the append handle for the live log, opening it if needed.
+        """
+        if self._log_file is None:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._log_file = open(self.log_path, "ab")
+        return self._log_file
+
+    def save(self, date, tasks):
+        """
+        Replaces the tasks for a date and appends the change to the log.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+            tasks (list): The Task records (or plain strings) to store.
+        """
+        tasks = tasks_to_json(tasks)
+        record = encode_record(date, tasks)
+        with self._lock:
+            self._refresh()
+            self._set(date, tasks)
+            log_file = self._open_log()
+            log_file.write(record)
+            log_file.flush()
+            if self.fsync:
+                os.fsync(log_file.fileno())
+            self._log_size += len(record)
+            if self._log_size >= self.compact_threshold:
+                self._start_compaction()
+
+    def save_many(self, items):
+        """
+        Replaces the tasks for several dates, appending them to the log with a single flush.
+
+        Args:
+            items (iterable): (date, tasks) pairs.
+        """
+        with self._lock:
+            self._refresh()
+            log_file = self._open_log()
+            for date, tasks in items:
+                tasks = tasks_to_json(tasks)
+                record = encode_record(date, tasks)
+                self._set(date, tasks)
+                log_file.write(record)
+                self._log_size += len(record)
+            log_file.flush()
+            if self.fsync:
+                os.fsync(log_file.fileno())
+            if self._log_size >= self.compact_threshold:
+                self._start_compaction()
+
+    def _start_compaction(self):
+        """
+        Rotates the live log and folds it into the snapshot on a background thread.
+        Must be called with the lock held.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        if not os.path.exists(self.compacting_log_path):
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+            if os.path.exists(self.log_path):
+                os.replace(self.log_path, self.compacting_log_path)
+            self._log_size = 0
+        # Saves replace whole lists rather than mutating them, so a shallow copy is a stable snapshot.
+        snapshot = dict(self._data)
+        self._compaction = threading.Thread(
+            target=self._write_snapshot, args=(snapshot,), name="task-journal-compaction", daemon=True
+        )
+        self._compaction.start()
+
+    def _write_snapshot(self, snapshot):
+        """
+        Writes the snapshot atomically and discards the log it replaces.
+        """
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w") as file:
+                json.dump(snapshot, file, separators=(",", ":"))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+            if os.path.exists(self.compacting_log_path):
+                os.remove(self.compacting_log_path)
+        except OSError:
+            # The rotated log is kept, so the next startup replays it again.
+            logger.exception("Task journal compaction failed")
+
+    def compact(self):
+        """
+        Drops dates without tasks, folds the log into the snapshot and waits for it to finish.
+
+        Returns:
+            int: The number of dates dropped.
+        """
+        with self._lock:
+            self._refresh()
+            self._wait_for_compaction()
+            dropped = self._drop_empty_dates()
+            self._start_compaction()
+        self._wait_for_compaction()
+        return dropped
+
+    def _wait_for_compaction(self):
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+
+    def invalidate(self):
+        """
+        Drops the in-memory copy so the next access replays the files.
+        """
+        with self._lock:
+            self._wait_for_compaction()
+            self._data = {}
+            self._sorted_dates = None
+            self._day_counts = None
+            self._loaded = False
+
+    def close(self):
+        """
+        Waits for a running compaction and closes the log.
+        """
+        with self._lock:
+            self._wait_for_compaction()
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+
+    def stats(self):
+        """
+        Returns the cache counters along with the current log size.
+
+        Returns:
+            dict: The TaskStore counters plus `log_bytes`.
+        """
+        with self._lock:
+            stats = super().stats()
+            stats["log_bytes"] = self._log_size
+            return stats
@@ -0,0 +1,287 @@
+# core/task_store.py
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right
+
+from models.records import tasks_from_json, tasks_to_json
+from core.day_count_index import DayCountIndex
+
+# Sentinel signature used before the file has been read for the first time.
+_NOT_LOADED = object()
+
+# Process-wide stores, keyed by the absolute path of the tasks file.
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class TaskStore:
+    """
+    In-memory view of a tasks.json file.
+
+    The file is parsed once into a per-date dictionary. Each access stats the file and
+    only reparses it when its modification time or size has changed, so selecting dates
+    in the calendar is served from memory instead of re-reading the whole history.
+
+    Tasks are kept in their JSON form internally and handed out as Task records.
+    """
+    # Every save rewrites the whole file, so bulk writes should be made in one save_many.
+    rewrites_file = True
+
+    def __init__(self, path):
+        """
+        Initializes the store for the given tasks file.
+
+        Args:
+            path (str): The path to the tasks JSON file.
+        """
+        self.path = path
+        self._data = {}
+        self._sorted_dates = None  # Sorted date keys for range queries, rebuilt when dates are added.
+        self._day_counts = None    # DayCountIndex built on first use and kept up to date by saves.
+        self._signature = _NOT_LOADED
+        self._lock = threading.RLock()
+        self.hits = 0    # Accesses answered from the in-memory copy.
+        self.misses = 0  # Accesses that had to (re)parse the file.
+
+    def _file_signature(self):
+        """
+        Returns the (mtime, size) pair used to detect changes to the file, or None if it does not exist.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self):
+        """
+        Reloads the file if it changed since it was last parsed.
+        """
+        signature = self._file_signature()
+        if signature == self._signature:
+            self.hits += 1
+            return
+        self.misses += 1
+        if signature is None:
+            self._data = {}
+        else:
+            with open(self.path, "r") as file:
+                self._data = json.load(file)
+        self._sorted_dates = None
+        self._day_counts = None
+        self._signature = signature
+
+    def load(self, date):
+        """
+        Returns the tasks stored for a date.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+
+        Returns:
+            list: The Task records for that date, or an empty list.
+        """
+        with self._lock:
+            self._refresh()
+            return tasks_from_json(self._data.get(date, ()))
+
+    def iter_range(self, start, end):
+        """
+        Yields the tasks of every date between start and end (inclusive) in date order.
+        Dates without tasks are skipped.
+
+        Args:
+            start (str): The first date key (YYYY-MM-DD).
+            end (str): The last date key (YYYY-MM-DD).
+
+        Yields:
+            tuple: (date, tasks) pairs.
+        """
+        with self._lock:
+            self._refresh()
+            if self._sorted_dates is None:
+                self._sorted_dates = sorted(self._data)
+            dates = self._sorted_dates
+            selected = dates[bisect_left(dates, start):bisect_right(dates, end)]
+            data = self._data
+        for date in selected:
+            tasks = data.get(date)
+            if tasks:
+                yield date, tasks_from_json(tasks)
+
+    def _set(self, date, tasks):
+        """
+        Stores the tasks for a date in memory. Must be called with the lock held.
+        """
+        if date not in self._data:
+            self._sorted_dates = None
+        self._data[date] = tasks
+        if self._day_counts is not None:
+            self._day_counts.set(date, len(tasks))
+
+    def task_counts(self, start, end):
+        """
+        Returns how many tasks each date between start and end (inclusive) holds.
+
+        Args:
+            start (str): The first date key (YYYY-MM-DD).
+            end (str): The last date key (YYYY-MM-DD).
+
+        Returns:
+            dict: Non-zero task counts keyed by date.
+        """
+        with self._lock:
+            self._refresh()
+            if self._day_counts is None:
+                self._day_counts = DayCountIndex.from_counts(
+                    (date, len(tasks)) for date, tasks in self._data.items()
+                )
+            return self._day_counts.counts_between(start, end)
+
+    def save(self, date, tasks):
+        """
+        Replaces the tasks for a date and writes the file back to disk.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+            tasks (list): The Task records (or plain strings) to store.
+        """
+        with self._lock:
+            self._refresh()
+            self._set(date, tasks_to_json(tasks))
+            self._write()
+
+    def save_many(self, items):
+        """
+        Replaces the tasks for several dates and writes the file back once.
+
+        Args:
+            items (iterable): (date, tasks) pairs.
+        """
+        with self._lock:
+            self._refresh()
+            for date, tasks in items:
+                self._set(date, tasks_to_json(tasks))
+            self._write()
+
+    def _write(self):
+        """
+        Writes every date to the file. Must be called with the lock held.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w") as file:
+            json.dump(self._data, file, indent=4)
+        # Remember the signature of our own write so it does not count as an external change.
+        self._signature = self._file_signature()
+
+    def _drop_empty_dates(self):
+        """
+        Forgets dates whose task lists are empty. Must be called with the lock held.
+
+        Returns:
+            int: The number of dates dropped.
+        """
+        empty = [date for date, tasks in self._data.items() if not tasks]
+        for date in empty:
+            del self._data[date]
+        if empty:
+            self._sorted_dates = None
+            self._day_counts = None
+        return len(empty)
+
+    def compact(self):
+        """
+        Drops dates without tasks and rewrites the file.
+
+        Returns:
+            int: The number of dates dropped.
+        """
+        with self._lock:
+            self._refresh()
+            dropped = self._drop_empty_dates()
+            self._write()
+            return dropped
+
+    def items(self):
+        """
+        Returns every (date, tasks) pair in the store.
+
+        Returns:
+            list: A list of (date, tasks) pairs.
+        """
+        with self._lock:
+            self._refresh()
+            return [(date, tasks_from_json(tasks)) for date, tasks in self._data.items()]
+
+    def invalidate(self):
+        """
+        Drops the in-memory copy so the next access reparses the file.
+        """
+        with self._lock:
+            self._data = {}
+            self._sorted_dates = None
+            self._day_counts = None
+            self._signature = _NOT_LOADED
+
+    def close(self):
+        """
+        Releases any resources held by the store. The plain JSON store holds none.
+        """
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: The number of hits and misses and the number of cached dates.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "dates": len(self._data)}
+
+    def reset_stats(self):
+        """
+        Resets the hit and miss counters.
+        """
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+def _store_class(mode):
+    """
+    Returns the TaskStore implementation for a storage mode.
+    """
+    if mode == "json":
+        return TaskStore
+    if mode == "journal":
+        from core.task_journal import JournalTaskStore  # Imported here to avoid a circular import.
+        return JournalTaskStore
+    if mode == "sqlite":
+        from core.sqlite_task_store import SqliteTaskStore
+        return SqliteTaskStore
+    raise ValueError(f"Unknown task storage mode: {mode}")
+
+
+def get_task_store(path, mode="json", **options):
+    """
+    Returns the process-wide TaskStore for a tasks file, creating it on first use.
+
+    Args:
+        path (str): The path to the tasks JSON file.
+        mode (str): "json" to rewrite the file on every save, "journal" to append saves
+                    to a write-ahead log (see core/task_journal.py) or "sqlite" to keep
+                    tasks in an SQLite database (see core/sqlite_task_store.py).
+        **options: Extra arguments for the store constructor, used on creation only.
+
+    Returns:
+        TaskStore: The shared store for that file.
+    """
+    key = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = _store_class(mode)(path, **options)
+        return store
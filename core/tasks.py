@@ -0,0 +1,63 @@
+# core/tasks.py
+"""
+Task storage for the application and for headless tools. Does not depend on Qt.
+"""
+import os
+from utils.config_manager import get_config
+
+# Define the storage folder and tasks file path
+STORAGE_FOLDER = "storage"
+TASKS_FILE = os.path.join(STORAGE_FOLDER, "tasks.json")
+TASKS_DB = os.path.join(STORAGE_FOLDER, "tasks.db")
+
+# The storage folder is created by the stores when they first write, not on import.
+
+def get_default_task_store(mode=None):
+    """
+    Returns the shared task store, using the storage mode from config.TASK_STORAGE_MODE.
+
+    When config.TASK_STORAGE_MODE is "sqlite", the SQLite store imports an existing
+    tasks.json the first time it is opened (the JSON files are left in place). A `mode`
+    passed here, such as the command-line tool's --storage-mode, only selects the store
+    for this process and never migrates anything.
+
+    Args:
+        mode (str, optional): Overrides the configured storage mode.
+    """
+    from core.task_store import get_task_store  # Imported on first use, so importing core stays cheap.
+
+    configured = get_config("TASK_STORAGE_MODE", "json")
+    mode = mode or configured
+    if mode == "sqlite":
+        migrate_from = TASKS_FILE if configured == "sqlite" else None
+        return get_task_store(TASKS_DB, mode=mode, migrate_from=migrate_from)
+    return get_task_store(TASKS_FILE, mode=mode)
+
+def load_tasks(date):
+    """
+    Loads tasks from the tasks.json file for a given date.
+    Returns an empty list if no tasks exist for that date.
+    The file is only reparsed when it changes on disk (see core/task_store.py).
+    """
+    return get_default_task_store().load(date)
+
+
+def save_tasks(date, tasks):
+    """
+    Saves tasks to the tasks.json file in the storage folder.
+    """
+    get_default_task_store().save(date, tasks)
+
+
+def load_tasks_range(start, end):
+    """
+    Streams the tasks of every date between start and end (inclusive) in a single pass.
+
+    Args:
+        start (str): The first date key (YYYY-MM-DD).
+        end (str): The last date key (YYYY-MM-DD).
+
+    Returns:
+        generator: Yields (date, tasks) pairs in date order, skipping dates without tasks.
+    """
+    return get_default_task_store().iter_range(start, end)
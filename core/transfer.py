@@ -0,0 +1,354 @@
+# core/transfer.py
+"""
+Streaming import and export of tasks and notes, used by the command-line tool (cli.py).
+Does not depend on Qt.
+
+Readers and writers work one record at a time, so memory use does not grow with the size
+of the file; imports are applied in batches through the stores' `save_many`.
+
+Task files come in three formats:
+    jsonl  one task per line: {"date": "2025-02-03", "text": "Read ch. 1"}
+    csv    a header row "date,text", then one task per row
+    json   the tasks.json layout: {"2025-02-03": ["Read ch. 1", "Quiz"], ...}
+Note files are jsonl ({"notebook": "Math", "title": "...", "body": "..."}) or csv with
+the columns notebook, title and body.
+"""
+import csv
+import json
+from datetime import date as Date
+
+from core import notes as notes_api
+from models.records import Task
+
+TASK_FORMATS = ("jsonl", "csv", "json")
+NOTE_FORMATS = ("jsonl", "csv")
+
+# Number of tasks (or notes) read before a batch is written to the store.
+DEFAULT_BATCH_SIZE = 5000
+
+# Characters read at a time when streaming a JSON object.
+JSON_CHUNK_SIZE = 1 << 16
+
+
+class TransferError(ValueError):
+    """
+    Raised for malformed input, with the line (or entry) it was found at.
+    """
+
+
+def guess_format(path, default="jsonl"):
+    """
+    Returns the format implied by a file name's extension, or `default`.
+    """
+    extension = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+    return extension if extension in TASK_FORMATS else default
+
+def check_date(value, where):
+    """
+    Returns `value` if it is a YYYY-MM-DD date key, raising TransferError otherwise.
+    """
+    try:
+        Date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise TransferError(f"{where}: invalid date {value!r}") from None
+    if len(value) != 10:
+        raise TransferError(f"{where}: invalid date {value!r}")
+    return value
+
+def iter_json_object(file, chunk_size=JSON_CHUNK_SIZE):
+    """
+    Yields the (key, value) pairs of a JSON object read from `file`, one at a time.
+
+    Only one member is held in memory at a time, so files larger than memory can be read
+    as long as no single value is.
+
+    Raises:
+        TransferError: If the file is not a JSON object.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    at_end = False
+
+    def read_more():
+        nonlocal buffer, position, at_end
+        chunk = file.read(chunk_size)
+        buffer = buffer[position:] + chunk
+        position = 0
+        at_end = not chunk
+        return not at_end
+
+    def skip_space():
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer) or not read_more():
+                return
+
+    def expect(characters):
+        nonlocal position
+        skip_space()
+        if position >= len(buffer) or buffer[position] not in characters:
+            found = buffer[position:position + 20] if position < len(buffer) else "end of file"
+            raise TransferError(f"Expected {' or '.join(characters)} in JSON object, found {found!r}")
+        position += 1
+        return buffer[position - 1]
+
+    def decode():
+        nonlocal position
+        skip_space()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                if at_end or not read_more():
+                    raise TransferError(f"Invalid JSON: {e}") from None
+                continue
+            # A value that ends exactly at the end of the buffer may be cut short (e.g. a number).
+            if end == len(buffer) and not at_end and read_more():
+                continue
+            position = end
+            return value
+
+    expect("{")
+    skip_space()
+    if position < len(buffer) and buffer[position] == "}":
+        return
+    while True:
+        key = decode()
+        if not isinstance(key, str):
+            raise TransferError("Invalid JSON: object keys must be strings")
+        expect(":")
+        yield key, decode()
+        if expect(",}") == "}":
+            return
+
+
+def read_task_records(file, fmt="jsonl"):
+    """
+    Yields (date, Task) pairs from a task file.
+
+    Args:
+        file: A text file object.
+        fmt (str): "jsonl", "csv" or "json".
+
+    Raises:
+        TransferError: If a record is malformed.
+    """
+    if fmt == "jsonl":
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield check_date(record["date"], f"line {number}"), Task(str(record["text"]))
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                raise TransferError(f"line {number}: invalid task record ({e})") from None
+    elif fmt == "csv":
+        for number, row in enumerate(csv.DictReader(file), 2):
+            if row.get("date") is None or row.get("text") is None:
+                raise TransferError(f"line {number}: expected the columns date and text")
+            yield check_date(row["date"], f"line {number}"), Task(row["text"])
+    elif fmt == "json":
+        for date, values in iter_json_object(file):
+            check_date(date, f"entry {date!r}")
+            if not isinstance(values, list):
+                raise TransferError(f"entry {date!r}: expected a list of tasks")
+            for value in values:
+                try:
+                    yield date, Task.coerce(value)
+                except (IndexError, TypeError):
+                    raise TransferError(f"entry {date!r}: invalid task {value!r}") from None
+    else:
+        raise TransferError(f"Unknown task format: {fmt}")
+
+def iter_task_batches(records, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Groups (date, Task) pairs into dictionaries of date -> tasks holding at most
+    `batch_size` tasks each (everything in one batch if `batch_size` is None). Input does
+    not need to be sorted.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    batch = {}
+    count = 0
+    for date, task in records:
+        batch.setdefault(date, []).append(task)
+        count += 1
+        if batch_size is not None and count >= batch_size:
+            yield batch
+            batch, count = {}, 0
+    if batch:
+        yield batch
+
+def import_tasks(store, records, replace=False, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Adds tasks to a store in batches.
+
+    Stores with `append_many` (SQLite) get batches of `batch_size` tasks appended without
+    rewriting what is already stored, and the journal gets one `save_many` per batch, which
+    appends the batch's dates to its log. A store whose `rewrites_file` is set (the plain
+    JSON store) rewrites the whole file on every save, so it gets a single `save_many` call
+    and the input is collected in memory first.
+
+    Args:
+        store: The task store.
+        records (iterable): (date, Task) pairs, e.g. from read_task_records.
+        replace (bool): Replace the tasks already stored for each imported date instead of
+                        appending to them.
+        batch_size (int): The number of tasks per batch.
+
+    Returns:
+        dict: The number of tasks, dates and batches written.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    appends = hasattr(store, "append_many")
+    streams = not getattr(store, "rewrites_file", False)
+    seen = set()  # Dates imported so far; later batches append to them even when replacing.
+    totals = {"tasks": 0, "dates": 0, "batches": 0}
+    for batch in iter_task_batches(records, batch_size if streams else None):
+        replaced, appended = [], []
+        for date, tasks in batch.items():
+            totals["tasks"] += len(tasks)
+            if replace and date not in seen:
+                replaced.append((date, tasks))
+            elif appends:
+                appended.append((date, tasks))
+            else:
+                replaced.append((date, store.load(date) + tasks))
+            seen.add(date)
+        if replaced:
+            store.save_many(replaced)
+        if appended:
+            store.append_many(appended)
+        totals["batches"] += 1
+    totals["dates"] = len(seen)
+    return totals
+
+def write_task_records(file, items, fmt="jsonl"):
+    """
+    Writes (date, tasks) pairs to a task file as they arrive.
+
+    Args:
+        file: A text file object.
+        items (iterable): (date, list of Task) pairs, e.g. from a store's iter_range.
+        fmt (str): "jsonl", "csv" or "json".
+
+    Returns:
+        int: The number of tasks written.
+    """
+    count = 0
+    if fmt == "jsonl":
+        for date, tasks in items:
+            for task in tasks:
+                file.write(json.dumps({"date": date, "text": task.text}) + "\n")
+                count += 1
+    elif fmt == "csv":
+        writer = csv.writer(file)
+        writer.writerow(["date", "text"])
+        for date, tasks in items:
+            for task in tasks:
+                writer.writerow([date, task.text])
+                count += 1
+    elif fmt == "json":
+        file.write("{")
+        separator = "\n"
+        for date, tasks in items:
+            file.write(f"{separator}    {json.dumps(date)}: {json.dumps([task.to_json() for task in tasks])}")
+            separator = ",\n"
+            count += len(tasks)
+        file.write("\n}\n")
+    else:
+        raise TransferError(f"Unknown task format: {fmt}")
+    return count
+
+
+def read_note_records(file, fmt="jsonl"):
+    """
+    Yields note records ({"notebook", "title", "body"}) from a note file.
+
+    Raises:
+        TransferError: If a record is malformed.
+    """
+    if fmt == "jsonl":
+        rows = (json.loads(line) for line in file if line.strip())
+    elif fmt == "csv":
+        rows = csv.DictReader(file)
+    else:
+        raise TransferError(f"Unknown note format: {fmt}")
+    try:
+        for number, row in enumerate(rows, 1):
+            if not isinstance(row, dict) or not row.get("notebook"):
+                raise TransferError(f"record {number}: every note needs a notebook")
+            yield {"notebook": str(row["notebook"]), "title": str(row.get("title") or ""), "body": str(row.get("body") or "")}
+    except json.JSONDecodeError as e:
+        raise TransferError(f"Invalid note record: {e}") from None
+
+def write_note_records(file, notes, fmt="jsonl"):
+    """
+    Writes note records ({"notebook", "title", "body"}) as they arrive.
+
+    Returns:
+        int: The number of notes written.
+    """
+    count = 0
+    if fmt == "jsonl":
+        for note in notes:
+            file.write(json.dumps(note) + "\n")
+            count += 1
+    elif fmt == "csv":
+        writer = csv.DictWriter(file, ["notebook", "title", "body"])
+        writer.writeheader()
+        for note in notes:
+            writer.writerow(note)
+            count += 1
+    else:
+        raise TransferError(f"Unknown note format: {fmt}")
+    return count
+
+def import_notes(records, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Adds notes in batches, creating notebooks by name as needed. Each batch adds the notes
+    of each notebook it touches in one call; the queued metadata is written before returning.
+
+    Args:
+        records (iterable): Note records, e.g. from read_note_records.
+        batch_size (int): The number of notes per batch.
+
+    Returns:
+        dict: The number of notes imported and notebooks created.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    notebook_ids = {notebook.name: notebook_id for notebook_id, notebook in notes_api.get_notebooks().items()}
+    totals = {"notes": 0, "notebooks": 0}
+    batch = {}
+    count = 0
+
+    def flush():
+        for name, notes in batch.items():
+            if name not in notebook_ids:
+                notebook_ids[name] = notes_api.add_notebook(name)
+                totals["notebooks"] += 1
+            notes_api.add_notes(notebook_ids[name], notes)
+            totals["notes"] += len(notes)
+        batch.clear()
+
+    for record in records:
+        batch.setdefault(record["notebook"], []).append(record)
+        count += 1
+        if count % batch_size == 0:
+            flush()
+    flush()
+    notes_api.flush_notes()
+    return totals
+
+def iter_notes():
+    """
+    Yields every note as a record ({"notebook", "title", "body"}), reading bodies one at a time.
+    """
+    for notebook in list(notes_api.get_notebooks().values()):
+        for note in list(notebook.notes.values()):
+            yield {"notebook": notebook.name, "title": note.title, "body": notes_api.get_note_body(note.id)}
@@ -0,0 +1,118 @@
+# core/write_queue.py
+import threading
+import time
+
+
+class WriteQueue:
+    """
+    Writes task saves to a store on a worker thread. Does not depend on Qt.
+
+    Saves are recorded as dirty dates; repeated saves of the same date within the
+    debounce window collapse into a single write of the latest tasks. The worker waits
+    until no save has arrived for `delay_ms`, then writes the batch and reports each date
+    through `on_saved(date)` or `on_failed(date, message)`, called on the worker thread.
+    """
+
+    def __init__(self, store, delay_ms=300, on_saved=None, on_failed=None):
+        """
+        Initializes the queue and starts its worker thread.
+
+        Args:
+            store: The task store to write to.
+            delay_ms (int): How long to wait for further saves before writing.
+            on_saved (callable, optional): Called as on_saved(date) after a date is written.
+            on_failed (callable, optional): Called as on_failed(date, message) when a write fails.
+        """
+        self.store = store
+        self.delay = delay_ms / 1000
+        self.on_saved = on_saved
+        self.on_failed = on_failed
+        self._pending = {}   # Dirty dates waiting for the debounce delay.
+        self._writing = {}   # Dates handed to the worker but not written yet.
+        self._condition = threading.Condition()
+        self._deadline = None  # When the pending dates are due, or None if nothing is pending.
+        self._stopped = False
+        self._worker = threading.Thread(target=self._run, name="task-persistence", daemon=True)
+        self._worker.start()
+
+    def submit(self, date, tasks):
+        """
+        Marks a date as dirty and restarts the debounce delay.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+            tasks (list): The tasks to store for that date.
+        """
+        with self._condition:
+            self._pending[date] = list(tasks)
+            self._deadline = time.monotonic() + self.delay
+            self._condition.notify_all()
+
+    def pending(self, date):
+        """
+        Returns the tasks queued for a date that have not been written yet.
+
+        Args:
+            date (str): The date key (YYYY-MM-DD).
+
+        Returns:
+            list or None: The queued tasks, or None if nothing is pending for that date.
+        """
+        with self._condition:
+            tasks = self._pending.get(date, self._writing.get(date))
+            return list(tasks) if tasks is not None else None
+
+    def flush(self):
+        """
+        Writes every pending date and blocks until the worker is done.
+        """
+        with self._condition:
+            if self._pending:
+                self._deadline = time.monotonic()
+            self._condition.notify_all()
+            while (self._pending or self._writing) and self._worker.is_alive():
+                self._condition.wait()
+
+    def close(self):
+        """
+        Flushes pending saves and stops the worker thread.
+        """
+        self.flush()
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._worker.join()
+
+    def _run(self):
+        """
+        Worker loop: waits for the debounce deadline, then writes the current batch of dirty dates.
+        """
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._deadline is None:
+                        self._condition.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._stopped and not self._pending:
+                    return
+                self._deadline = None
+                self._writing, self._pending = self._pending, {}
+                batch = self._writing
+
+            for date, tasks in batch.items():
+                try:
+                    self.store.save(date, tasks)
+                except Exception as e:
+                    if self.on_failed is not None:
+                        self.on_failed(date, str(e))
+                else:
+                    if self.on_saved is not None:
+                        self.on_saved(date)
+
+            with self._condition:
+                self._writing = {}
+                self._condition.notify_all()
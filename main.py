@@ -1,10 +1,22 @@
 import sys
+from utils.startup_profiler import StartupProfiler, startup_profile_mode
+
+# With --profile-startup, timing starts before anything else is imported (see run()).
+PROFILE_MODE = startup_profile_mode(sys.argv) if __name__ == '__main__' else None
+startup_profiler = StartupProfiler.start() if PROFILE_MODE else None
+
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
 from PyQt5.QtCore import Qt
-from utils.resource_loader import load_stylesheet  # Utility for loading stylesheets
+from utils.style_engine import apply_styles  # Compiles the application style sheet
+from utils.resource_loader import preload_images
 import config  # Application configuration constants
 from components.floating_control import FloatingControl  # Import the floating control widget
 from components.custom_title_bar import CustomTitleBar  # Import the custom title bar widget
+from utils.persistence_queue import flush_all as flush_persistence_queues
+from utils.navigation import NavigationStack
+from utils.config_manager import get_config
+from core.log import configure_logging
+from utils.startup_profiler import on_first_paint, write_report
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -19,19 +31,8 @@ class MainWindow(QMainWindow):
 
         # Create the central widget with a glossy, transparent gradient style.
         self.central_widget = QWidget(self)
-        self.central_widget.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(
-                    x1: 0, y1: 0,
-                    x2: 0, y2: 1,
-                    stop: 0 rgba(255, 245, 230, 200),  /* Very light tan (almost white) with transparency */
-                    stop: 0.5 rgba(255, 245, 230, 150),  /* Very light tan (almost white) with transparency */
-                    stop: 1 rgba(255, 245, 230, 100)  /* Very light tan (almost white) with transparency */
-                );
-                border: 1px solid rgba(255, 255, 255, 100);
-                border-radius: 10px;
-            }
-        """)
+        # Its gradient comes from the "window" rules of the application style sheet (utils/style_engine.py).
+        self.central_widget.setObjectName("CentralWidget")
         self.setCentralWidget(self.central_widget)
 
         # Create a layout for hosting our views without extra padding.
@@ -46,8 +47,11 @@ class MainWindow(QMainWindow):
         # Connect the close signal from the title bar to the close method
         self.title_bar.close_signal.connect(self.close)
 
-        # Maintain a history of views for navigation.
-        self.view_history = []
+        # Bounded history of views for navigation; older entries are kept as state snapshots.
+        self.navigation = NavigationStack(
+            depth=get_config("NAVIGATION_DEPTH", 20),
+            live_entries=get_config("NAVIGATION_LIVE_ENTRIES", 2),
+        )
         self.load_dashboard_view()
 
         # Create and add the floating control widget. It remains visible on all screens.
@@ -64,6 +68,14 @@ class MainWindow(QMainWindow):
         self.update_floating_control_position()
         super().resizeEvent(event)
 
+    def closeEvent(self, event):
+        """
+        Writes the open note and any task saves still waiting in the background queue
+        before the window closes.
+        """
+        flush_persistence_queues()
+        super().closeEvent(event)
+
     def update_floating_control_position(self):
         """
         Update the position of the floating control widget based on the window size.
@@ -95,54 +107,156 @@ class MainWindow(QMainWindow):
         """
         Creates and displays the Dashboard view.
         """
-        if self.layout.count() > 1:  # Check if there's more than just the title bar
-            current_view = self.layout.itemAt(1).widget()
-            self.view_history.append(current_view)
-            current_view.deleteLater()
-        from views.dashboard_view import DashboardView  # Import here to avoid circular dependencies.
-        self.dashboard_view = DashboardView(self)
-        self.layout.addWidget(self.dashboard_view)
+        self.navigate_to(self.build_view({"view": "dashboard"}))
+
+    def build_view(self, state):
+        """
+        Creates a top-level view from a state snapshot taken by its `view_state()`.
+
+        Args:
+            state (dict): The snapshot; its "view" key names the view type.
+
+        Returns:
+            QWidget or None: The rebuilt view, or None if the view type is unknown.
+        """
+        # Imported here to avoid circular dependencies, and only when that view is first built.
+        view_type = state.get("view")
+        if view_type == "dashboard":
+            from views.dashboard_view import DashboardView
+            view = self.dashboard_view = DashboardView(self)
+        elif view_type == "calendar":
+            from controllers.calendar_controller import CalendarController
+            view = CalendarController(self)
+        elif view_type == "notes":
+            from views.notes_view import NotesView
+            view = NotesView(self)
+        else:
+            return None
+        if len(state) > 1 and hasattr(view, "restore_state"):
+            view.restore_state(state)
+        return view
+
+    def current_view(self):
+        """
+        Returns the view below the title bar, or None.
+        """
+        item = self.layout.itemAt(1)
+        return item.widget() if item is not None else None
 
     def navigate_to(self, view_widget):
         """
-        Switches from the current view to a new view.
+        Switches from the current view to a new view, recording the current one in the history.
 
         Args:
             view_widget (QWidget): The new view widget to display.
         """
-        if self.layout.count() > 1:  # Check if there's more than just the title bar
-            current_view = self.layout.itemAt(1).widget()
-            self.view_history.append(current_view)
+        current_view = self.current_view()
+        if current_view is not None:
             current_view.hide()
             self.layout.removeWidget(current_view)
+            self.navigation.push(current_view)
         self.layout.addWidget(view_widget)
         view_widget.show()
+
+    def go_back(self):
+        """
+        Returns to the previous view, rebuilding it from its snapshot if it was evicted.
+        The view being left is deleted. A dashboard snapshot recorded by a section change
+        is restored on the dashboard already on screen.
+
+        Returns:
+            bool: True if there was a view to go back to.
+        """
+        while True:
+            entry = self.navigation.pop()
+            if entry is None:
+                return False
+            widget, state = entry
+            if widget is None and state.get("view") == "dashboard" and self.current_view() is self.dashboard_view:
+                self.dashboard_view.restore_state(state)
+                return True
+            previous_view = widget if widget is not None else self.build_view(state)
+            if previous_view is not None:
+                break
+        current_view = self.current_view()
+        if current_view is not None:
+            self.layout.removeWidget(current_view)
+            current_view.hide()  # Lets the view save its state (e.g. the open note) first.
+            current_view.deleteLater()
+        from views.dashboard_view import DashboardView  # Import here to avoid circular dependencies.
+        if isinstance(previous_view, DashboardView):
+            self.dashboard_view = previous_view
+        self.layout.addWidget(previous_view)
+        previous_view.show()
+        return True
         
+    def open_section(self, section):
+        """
+        Opens a dashboard section, recording the one it replaces in the navigation history
+        so go_back can return to it.
+
+        Args:
+            section (str): "calendar", "notes" or "home".
+        """
+        dashboard = self.dashboard_view
+        if dashboard.current_section == section:
+            return
+        state = dashboard.view_state()
+        if dashboard.show_section(section):
+            self.navigation.push_state(state)
+
     def show_calendar(self):
         """
         Displays the Calendar view in the right section.
         """
-        self.dashboard_view.show_calendar()
+        self.open_section("calendar")
 
     def show_notes(self):
         """
         Displays the Notes view in the right section.
         """
-        self.dashboard_view.show_notes()
+        self.open_section("notes")
         
     def go_home(self):
         """
         Resets the view to the dashboard home.
         """
-        self.dashboard_view.go_back()  # Assuming `go_back` resets the view to the home screen.
+        self.open_section("home")
             
-if __name__ == '__main__':
+def run(profiler=None, profile_mode=None):
+    """
+    Starts the application. With a profiler, each startup phase is marked and the
+    report is written to stderr once the window has painted, after which the app exits.
+    """
+    def mark(phase):
+        if profiler is not None:
+            profiler.mark(phase)
+
+    mark("import")
     app = QApplication(sys.argv)
-    
-    # Optionally, load an external stylesheet if needed.
-    stylesheet = load_stylesheet("resources/styles.css")
-    app.setStyleSheet(stylesheet)
-    
+    mark("QApplication")
+
+    # Log records go to app.log; the file is only created when something is logged.
+    configure_logging()
+
+    # Compile every style rule into one application style sheet, parsed once.
+    apply_styles(app)
+    mark("stylesheet")
+
+    # Decode the known icons in the background while the window is built.
+    preload_images()
+
     window = MainWindow()
+    mark("main window")
+    if profiler is not None:
+        def report():
+            mark("first paint")
+            profiler.stop_tracing()
+            write_report(profiler, profile_mode)
+            app.quit()
+        on_first_paint(window, report)
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    return app.exec_()
+
+if __name__ == '__main__':
+    sys.exit(run(startup_profiler, PROFILE_MODE))
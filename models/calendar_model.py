@@ -1,44 +1,170 @@
 # models/calendar_model.py
+import heapq
+from dataclasses import replace
+from datetime import timedelta
+from operator import attrgetter
+
+from models.interval_index import IntervalIndex
+from models.records import Event
+
+# How far ahead a repeating event without an end is checked for conflicts.
+CONFLICT_HORIZON = timedelta(days=366)
 
 class CalendarModel:
-    # In‑memory list to store event dictionaries.
-    _events = []
+    # Events keyed by their stable ID, and an interval index over the time each one spans.
+    # A repeating event is stored once and spans from its first to its last occurrence.
+    _events = {}
+    _index = IntervalIndex()
+    _next_event_id = 1
 
     @classmethod
     def get_events(cls):
         """
-        Returns the current list of calendar events.
-        
+        Returns every calendar event. Repeating events appear once, as their first occurrence.
+
+        Returns:
+            list: The events, ordered by start time.
+        """
+        return list(cls._index)
+
+    @classmethod
+    def get_event(cls, event_id):
+        """
+        Looks up an event by its ID.
+
+        Args:
+            event_id (int): The event’s ID.
+
+        Returns:
+            Event or None: The event, or None if not found.
+        """
+        return cls._events.get(event_id)
+
+    @classmethod
+    def add_event(cls, event_data, allow_conflicts=True):
+        """
+        Adds a new event to the calendar and gives it a stable ID.
+
+        Args:
+            event_data (dict): Event details: "title", "start" and "end" (datetimes or ISO
+                               strings), an optional "location" and an optional
+                               "recurrence" (a RecurrenceRule or its JSON form).
+            allow_conflicts (bool): If False, the event is only added when none of its
+                                    occurrences overlaps an existing event. Repeating events
+                                    without an end are checked up to CONFLICT_HORIZON ahead.
+
         Returns:
-            list: The list of events.
+            Event or None: The event that was added, or None if it was rejected as a conflict.
+
+        Raises:
+            ValueError: If the event ends before it starts or its recurrence rule is invalid.
         """
-        return cls._events
+        event = Event.from_json(cls._next_event_id, event_data)
+        if event.end < event.start:
+            raise ValueError("Event end must not be before its start")
+        if not allow_conflicts and cls._conflicts_with(event):
+            return None
+        cls._index.add(event.id, event.start, event.span_end(), event)
+        cls._events[event.id] = event
+        cls._next_event_id += 1
+        return event
 
     @classmethod
-    def add_event(cls, event_data):
+    def remove_event(cls, event_id):
         """
-        Appends a new event to the calendar.
-        
+        Removes an event by its ID.
+
         Args:
-            event_data (dict): Dictionary containing event details.
-        
+            event_id (int): The event’s ID.
+
         Returns:
-            dict: The event data that was added.
+            Event or None: The removed event, or None if the ID is unknown.
         """
-        cls._events.append(event_data)
-        return event_data
+        event = cls._events.pop(event_id, None)
+        if event is not None:
+            cls._index.remove(event_id)
+        return event
 
     @classmethod
-    def remove_event(cls, event_index):
+    def add_exception(cls, event_id, day):
         """
-        Removes an event by its index.
-        
+        Skips one occurrence of a repeating event.
+
         Args:
-            event_index (int): The index position of the event in the list.
-        
+            event_id (int): The event’s ID.
+            day (date): The date of the occurrence to skip.
+
         Returns:
-            dict or None: The removed event, or None if the index is invalid.
+            Event or None: The updated event, or None if it is unknown or does not repeat.
+        """
+        event = cls._events.get(event_id)
+        if event is None or event.recurrence is None:
+            return None
+        event = replace(event, recurrence=event.recurrence.with_exception(day))
+        cls._index.add(event.id, event.start, event.span_end(), event)
+        cls._events[event_id] = event
+        return event
+
+    @classmethod
+    def iter_events_between(cls, start, end):
+        """
+        Yields the events overlapping [start, end), ordered by start time.
+
+        Repeating events are expanded lazily into one Event per occurrence in the range,
+        so the cost depends on what is visible rather than on how long a series runs.
+
+        Args:
+            start (datetime): The start of the range.
+            end (datetime): The end of the range (exclusive).
+        """
+        series = [event.occurrences(start, end) for event in cls._index.overlapping(start, end)]
+        return heapq.merge(*series, key=attrgetter("start"))
+
+    @classmethod
+    def get_events_between(cls, start, end):
+        """
+        Returns the events overlapping [start, end), ordered by start time.
+
+        Args:
+            start (datetime): The start of the range.
+            end (datetime): The end of the range (exclusive).
+
+        Returns:
+            list: The matching events.
+        """
+        return list(cls.iter_events_between(start, end))
+
+    @classmethod
+    def find_conflicts(cls, start, end, exclude_id=None):
+        """
+        Returns the events that overlap a proposed time slot.
+
+        Args:
+            start (datetime): The start of the slot.
+            end (datetime): The end of the slot (exclusive).
+            exclude_id (int, optional): An event to ignore, e.g. the one being rescheduled.
+
+        Returns:
+            list: The overlapping events, ordered by start time.
+        """
+        return [event for event in cls.iter_events_between(start, end) if event.id != exclude_id]
+
+    @classmethod
+    def has_conflict(cls, start, end, exclude_id=None):
+        """
+        Returns True if any event overlaps a proposed time slot.
+        Stops at the first overlapping event instead of collecting them all.
+        """
+        overlapping = (event for event in cls.iter_events_between(start, end) if event.id != exclude_id)
+        return next(overlapping, None) is not None
+
+    @classmethod
+    def _conflicts_with(cls, event):
+        """
+        Returns True if any occurrence of a new event overlaps an existing event.
         """
-        if 0 <= event_index < len(cls._events):
-            return cls._events.pop(event_index)
-        return None
+        if event.recurrence is None:
+            return cls.has_conflict(event.start, event.end)
+        # Include an occurrence starting exactly at the horizon.
+        horizon = min(event.span_end(), event.start + CONFLICT_HORIZON) + timedelta.resolution
+        return any(cls.has_conflict(occurrence.start, occurrence.end) for occurrence in event.occurrences(event.start, horizon))
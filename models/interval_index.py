@@ -0,0 +1,189 @@
+# models/interval_index.py
+import random
+
+
+class _Node:
+    __slots__ = ("key", "start", "end", "value", "priority", "left", "right", "max_end")
+
+    def __init__(self, key, start, end, value):
+        self.key = key
+        self.start = start
+        self.end = end
+        self.value = value
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.max_end = end
+
+
+def _update(node):
+    max_end = node.end
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+
+
+def _split(node, key):
+    """
+    Splits a subtree into the nodes ordered before `key` and the rest.
+    """
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    """
+    Joins two subtrees where every key in `left` orders before every key in `right`.
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _insert(node, new):
+    if node is None:
+        return new
+    if new.priority > node.priority:
+        new.left, new.right = _split(node, new.key)
+        _update(new)
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    _update(node)
+    return node
+
+
+def _delete(node, key):
+    if node is None:
+        return None
+    if key == node.key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    else:
+        node.right = _delete(node.right, key)
+    _update(node)
+    return node
+
+
+class IntervalIndex:
+    """
+    Index of half-open intervals [start, end) identified by unique ids.
+
+    Intervals live in a treap (a randomized balanced search tree) ordered by (start, id),
+    where every node also records the largest end in its subtree. Inserting and removing
+    take O(log n) expected time. An overlap query skips every subtree whose intervals all
+    end before the query starts, and stops at the first start past the query's end, so it
+    only walks the paths leading to matching intervals instead of scanning them all.
+
+    A zero-length interval (start == end) marks a point in time and overlaps a query when
+    start <= point < end.
+    """
+
+    def __init__(self):
+        self._root = None
+        self._keys = {}  # id -> (start, id), the node key used for removal.
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, item_id):
+        return item_id in self._keys
+
+    def add(self, item_id, start, end, value=None):
+        """
+        Adds an interval, replacing any previous interval with the same id.
+
+        Args:
+            item_id: The interval's unique, orderable id.
+            start: The interval's start.
+            end: The interval's end (exclusive); must not be before `start`.
+            value: Data returned by queries; defaults to the id.
+
+        Raises:
+            ValueError: If `end` is before `start`.
+        """
+        if end < start:
+            raise ValueError("Interval end must not be before its start")
+        self.remove(item_id)
+        key = (start, item_id)
+        self._root = _insert(self._root, _Node(key, start, end, item_id if value is None else value))
+        self._keys[item_id] = key
+
+    def remove(self, item_id):
+        """
+        Removes an interval by id.
+
+        Returns:
+            bool: True if the interval was indexed.
+        """
+        key = self._keys.pop(item_id, None)
+        if key is None:
+            return False
+        self._root = _delete(self._root, key)
+        return True
+
+    def clear(self):
+        """
+        Removes every interval.
+        """
+        self._root = None
+        self._keys.clear()
+
+    def __iter__(self):
+        """
+        Yields every value in start order.
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def overlapping(self, start, end):
+        """
+        Yields the values of intervals overlapping [start, end), ordered by start.
+
+        Args:
+            start: The query start.
+            end: The query end (exclusive).
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            # Walk left while the subtree can still hold intervals ending after `start`.
+            while node is not None and node.max_end >= start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.start >= end:
+                # Every remaining node starts at or after this one.
+                return
+            if node.end > start or node.start >= start:
+                yield node.value
+            node = node.right
@@ -0,0 +1,260 @@
+# models/note_store.py
+import json
+import logging
+import os
+
+from models.records import Note, Notebook
+from core.lru_cache import ByteLRUCache
+from core.task_journal import DEFAULT_COMPACT_THRESHOLD, encode_record, read_records
+
+logger = logging.getLogger(__name__)
+
+# Default byte budget for note bodies kept in memory.
+DEFAULT_BODY_CACHE_BYTES = 8 * 1024 * 1024
+
+# Key of the metadata record holding the next notebook and note IDs.
+NEXT_IDS_KEY = "next_ids"
+
+
+def notebook_record(notebook_id, notebook=None):
+    """
+    Returns the metadata record of a notebook, or of its removal when `notebook` is None.
+
+    Returns:
+        tuple: (key, record) as accepted by NoteStore.save. The record is [name], or []
+               for a removed notebook.
+    """
+    return f"notebook:{notebook_id}", [notebook.name] if notebook is not None else []
+
+def note_record(note_id, note=None):
+    """
+    Returns the metadata record of a note, or of its removal when `note` is None.
+
+    Returns:
+        tuple: (key, record) as accepted by NoteStore.save. The record is
+               [notebook ID, title], or [] for a removed note.
+    """
+    return f"note:{note_id}", [note.notebook_id, note.title] if note is not None else []
+
+def next_ids_record(next_notebook_id, next_note_id):
+    """
+    Returns the metadata record of the next notebook and note IDs to hand out.
+    """
+    return NEXT_IDS_KEY, [next_notebook_id, next_note_id]
+
+
+class NoteStore:
+    """
+    On-disk storage for notebooks and notes.
+
+    Notebook and note metadata live in `index.json` and are loaded eagerly. Changes are
+    not written by rewriting that file: each one appends a small record for the notebook
+    or note it touches to `index.log` (framed like the task journal, see
+    core/task_journal.py), and once the log passes `compact_threshold` bytes it is folded
+    back into index.json. Startup reads index.json and then replays the log.
+
+    Every note body is a separate file under `bodies/` that is only read when the note is
+    opened. Recently opened bodies are kept in an LRU cache bounded by total byte size, so
+    memory use depends on what the student opens rather than on how many notes exist.
+    """
+
+    def __init__(self, folder, cache_bytes=DEFAULT_BODY_CACHE_BYTES, compact_threshold=DEFAULT_COMPACT_THRESHOLD):
+        """
+        Initializes the store.
+
+        Args:
+            folder (str): The folder holding index.json, index.log and the bodies folder.
+            cache_bytes (int): The byte budget of the body cache.
+            compact_threshold (int): Log size in bytes at which the log is folded into index.json.
+        """
+        self.folder = folder
+        self.index_path = os.path.join(folder, "index.json")
+        self.log_path = os.path.join(folder, "index.log")
+        self.bodies_folder = os.path.join(folder, "bodies")
+        self.body_cache = ByteLRUCache(cache_bytes)
+        self.compact_threshold = compact_threshold
+        # The saved metadata, kept so compaction does not need the model:
+        # {notebook ID: name}, {note ID: [notebook ID, title]} and [next notebook ID, next note ID].
+        self._notebooks = {}
+        self._notes = {}
+        self._next_ids = [1, 1]
+        self._log_file = None
+        self._log_size = 0
+
+    def load_index(self):
+        """
+        Reads the notebook and note metadata from index.json and index.log.
+
+        A torn record at the end of the log, left by a crash, is dropped.
+
+        Returns:
+            dict: {"notebooks": {id: Notebook}, "next_notebook_id": int, "next_note_id": int},
+                  with integer IDs.
+        """
+        self._notebooks, self._notes, self._next_ids = {}, {}, [1, 1]
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                raw = json.load(file)
+            # JSON object keys are strings; the models use integer IDs.
+            for notebook_id, notebook in raw["notebooks"].items():
+                self._notebooks[int(notebook_id)] = notebook["name"]
+                for note_id, note in notebook["notes"].items():
+                    self._notes[int(note_id)] = [int(notebook_id), note.get("title", "")]
+            self._next_ids = [raw["next_notebook_id"], raw["next_note_id"]]
+
+        records, valid_length = read_records(self.log_path)
+        for key, record in records:
+            self._apply(key, record)
+        self._log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        if self._log_size > valid_length:
+            logger.warning("Dropping %d bytes of incomplete notes index data from %s",
+                           self._log_size - valid_length, self.log_path)
+            with open(self.log_path, "r+b") as file:
+                file.truncate(valid_length)
+            self._log_size = valid_length
+
+        notebooks = {notebook_id: Notebook(notebook_id, name) for notebook_id, name in self._notebooks.items()}
+        for note_id, (notebook_id, title) in self._notes.items():
+            # Notes of a removed notebook are skipped even if their own removals were not written.
+            if notebook_id in notebooks:
+                notebooks[notebook_id].notes[note_id] = Note(note_id, notebook_id, title)
+        # Records are written in batches, so an ID counter can lag behind the IDs it handed out.
+        next_notebook_id = max(self._next_ids[0], max(notebooks, default=0) + 1)
+        next_note_id = max(self._next_ids[1], max(self._notes, default=0) + 1)
+        return {"notebooks": notebooks, "next_notebook_id": next_notebook_id, "next_note_id": next_note_id}
+
+    def _apply(self, key, record):
+        """
+        Applies one metadata record to the saved metadata.
+        """
+        if key == NEXT_IDS_KEY:
+            self._next_ids = list(record)
+            return
+        kind, _, item_id = key.partition(":")
+        item_id = int(item_id)
+        if kind == "notebook":
+            if record:
+                self._notebooks[item_id] = record[0]
+            else:
+                self._notebooks.pop(item_id, None)
+        elif record:
+            self._notes[item_id] = list(record)
+        else:
+            self._notes.pop(item_id, None)
+
+    def save(self, key, record):
+        """
+        Appends one metadata record to the log, folding the log into index.json once it
+        passes the compaction threshold. Records come from notebook_record, note_record
+        and next_ids_record, so the store can be the target of a core.write_queue.WriteQueue.
+
+        Args:
+            key (str): The record key.
+            record (list): The record.
+        """
+        self._apply(key, record)
+        data = encode_record(key, record)
+        if self._log_file is None:
+            os.makedirs(self.folder, exist_ok=True)
+            self._log_file = open(self.log_path, "ab")
+        self._log_file.write(data)
+        self._log_file.flush()
+        self._log_size += len(data)
+        if self._log_size >= self.compact_threshold:
+            self.compact()
+
+    def compact(self):
+        """
+        Atomically rewrites index.json from the saved metadata and empties the log.
+        """
+        notebooks = {notebook_id: {"name": name, "notes": {}} for notebook_id, name in self._notebooks.items()}
+        for note_id, (notebook_id, title) in self._notes.items():
+            if notebook_id in notebooks:
+                notebooks[notebook_id]["notes"][note_id] = {"title": title}
+        os.makedirs(self.folder, exist_ok=True)
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"notebooks": notebooks, "next_notebook_id": self._next_ids[0], "next_note_id": self._next_ids[1]},
+                file,
+                separators=(",", ":"),
+            )
+        os.replace(temp_path, self.index_path)
+        # The snapshot now holds every record, so the log can start over.
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        open(self.log_path, "wb").close()
+        self._log_size = 0
+
+    def close(self):
+        """
+        Closes the log file. Later saves reopen it.
+        """
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def _body_path(self, note_id):
+        return os.path.join(self.bodies_folder, f"{note_id}.html")
+
+    def read_body(self, note_id):
+        """
+        Returns a note's body, from the cache if it was opened recently.
+
+        Args:
+            note_id (int): The note ID.
+
+        Returns:
+            str: The body, or an empty string if the note has none.
+        """
+        body = self.body_cache.get(note_id)
+        if body is not None:
+            return body
+        try:
+            with open(self._body_path(note_id), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return ""
+        body = data.decode("utf-8")
+        self.body_cache.put(note_id, body, len(data))
+        return body
+
+    def read_body_uncached(self, note_id):
+        """
+        Reads a note's body from disk without touching the cache (used for bulk indexing).
+        """
+        cached = self.body_cache.peek(note_id)
+        if cached is not None:
+            return cached
+        try:
+            with open(self._body_path(note_id), "r", encoding="utf-8") as file:
+                return file.read()
+        except FileNotFoundError:
+            return ""
+
+    def write_body(self, note_id, body):
+        """
+        Writes a note's body and refreshes its cache entry.
+
+        Args:
+            note_id (int): The note ID.
+            body (str): The note body.
+        """
+        data = body.encode("utf-8")
+        os.makedirs(self.bodies_folder, exist_ok=True)
+        temp_path = self._body_path(note_id) + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, self._body_path(note_id))
+        self.body_cache.put(note_id, body, len(data))
+
+    def delete_body(self, note_id):
+        """
+        Deletes a note's body file and drops it from the cache.
+        """
+        self.body_cache.pop(note_id)
+        try:
+            os.remove(self._body_path(note_id))
+        except FileNotFoundError:
+            pass
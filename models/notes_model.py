@@ -1,10 +1,130 @@
 # models/notes_model.py
+import threading
+from dataclasses import replace
+
+from core.log import log_error
+from core.write_queue import WriteQueue
+from models.note_store import next_ids_record, note_record, notebook_record
+from models.records import Change, Note, Notebook
+from models.search_index import InvertedIndex, document_text
+
+def note_text(note, body):
+    """
+    Returns the searchable text of a note: its title and body, without markup.
+    """
+    return document_text(note.title) + " " + document_text(body)
 
 class NotesModel:
-    # In‑memory storage for notebooks; each notebook is a dictionary with a name and notes.
+    # In‑memory storage for notebooks, keyed by ID; each is a Notebook record holding its Note records.
     _notebooks = {}
     _next_notebook_id = 1
     _next_note_id = 1
+    # Full-text index over every note, keyed by note ID, and the notebook each note lives in.
+    _search_index = InvertedIndex()
+    _note_notebooks = {}
+    # Guards the model while searches run on a background thread.
+    _lock = threading.RLock()
+    # Notified when _index_stored_notes finishes a chunk.
+    _chunk_indexed = threading.Condition(_lock)
+    # Optional on-disk NoteStore. When set, notes hold metadata only and bodies are loaded on demand.
+    _store = None
+    # Writes metadata records to the store on a worker thread, coalescing repeated changes.
+    _writes = None
+    # Stored notes whose bodies have not been read into the search index yet, and those
+    # whose bodies _index_stored_notes is reading.
+    _unindexed = set()
+    _indexing = set()
+    # Callables receiving a Change after every modification.
+    _listeners = []
+
+    @classmethod
+    def subscribe(cls, listener):
+        """
+        Registers a callable that is called with a Change after every modification.
+        Listeners run synchronously on the modifying thread; batching is up to them.
+
+        Args:
+            listener (callable): Called as listener(change).
+        """
+        cls._listeners.append(listener)
+
+    @classmethod
+    def unsubscribe(cls, listener):
+        """
+        Removes a listener registered with subscribe.
+        """
+        if listener in cls._listeners:
+            cls._listeners.remove(listener)
+
+    @classmethod
+    def _notify(cls, change):
+        for listener in tuple(cls._listeners):
+            listener(change)
+
+    @classmethod
+    def open_store(cls, store, delay_ms=300):
+        """
+        Loads notebook and note metadata from a NoteStore and persists later changes to it.
+        Note bodies stay on disk until they are opened or searched.
+
+        Bodies are written when they change. Metadata changes are queued per notebook and
+        note and written on a worker thread once no change has arrived for `delay_ms`;
+        call flush to write them immediately.
+        
+        Args:
+            store (NoteStore): The store to load from and save to.
+            delay_ms (int): How long to wait for further changes before writing metadata.
+        """
+        if cls._writes is not None:
+            cls._writes.close()
+            cls._writes = None
+            cls._store.close()
+        index = store.load_index()
+        with cls._lock:
+            cls._store = store
+            cls._writes = WriteQueue(store, delay_ms, on_failed=cls._log_failed_write)
+            cls._notebooks = index["notebooks"]
+            cls._next_notebook_id = index["next_notebook_id"]
+            cls._next_note_id = index["next_note_id"]
+            cls._search_index = InvertedIndex()
+            cls._note_notebooks = {
+                note_id: notebook_id
+                for notebook_id, notebook in cls._notebooks.items()
+                for note_id in notebook.notes
+            }
+            cls._unindexed = set(cls._note_notebooks)
+            cls._indexing = set()
+            cls._notify(Change("reset"))
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes the queued metadata changes and waits until they are on disk.
+        """
+        if cls._writes is not None:
+            cls._writes.flush()
+
+    @classmethod
+    def _queue_write(cls, key, record):
+        if cls._writes is not None:
+            cls._writes.submit(key, record)
+
+    @classmethod
+    def _save_notebook(cls, notebook_id):
+        cls._queue_write(*notebook_record(notebook_id, cls._notebooks.get(notebook_id)))
+
+    @classmethod
+    def _save_note(cls, note_id):
+        found = cls.find_note(note_id)
+        cls._queue_write(*note_record(note_id, found[1] if found else None))
+
+    @classmethod
+    def _save_next_ids(cls):
+        cls._queue_write(*next_ids_record(cls._next_notebook_id, cls._next_note_id))
+
+    @staticmethod
+    def _log_failed_write(key, message):
+        log_error(f"Could not save the notes index ({key}): {message}")
 
     @classmethod
     def get_notebooks(cls):
@@ -12,7 +132,7 @@ class NotesModel:
         Returns all notebooks.
         
         Returns:
-            dict: Dictionary where keys are notebook IDs and values are notebook data.
+            dict: Dictionary where keys are notebook IDs and values are Notebook records.
         """
         return cls._notebooks
 
@@ -27,11 +147,37 @@ class NotesModel:
         Returns:
             int: The ID of the new notebook.
         """
-        notebook_id = cls._next_notebook_id
-        cls._notebooks[notebook_id] = {"name": name, "notes": {}}
-        cls._next_notebook_id += 1
+        with cls._lock:
+            notebook_id = cls._next_notebook_id
+            cls._notebooks[notebook_id] = Notebook(notebook_id, name)
+            cls._next_notebook_id += 1
+            cls._save_notebook(notebook_id)
+            cls._save_next_ids()
+            cls._notify(Change("inserted", "notebook", notebook_id))
         return notebook_id
 
+    @classmethod
+    def rename_notebook(cls, notebook_id, name):
+        """
+        Renames a notebook.
+        
+        Args:
+            notebook_id (int): The notebook’s ID.
+            name (str): The new name.
+        
+        Returns:
+            bool: True if the notebook exists.
+        """
+        with cls._lock:
+            notebook = cls._notebooks.get(notebook_id)
+            if notebook is None:
+                return False
+            if notebook.name != name:
+                cls._notebooks[notebook_id] = replace(notebook, name=name)
+                cls._save_notebook(notebook_id)
+                cls._notify(Change("renamed", "notebook", notebook_id))
+            return True
+
     @classmethod
     def remove_notebook(cls, notebook_id):
         """
@@ -41,29 +187,87 @@ class NotesModel:
             notebook_id (int): The notebook’s ID.
         
         Returns:
-            dict or None: The removed notebook data, or None if not found.
+            Notebook or None: The removed notebook, or None if not found.
         """
-        return cls._notebooks.pop(notebook_id, None)
+        with cls._lock:
+            notebook = cls._notebooks.pop(notebook_id, None)
+            if notebook is not None:
+                for note_id in notebook.notes:
+                    cls._forget_note(note_id)
+                    cls._save_note(note_id)
+                cls._save_notebook(notebook_id)
+                cls._notify(Change("removed", "notebook", notebook_id))
+        return notebook
 
     @classmethod
     def add_note(cls, notebook_id, note_data):
         """
         Adds a new note to a specified notebook.
+        With a store open, the note's "body" is written to its own file and the Note
+        record kept in memory holds only the title.
         
         Args:
             notebook_id (int): The target notebook’s ID.
-            note_data (dict): The note’s details.
+            note_data (dict): The note’s details ("title" and "body").
         
         Returns:
             int or None: The new note’s ID or None if the notebook does not exist.
         """
-        if notebook_id in cls._notebooks:
-            note_id = cls._next_note_id
-            cls._notebooks[notebook_id]["notes"][note_id] = note_data
-            cls._next_note_id += 1
-            return note_id
+        with cls._lock:
+            if notebook_id in cls._notebooks:
+                note_id = cls._next_note_id
+                body = note_data.get("body", "")
+                note = Note(note_id, notebook_id, note_data.get("title", ""))
+                if cls._store is not None:
+                    cls._store.write_body(note_id, body)
+                else:
+                    note = replace(note, body=body)
+                cls._search_index.add(note_id, note_text(note, body))
+                cls._notebooks[notebook_id].notes[note_id] = note
+                cls._note_notebooks[note_id] = notebook_id
+                cls._next_note_id += 1
+                cls._save_note(note_id)
+                cls._save_next_ids()
+                cls._notify(Change("inserted", "note", note_id, notebook_id))
+                return note_id
         return None
 
+    @classmethod
+    def add_notes(cls, notebook_id, notes_data):
+        """
+        Adds several notes to a notebook, notifying listeners once for the whole batch.
+
+        Args:
+            notebook_id (int): The target notebook’s ID.
+            notes_data (iterable): The notes’ details ("title" and "body").
+
+        Returns:
+            list or None: The new notes’ IDs, or None if the notebook does not exist.
+        """
+        with cls._lock:
+            if notebook_id not in cls._notebooks:
+                return None
+            notes = cls._notebooks[notebook_id].notes
+            note_ids = []
+            for note_data in notes_data:
+                note_id = cls._next_note_id
+                body = note_data.get("body", "")
+                note = Note(note_id, notebook_id, note_data.get("title", ""))
+                if cls._store is not None:
+                    cls._store.write_body(note_id, body)
+                else:
+                    note = replace(note, body=body)
+                cls._search_index.add(note_id, note_text(note, body))
+                notes[note_id] = note
+                cls._note_notebooks[note_id] = notebook_id
+                cls._next_note_id += 1
+                cls._save_note(note_id)
+                note_ids.append(note_id)
+            if note_ids:
+                cls._save_next_ids()
+                cls._notify(Change("reset"))
+            return note_ids
+
     @classmethod
     def remove_note(cls, notebook_id, note_id):
         """
@@ -74,8 +278,189 @@ class NotesModel:
             note_id (int): The note’s ID.
         
         Returns:
-            dict or None: The removed note data, or None if not found.
+            Note or None: The removed note, or None if not found.
         """
-        if notebook_id in cls._notebooks:
-            return cls._notebooks[notebook_id]["notes"].pop(note_id, None)
+        with cls._lock:
+            if notebook_id in cls._notebooks:
+                note = cls._notebooks[notebook_id].notes.pop(note_id, None)
+                if note is not None:
+                    cls._forget_note(note_id)
+                    cls._save_note(note_id)
+                    cls._notify(Change("removed", "note", note_id, notebook_id))
+                return note
         return None
+
+    @classmethod
+    def _forget_note(cls, note_id):
+        """
+        Drops a removed note from the search index, the lookup table and the store.
+        """
+        cls._search_index.remove(note_id)
+        cls._unindexed.discard(note_id)
+        cls._indexing.discard(note_id)
+        cls._note_notebooks.pop(note_id, None)
+        if cls._store is not None:
+            cls._store.delete_body(note_id)
+
+    @classmethod
+    def get_note_body(cls, note_id):
+        """
+        Returns a note's body, reading it from the store (through its cache) if needed.
+        
+        Args:
+            note_id (int): The note’s ID.
+        
+        Returns:
+            str: The body, or an empty string if the note has none.
+        """
+        with cls._lock:
+            if cls._store is not None:
+                return cls._store.read_body(note_id) if note_id in cls._note_notebooks else ""
+            found = cls.find_note(note_id)
+            return (found[1].body or "") if found else ""
+
+    @classmethod
+    def update_note_body(cls, note_id, body, title=None):
+        """
+        Replaces a note's body (and optionally its title) and re-indexes it.
+        
+        Args:
+            note_id (int): The note’s ID.
+            body (str): The new body.
+            title (str, optional): The new title.
+        
+        Returns:
+            bool: True if the note exists.
+        """
+        with cls._lock:
+            found = cls.find_note(note_id)
+            if found is None:
+                return False
+            notebook_id, note = found
+            updated = note if title is None else replace(note, title=title)
+            if cls._store is not None:
+                cls._store.write_body(note_id, body)
+            else:
+                updated = replace(updated, body=body)
+            cls._notebooks[notebook_id].notes[note_id] = updated
+            if updated.title != note.title:
+                cls._save_note(note_id)
+            cls._search_index.add(note_id, note_text(updated, body))
+            cls._unindexed.discard(note_id)
+            cls._indexing.discard(note_id)
+            action = "renamed" if updated.title != note.title else "updated"
+            cls._notify(Change(action, "note", note_id, notebook_id))
+            return True
+
+    @classmethod
+    def _index_stored_notes(cls, chunk_size=200):
+        """
+        Reads the bodies of stored notes that are not in the search index yet.
+        Runs in chunks; the bodies are read without holding the lock, which is only taken
+        to add each chunk to the index. The first search after opening a store pays this
+        cost once.
+
+        A body that cannot be read is logged and skipped, so it is retried by the next search.
+        """
+        failed = set()
+        while True:
+            with cls._lock:
+                if not cls._unindexed:
+                    break
+                chunk = [cls._unindexed.pop() for _ in range(min(chunk_size, len(cls._unindexed)))]
+                cls._indexing.update(chunk)
+                store = cls._store
+            bodies = {}
+            try:
+                for note_id in chunk:
+                    try:
+                        bodies[note_id] = store.read_body_uncached(note_id)
+                    except (OSError, UnicodeDecodeError) as e:
+                        log_error(f"Could not index note {note_id}: {e!r}")
+                        failed.add(note_id)
+            finally:
+                with cls._lock:
+                    for note_id, body in bodies.items():
+                        found = cls.find_note(note_id)
+                        # Notes removed, or edited and re-indexed by update_note_body, meanwhile are left alone.
+                        if found is not None and note_id in cls._indexing:
+                            cls._search_index.add(note_id, note_text(found[1], body))
+                    # Unread notes of a chunk interrupted by another error are read by the next search.
+                    cls._unindexed.update(
+                        note_id for note_id in chunk
+                        if note_id in cls._indexing and note_id not in bodies and note_id not in failed
+                    )
+                    cls._indexing.difference_update(chunk)
+                    cls._chunk_indexed.notify_all()
+        with cls._lock:
+            cls._unindexed.update(note_id for note_id in failed if note_id in cls._note_notebooks)
+            # Chunks taken by another thread (e.g. an earlier search) must be indexed before searching.
+            while cls._indexing:
+                cls._chunk_indexed.wait()
+
+    @classmethod
+    def find_note(cls, note_id):
+        """
+        Looks up a note by its ID.
+
+        Args:
+            note_id (int): The note’s ID.
+
+        Returns:
+            tuple or None: (notebook ID, Note), or None if not found.
+        """
+        with cls._lock:
+            notebook_id = cls._note_notebooks.get(note_id)
+            if notebook_id is None:
+                return None
+            return notebook_id, cls._notebooks[notebook_id].notes[note_id]
+
+    @classmethod
+    def search_notes(cls, query, mode="and", prefix=True, limit=20):
+        """
+        Searches the text of every note.
+
+        Args:
+            query (str): The words to look for. A word ending in `*` matches as a prefix.
+            mode (str): "and" to require every word, "or" to match any of them.
+            prefix (bool): Whether the last word also matches as a prefix (search-as-you-type).
+            limit (int or None): The maximum number of results, or None for all.
+
+        Returns:
+            list: (note ID, score) pairs, best match first.
+        """
+        cls._index_stored_notes()
+        with cls._lock:
+            return cls._search_index.search(query, mode=mode, prefix=prefix, limit=limit)
+
+    @classmethod
+    def iter_search_notes(cls, query, mode="and", first=20, batch_size=200, cancelled=None):
+        """
+        Searches the text of every note and yields the results in batches, best first.
+
+        The first batch holds the top `first` matches and is produced before the rest are
+        ranked. The model is only locked while the first batch is computed; the rest are
+        ranked from term weights captured at that point (see InvertedIndex.iter_search),
+        so notes can be added or edited from the UI thread during the ranking. Notes
+        removed meanwhile may still be listed; find_note returns None for them.
+
+        Args:
+            query (str): The words to look for.
+            mode (str): "and" to require every word, "or" to match any of them.
+            first (int): The size of the first batch.
+            batch_size (int): The size of the following batches.
+            cancelled (callable, optional): Returns True when the search is no longer wanted.
+
+        Yields:
+            list: (note ID, score) pairs.
+        """
+        cls._index_stored_notes()
+        batches = cls._search_index.iter_search(
+            query, mode=mode, first=first, batch_size=batch_size, cancelled=cancelled
+        )
+        with cls._lock:
+            batch = next(batches, None)
+        if batch is None:
+            return
+        yield batch
+        yield from batches
@@ -0,0 +1,164 @@
+# models/records.py
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from models.recurrence import RecurrenceRule
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    """
+    A single task on a calendar date. Stored in JSON as a bare string, the original
+    tasks.json format.
+    """
+    text: str
+
+    def to_json(self):
+        return self.text
+
+    @classmethod
+    def from_json(cls, value):
+        if isinstance(value, str):
+            return cls(value)
+        # A [text, flag] pair keeps only its text.
+        return cls(value[0])
+
+    @classmethod
+    def coerce(cls, value):
+        """
+        Returns `value` as a Task, accepting Task records, plain strings and JSON values.
+        """
+        return value if isinstance(value, cls) else cls.from_json(value)
+
+
+def tasks_from_json(values):
+    """
+    Converts a stored list of JSON task values into Task records.
+    """
+    return [Task.from_json(value) for value in values]
+
+
+def tasks_to_json(tasks):
+    """
+    Converts a list of Task records (or plain strings) into their JSON values.
+    """
+    return [task if isinstance(task, str) else task.to_json() for task in tasks]
+
+
+@dataclass(frozen=True, slots=True)
+class Note:
+    """
+    A note's metadata. The body is kept separately by the NoteStore when one is open,
+    in which case `body` is None.
+    """
+    id: int
+    notebook_id: int
+    title: str = ""
+    body: str | None = None
+
+    def to_json(self):
+        data = {"title": self.title}
+        if self.body is not None:
+            data["body"] = self.body
+        return data
+
+    @classmethod
+    def from_json(cls, note_id, notebook_id, data):
+        return cls(note_id, notebook_id, data.get("title", ""), data.get("body"))
+
+
+@dataclass(frozen=True, slots=True)
+class Notebook:
+    """
+    A notebook and its notes, keyed by note ID.
+    """
+    id: int
+    name: str
+    notes: dict = field(default_factory=dict, compare=False)
+
+    def to_json(self):
+        return {"name": self.name, "notes": {note_id: note.to_json() for note_id, note in self.notes.items()}}
+
+    @classmethod
+    def from_json(cls, notebook_id, data):
+        notes = {
+            int(note_id): Note.from_json(int(note_id), notebook_id, note)
+            for note_id, note in data["notes"].items()
+        }
+        return cls(notebook_id, data["name"], notes)
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """
+    A calendar event spanning [start, end). A repeating event holds its first
+    occurrence and a RecurrenceRule; the other occurrences are generated on demand.
+    """
+    id: int
+    title: str
+    start: datetime
+    end: datetime
+    location: str = ""
+    recurrence: RecurrenceRule | None = None
+
+    def to_json(self):
+        data = {
+            "title": self.title,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "location": self.location,
+        }
+        if self.recurrence is not None:
+            data["recurrence"] = self.recurrence.to_json()
+        return data
+
+    @classmethod
+    def from_json(cls, event_id, data):
+        return cls(
+            event_id,
+            data.get("title", ""),
+            _as_datetime(data["start"]),
+            _as_datetime(data["end"]),
+            data.get("location", ""),
+            RecurrenceRule.coerce(data.get("recurrence")),
+        )
+
+    def span_end(self):
+        """
+        Returns the end of the event's last occurrence, or datetime.max if it repeats forever.
+        """
+        if self.recurrence is None:
+            return self.end
+        last_start = self.recurrence.last_start(self.start)
+        return datetime.max if last_start is None else last_start + (self.end - self.start)
+
+    def occurrences(self, start, end):
+        """
+        Yields the occurrences overlapping [start, end) as Event records sharing this
+        event's ID, in start order. A one-off event yields itself if it overlaps.
+        """
+        if self.recurrence is None:
+            if self.start < end and (self.end > start or self.start >= start):
+                yield self
+            return
+        duration = self.end - self.start
+        for occurrence in self.recurrence.starts_between(self.start, duration, start, end):
+            yield Event(self.id, self.title, occurrence, occurrence + duration, self.location, self.recurrence)
+
+
+def _as_datetime(value):
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """
+    One change to a model, as delivered to its listeners.
+
+    `action` is "inserted", "removed", "renamed", "updated" or "reset"; `kind` is
+    "notebook" or "note" (None for a reset). For a note, `notebook_id` names its notebook.
+    """
+    action: str
+    kind: str | None = None
+    id: int | None = None
+    notebook_id: int | None = None
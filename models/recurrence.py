@@ -0,0 +1,174 @@
+# models/recurrence.py
+import calendar
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+FREQUENCIES = (DAILY, WEEKLY, MONTHLY)
+
+
+def add_months(moment, months, day):
+    """
+    Returns `moment` moved by `months` months onto `day`, clamped to the length of the target month.
+    """
+    month_index = moment.month - 1 + months
+    year = moment.year + month_index // 12
+    month = month_index % 12 + 1
+    return moment.replace(year=year, month=month, day=min(day, calendar.monthrange(year, month)[1]))
+
+
+@dataclass(frozen=True, slots=True)
+class RecurrenceRule:
+    """
+    How an event repeats.
+
+    Occurrences are numbered from 0 and the start of occurrence n is computed directly
+    from the event's first start, so expanding a window never walks the occurrences
+    before it. A monthly rule repeats on the first start's day of the month, moved to the
+    month's last day when the month is shorter. A weekly rule with `weekdays` repeats on
+    those days (0 = Monday) of every `interval`-th week, beginning with the first start's week.
+
+    Excepted dates are skipped but still count towards `count`, as in iCalendar.
+    """
+    frequency: str
+    interval: int = 1
+    until: datetime | None = None   # Last allowed occurrence start, inclusive.
+    count: int | None = None        # Total number of occurrences.
+    weekdays: tuple = ()
+    exceptions: frozenset = frozenset()  # Dates whose occurrence is skipped.
+
+    def __post_init__(self):
+        if self.frequency not in FREQUENCIES:
+            raise ValueError(f"Unknown recurrence frequency: {self.frequency}")
+        if self.interval < 1:
+            raise ValueError("Recurrence interval must be at least 1")
+        if self.count is not None and self.count < 1:
+            raise ValueError("Recurrence count must be at least 1")
+        if self.weekdays and self.frequency != WEEKLY:
+            raise ValueError("Weekdays only apply to weekly recurrence")
+        if any(not 0 <= weekday <= 6 for weekday in self.weekdays):
+            raise ValueError("Weekdays must be between 0 (Monday) and 6 (Sunday)")
+        object.__setattr__(self, "weekdays", tuple(sorted(set(self.weekdays))))
+
+    def to_json(self):
+        data = {"frequency": self.frequency, "interval": self.interval}
+        if self.until is not None:
+            data["until"] = self.until.isoformat()
+        if self.count is not None:
+            data["count"] = self.count
+        if self.weekdays:
+            data["weekdays"] = list(self.weekdays)
+        if self.exceptions:
+            data["exceptions"] = sorted(day.isoformat() for day in self.exceptions)
+        return data
+
+    @classmethod
+    def from_json(cls, data):
+        until = data.get("until")
+        return cls(
+            data["frequency"],
+            data.get("interval", 1),
+            until if until is None or isinstance(until, datetime) else datetime.fromisoformat(until),
+            data.get("count"),
+            tuple(data.get("weekdays", ())),
+            frozenset(day if isinstance(day, date) else date.fromisoformat(day) for day in data.get("exceptions", ())),
+        )
+
+    @classmethod
+    def coerce(cls, value):
+        """
+        Returns `value` as a RecurrenceRule, accepting rules and their JSON form.
+        """
+        return value if value is None or isinstance(value, cls) else cls.from_json(value)
+
+    def with_exception(self, day):
+        """
+        Returns a copy of the rule that skips the occurrence on `day`.
+        """
+        return replace(self, exceptions=self.exceptions | {day})
+
+    def _first_weekly_days(self, first_start):
+        return [weekday for weekday in self.weekdays if weekday >= first_start.weekday()]
+
+    def nth_start(self, first_start, n):
+        """
+        Returns the start of occurrence `n`, ignoring count, until and exceptions.
+        """
+        if self.frequency == DAILY:
+            return first_start + timedelta(days=n * self.interval)
+        if self.frequency == MONTHLY:
+            return add_months(first_start, n * self.interval, first_start.day)
+        if not self.weekdays:
+            return first_start + timedelta(weeks=n * self.interval)
+        first_week = self._first_weekly_days(first_start)
+        if n < len(first_week):
+            week, weekday = 0, first_week[n]
+        else:
+            week, position = divmod(n - len(first_week), len(self.weekdays))
+            week, weekday = week + 1, self.weekdays[position]
+        monday = first_start - timedelta(days=first_start.weekday())
+        return monday + timedelta(days=week * self.interval * 7 + weekday)
+
+    def _lower_index(self, first_start, moment):
+        """
+        Returns an occurrence number whose start is not after `moment` (or 0).
+        """
+        if moment <= first_start:
+            return 0
+        if self.frequency == DAILY:
+            return (moment - first_start) // timedelta(days=self.interval)
+        if self.frequency == MONTHLY:
+            months = (moment.year - first_start.year) * 12 + moment.month - first_start.month
+            return max(0, months // self.interval - 1)
+        if not self.weekdays:
+            return (moment - first_start) // timedelta(weeks=self.interval)
+        monday = first_start - timedelta(days=first_start.weekday())
+        week = (moment - monday) // timedelta(weeks=self.interval)
+        if week == 0:
+            return 0
+        return len(self._first_weekly_days(first_start)) + (week - 1) * len(self.weekdays)
+
+    def index_at_or_after(self, first_start, moment):
+        """
+        Returns the number of the first occurrence starting at or after `moment`.
+        """
+        n = self._lower_index(first_start, moment)
+        while self.nth_start(first_start, n) < moment:
+            n += 1
+        return n
+
+    def last_start(self, first_start):
+        """
+        Returns the latest start any occurrence can have, or None if the rule never ends.
+        """
+        if self.count is not None:
+            last = self.nth_start(first_start, self.count - 1)
+            return last if self.until is None else max(first_start, min(last, self.until))
+        if self.until is not None:
+            n = self.index_at_or_after(first_start, self.until + timedelta(microseconds=1))
+            return self.nth_start(first_start, max(0, n - 1))
+        return None
+
+    def starts_between(self, first_start, duration, start, end):
+        """
+        Yields the starts of the occurrences overlapping [start, end), in order.
+
+        Jumps straight to the first occurrence that can overlap the window, so the cost is
+        proportional to the occurrences in the window rather than to those before it.
+
+        Args:
+            first_start (datetime): The start of the first occurrence.
+            duration (timedelta): The length of every occurrence.
+            start (datetime): The start of the window.
+            end (datetime): The end of the window (exclusive).
+        """
+        n = self.index_at_or_after(first_start, start - duration)
+        while self.count is None or n < self.count:
+            occurrence = self.nth_start(first_start, n)
+            if occurrence >= end or (self.until is not None and occurrence > self.until):
+                return
+            if occurrence.date() not in self.exceptions and (occurrence + duration > start or occurrence >= start):
+                yield occurrence
+            n += 1
@@ -0,0 +1,367 @@
+# models/search_index.py
+import heapq
+import html
+import math
+import re
+from bisect import bisect_left, insort
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_TOKEN_RE = re.compile(r"\w+\*?")
+_MARKUP_RE = re.compile(r"<(head|style)\b.*?</\1>|<[^>]*>", re.IGNORECASE | re.DOTALL)
+
+# Prefix tokens expand to at most this many of their most frequent completions.
+MAX_PREFIX_EXPANSIONS = 64
+
+# BM25 parameters.
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text):
+    """
+    Splits text into case-folded word tokens.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        list: The tokens, in order.
+    """
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def strip_markup(text):
+    """
+    Removes HTML tags (and the head and style blocks QTextEdit emits) from rich text.
+    """
+    if "<" not in text:
+        return text
+    return html.unescape(_MARKUP_RE.sub(" ", text))
+
+
+def document_text(data):
+    """
+    Returns the searchable text of a note: every string value of its dictionary, without markup.
+
+    Args:
+        data (dict or str): The note's details.
+
+    Returns:
+        str: The concatenated text.
+    """
+    if isinstance(data, str):
+        return strip_markup(data)
+    return " ".join(strip_markup(value) for value in data.values() if isinstance(value, str))
+
+
+def _scaled(idf, ordered):
+    """
+    Yields (idf * weight, doc id) for an ordered weight list.
+    """
+    for weight, doc_id in ordered:
+        yield idf * weight, doc_id
+
+
+class InvertedIndex:
+    """
+    Incremental inverted index over documents identified by integer ids.
+
+    Each term maps to a posting list of {doc id: term frequency}. A sorted term list
+    supports prefix lookups with bisect, and queries are ranked with BM25 using per-term
+    weight lists sorted by score, so the best results can be found without scoring every match.
+    """
+
+    def __init__(self):
+        self._postings = {}      # term -> {doc id: term frequency}
+        self._doc_terms = {}     # doc id -> {term: term frequency}, used for removal
+        self._doc_lengths = {}   # doc id -> number of tokens
+        self._total_length = 0
+        self._sorted_terms = []
+        self._impact_cache = {}  # term -> cached result of _impacts()
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_terms
+
+    def add(self, doc_id, text):
+        """
+        Indexes a document, replacing any previous version with the same id.
+
+        Args:
+            doc_id (int): The document id.
+            text (str): The document text.
+        """
+        if doc_id in self._doc_terms:
+            self.remove(doc_id)
+        frequencies = {}
+        tokens = tokenize(text)
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        for term, frequency in frequencies.items():
+            self._impact_cache.pop(term, None)
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._sorted_terms, term)
+            postings[doc_id] = frequency
+        self._doc_terms[doc_id] = frequencies
+        self._doc_lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id):
+        """
+        Removes a document from the index.
+
+        Args:
+            doc_id (int): The document id.
+
+        Returns:
+            bool: True if the document was indexed.
+        """
+        frequencies = self._doc_terms.pop(doc_id, None)
+        if frequencies is None:
+            return False
+        for term in frequencies:
+            self._impact_cache.pop(term, None)
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                del self._sorted_terms[bisect_left(self._sorted_terms, term)]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        return True
+
+    def expand_prefix(self, prefix):
+        """
+        Returns the indexed terms starting with `prefix`, most frequent first, capped at MAX_PREFIX_EXPANSIONS.
+        """
+        terms = []
+        position = bisect_left(self._sorted_terms, prefix)
+        while position < len(self._sorted_terms) and self._sorted_terms[position].startswith(prefix):
+            terms.append(self._sorted_terms[position])
+            position += 1
+        if len(terms) > MAX_PREFIX_EXPANSIONS:
+            terms = heapq.nlargest(MAX_PREFIX_EXPANSIONS, terms, key=lambda term: len(self._postings[term]))
+        return terms
+
+    def _impacts(self, term):
+        """
+        Returns (ordered, by_doc) for a term: its BM25 term-frequency weights sorted from
+        highest to lowest as (weight, doc id) pairs, and the same weights keyed by doc id.
+
+        The lists are cached until a document containing the term is added or removed.
+        """
+        cached = self._impact_cache.get(term)
+        if cached is None:
+            average_length = self._total_length / len(self._doc_terms)
+            lengths = self._doc_lengths
+            by_doc = {}
+            for doc_id, frequency in self._postings[term].items():
+                norm = _K1 * (1 - _B + _B * lengths[doc_id] / average_length)
+                by_doc[doc_id] = frequency * (_K1 + 1) / (frequency + norm)
+            ordered = sorted(((weight, doc_id) for doc_id, weight in by_doc.items()), reverse=True)
+            cached = self._impact_cache[term] = (ordered, by_doc)
+        return cached
+
+    def _idf(self, term):
+        document_frequency = len(self._postings[term])
+        return math.log(1 + (len(self._doc_terms) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _token_source(self, token, is_prefix):
+        """
+        Returns (ordered, lookup) for one query token.
+
+        `ordered` yields (score, doc id) from best to worst and `lookup(doc id)` returns the
+        token's score for a document, or None if it does not match. A prefix token scores a
+        document by its best matching expansion.
+        """
+        terms = self.expand_prefix(token) if is_prefix else [token]
+        terms = [term for term in terms if term in self._postings]
+        weighted = [(self._idf(term), self._impacts(term)) for term in terms]
+        if not weighted:
+            return iter(()), lambda doc_id: None
+        if len(weighted) == 1:
+            idf, (ordered, by_doc) = weighted[0]
+
+            def lookup(doc_id):
+                weight = by_doc.get(doc_id)
+                return None if weight is None else idf * weight
+            return _scaled(idf, ordered), lookup
+
+        def lookup(doc_id):
+            best = None
+            for idf, (_, by_doc) in weighted:
+                weight = by_doc.get(doc_id)
+                if weight is not None and (best is None or idf * weight > best):
+                    best = idf * weight
+            return best
+        merged = heapq.merge(*(_scaled(idf, ordered) for idf, (ordered, _) in weighted), reverse=True)
+        return merged, lookup
+
+    def parse_query(self, query, prefix=True):
+        """
+        Splits a query into (token, is_prefix) pairs.
+
+        A token ending in `*` is a prefix; with `prefix` set, the last token is also
+        treated as a prefix so partially typed words match.
+        """
+        raw_tokens = _QUERY_TOKEN_RE.findall(query.casefold())
+        parsed = []
+        for position, raw in enumerate(raw_tokens):
+            is_prefix = raw.endswith("*") or (prefix and position == len(raw_tokens) - 1)
+            parsed.append((raw.rstrip("*"), is_prefix))
+        return parsed
+
+    def _sources(self, query, mode, prefix):
+        """
+        Returns the token sources for a query, or an empty list if nothing can match.
+        """
+        if mode not in ("and", "or"):
+            raise ValueError(f"Unknown search mode: {mode}")
+        tokens = self.parse_query(query, prefix)
+        if not tokens or not self._doc_terms:
+            return []
+        return [self._token_source(token, is_prefix) for token, is_prefix in tokens]
+
+    @staticmethod
+    def _total_score(sources, require_all, doc_id, known_index=None, known_score=None):
+        """
+        Returns a document's summed score over every token, or None if it fails an AND query.
+        """
+        total = 0.0
+        for index, (_, lookup) in enumerate(sources):
+            score = known_score if index == known_index else lookup(doc_id)
+            if score is None:
+                if require_all:
+                    return None
+                continue
+            total += score
+        return total
+
+    def _rank_all(self, sources, require_all, exclude=(), cancelled=None):
+        """
+        Scores every matching document and returns them best first, or None if cancelled.
+        """
+        candidates = set()
+        for ordered, _ in sources:
+            candidates.update(doc_id for _, doc_id in ordered)
+        candidates.difference_update(exclude)
+        totals = []
+        for position, doc_id in enumerate(candidates):
+            if cancelled is not None and position % 1024 == 0 and cancelled():
+                return None
+            total = self._total_score(sources, require_all, doc_id)
+            if total is not None:
+                totals.append((doc_id, total))
+        totals.sort(key=lambda item: item[1], reverse=True)
+        return totals
+
+    def _top_k(self, sources, require_all, limit):
+        """
+        Finds the best `limit` documents with the threshold algorithm.
+        """
+        if limit <= 0:
+            return []
+        iterators = [iter(ordered) for ordered, _ in sources]
+        last_scores = [math.inf] * len(iterators)
+        top = []  # Min-heap of (score, doc id) holding the best `limit` results so far.
+        seen = set()
+        active = len(iterators)
+        while active:
+            for index, iterator in enumerate(iterators):
+                if last_scores[index] == 0.0:
+                    continue
+                entry = next(iterator, None)
+                if entry is None:
+                    if require_all:
+                        # Every document matching all tokens appears in this list and was already scored.
+                        active = 0
+                        break
+                    last_scores[index] = 0.0
+                    active -= 1
+                    continue
+                score, doc_id = entry
+                last_scores[index] = score
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                total = self._total_score(sources, require_all, doc_id, index, score)
+                if total is None:
+                    continue
+                if len(top) < limit:
+                    heapq.heappush(top, (total, doc_id))
+                elif total > top[0][0]:
+                    heapq.heapreplace(top, (total, doc_id))
+            if len(top) >= limit and top[0][0] >= sum(last_scores):
+                break
+        return [(doc_id, score) for score, doc_id in sorted(top, reverse=True)]
+
+    def search(self, query, mode="and", prefix=True, limit=20):
+        """
+        Runs a ranked query.
+
+        With a limit, the top results are found with the threshold algorithm: each token's
+        postings are walked from the highest score down, and the walk stops as soon as no
+        unseen document could beat the current top `limit`. Popular words therefore cost
+        about the same as rare ones.
+
+        Args:
+            query (str): The query text.
+            mode (str): "and" to require every token, "or" to match any token.
+            prefix (bool): Whether the last token is matched as a prefix.
+            limit (int or None): The maximum number of results, or None for all.
+
+        Returns:
+            list: (doc id, score) pairs, best first.
+        """
+        sources = self._sources(query, mode, prefix)
+        if not sources:
+            return []
+        if limit is None:
+            return self._rank_all(sources, mode == "and")
+        return self._top_k(sources, mode == "and", limit)
+
+    def iter_search(self, query, mode="and", prefix=True, first=20, batch_size=200, cancelled=None):
+        """
+        Runs a ranked query and yields its results in batches.
+
+        The first batch is the best `first` results, found without scoring every match;
+        the remaining matches are then ranked and yielded `batch_size` at a time. Ranking
+        stops early once `cancelled()` returns True.
+
+        The index itself is only read until the first batch is produced. The later batches
+        are ranked from the term weights captured then (add and remove replace those
+        lists rather than changing them), so a caller guarding the index with a lock only
+        needs to hold it while taking the first batch. Documents removed in the meantime
+        may still appear in later batches.
+
+        Args:
+            query (str): The query text.
+            mode (str): "and" to require every token, "or" to match any token.
+            prefix (bool): Whether the last token is matched as a prefix.
+            first (int): The size of the first batch.
+            batch_size (int): The size of the following batches.
+            cancelled (callable, optional): Returns True when the query is no longer wanted.
+
+        Yields:
+            list: (doc id, score) pairs, best first across all batches.
+        """
+        sources = self._sources(query, mode, prefix)
+        if not sources:
+            return
+        # The threshold walk consumes the ordered iterators, so the full ranking gets its own
+        # sources, built now while the caller still holds its lock.
+        rank_sources = self._sources(query, mode, prefix)
+        top = self._top_k(sources, mode == "and", first)
+        if not top:
+            return
+        yield top
+        if len(top) < first:
+            return
+        rest = self._rank_all(rank_sources, mode == "and", exclude={doc_id for doc_id, _ in top}, cancelled=cancelled)
+        if rest is None:
+            return
+        for start in range(0, len(rest), batch_size):
+            yield rest[start:start + batch_size]
@@ -0,0 +1,72 @@
+# tests/test_interval_index.py
+"""
+Overlap queries of the interval treap (models/interval_index.py) against a brute-force scan.
+"""
+import random
+
+import pytest
+
+from models.interval_index import IntervalIndex
+
+
+def overlaps(start, end, query_start, query_end):
+    # Same rule as IntervalIndex: a point (start == end) matches when query_start <= start < query_end.
+    return start < query_end and (end > query_start or start >= query_start)
+
+
+def brute_force(intervals, query_start, query_end):
+    matches = [(start, item_id) for item_id, (start, end) in intervals.items()
+               if overlaps(start, end, query_start, query_end)]
+    return [item_id for _, item_id in sorted(matches)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_overlapping_matches_a_linear_scan(seed):
+    rng = random.Random(seed)
+    index = IntervalIndex()
+    intervals = {}
+    for step in range(2000):
+        if intervals and rng.random() < 0.3:
+            item_id = rng.choice(list(intervals))
+            assert index.remove(item_id)
+            del intervals[item_id]
+        else:
+            # Reuses ids now and then, so add also replaces intervals.
+            item_id = rng.randrange(1500)
+            start = rng.randrange(1000)
+            end = start + rng.choice((0, rng.randrange(1, 5), rng.randrange(5, 200)))
+            index.add(item_id, start, end)
+            intervals[item_id] = (start, end)
+        if step % 50 == 0:
+            for _ in range(20):
+                query_start = rng.randrange(-50, 1050)
+                query_end = query_start + rng.randrange(0, 150)
+                assert list(index.overlapping(query_start, query_end)) == brute_force(intervals, query_start, query_end)
+    assert len(index) == len(intervals)
+    assert sorted(index) == sorted(intervals)
+
+
+def test_boundaries_are_half_open():
+    index = IntervalIndex()
+    index.add("a", 10, 20)
+    index.add("point", 20, 20)
+    assert list(index.overlapping(0, 10)) == []
+    assert list(index.overlapping(19, 20)) == ["a"]
+    assert list(index.overlapping(20, 21)) == ["point"]
+    assert list(index.overlapping(0, 100)) == ["a", "point"]
+
+
+def test_values_and_removal():
+    index = IntervalIndex()
+    index.add(1, 0, 5, value="first")
+    index.add(2, 3, 8, value="second")
+    assert list(index.overlapping(4, 5)) == ["first", "second"]
+    assert index.remove(1)
+    assert not index.remove(1)
+    assert 1 not in index
+    assert list(index.overlapping(0, 10)) == ["second"]
+
+
+def test_end_before_start_is_rejected():
+    with pytest.raises(ValueError):
+        IntervalIndex().add(1, 5, 4)
@@ -0,0 +1,113 @@
+# tests/test_note_store.py
+"""
+Notebook and note metadata persistence (models/note_store.py): the index.log records
+appended by NotesModel, their replay over index.json, and compaction.
+"""
+import json
+import os
+
+from models.note_store import NoteStore, next_ids_record, note_record, notebook_record
+from models.notes_model import NotesModel
+from models.records import Note, Notebook
+
+
+def titles(notebooks):
+    return {
+        notebook_id: (notebook.name, {note_id: note.title for note_id, note in notebook.notes.items()})
+        for notebook_id, notebook in notebooks.items()
+    }
+
+
+def test_reads_an_index_json_without_a_log(tmp_path):
+    with open(tmp_path / "index.json", "w", encoding="utf-8") as file:
+        json.dump({"notebooks": {"1": {"name": "Biology", "notes": {"4": {"title": "Cells"}}}},
+                   "next_notebook_id": 2, "next_note_id": 5}, file)
+
+    index = NoteStore(str(tmp_path)).load_index()
+    assert titles(index["notebooks"]) == {1: ("Biology", {4: "Cells"})}
+    assert (index["next_notebook_id"], index["next_note_id"]) == (2, 5)
+
+
+def test_log_records_replay_over_the_snapshot(tmp_path):
+    store = NoteStore(str(tmp_path))
+    store.load_index()
+    biology = Notebook(1, "Biology")
+    for key, record in (
+        notebook_record(1, biology),
+        notebook_record(2, Notebook(2, "History")),
+        note_record(1, Note(1, 1, "Cells")),
+        note_record(2, Note(2, 2, "Rome")),
+        notebook_record(1, Notebook(1, "Biology 101")),
+        note_record(1, Note(1, 1, "Cell division")),
+        notebook_record(2),
+        next_ids_record(3, 3),
+    ):
+        store.save(key, record)
+    store.close()
+
+    index = NoteStore(str(tmp_path)).load_index()
+    # History's note is dropped with its notebook even though its own removal was never written.
+    assert titles(index["notebooks"]) == {1: ("Biology 101", {1: "Cell division"})}
+    assert (index["next_notebook_id"], index["next_note_id"]) == (3, 3)
+    assert not os.path.exists(tmp_path / "index.json")
+
+
+def test_next_ids_never_reuse_a_saved_id(tmp_path):
+    store = NoteStore(str(tmp_path))
+    store.load_index()
+    store.save(*notebook_record(7, Notebook(7, "Late")))
+    store.save(*note_record(12, Note(12, 7, "Late note")))
+    store.close()
+
+    index = NoteStore(str(tmp_path)).load_index()
+    assert (index["next_notebook_id"], index["next_note_id"]) == (8, 13)
+
+
+def test_truncated_tail_is_dropped(tmp_path):
+    store = NoteStore(str(tmp_path))
+    store.load_index()
+    store.save(*notebook_record(1, Notebook(1, "kept")))
+    store.close()
+    valid_size = os.path.getsize(store.log_path)
+    with open(store.log_path, "ab") as file:
+        file.write(b'0badf00d ["notebook:2",["lo')
+
+    reopened = NoteStore(str(tmp_path))
+    assert titles(reopened.load_index()["notebooks"]) == {1: ("kept", {})}
+    assert os.path.getsize(store.log_path) == valid_size
+
+
+def test_compaction_folds_the_log_into_index_json(tmp_path):
+    store = NoteStore(str(tmp_path), compact_threshold=200)
+    store.load_index()
+    for notebook_id in range(1, 11):
+        store.save(*notebook_record(notebook_id, Notebook(notebook_id, f"Notebook {notebook_id}")))
+    store.save(*note_record(1, Note(1, 10, "Last")))
+    store.close()
+
+    assert os.path.getsize(store.log_path) < 200
+    with open(store.index_path, encoding="utf-8") as file:
+        assert len(json.load(file)["notebooks"]) >= 5
+    index = NoteStore(str(tmp_path)).load_index()
+    assert len(index["notebooks"]) == 10
+    assert titles(index["notebooks"])[10] == ("Notebook 10", {1: "Last"})
+
+
+def test_model_changes_are_written_once_flushed(tmp_path):
+    NotesModel.open_store(NoteStore(str(tmp_path)), delay_ms=60_000)
+    biology = NotesModel.add_notebook("Biology")
+    history = NotesModel.add_notebook("History")
+    cells = NotesModel.add_note(biology, {"title": "Cells", "body": "<p>Mitosis</p>"})
+    NotesModel.add_notes(history, [{"title": "Rome"}, {"title": "Greece"}])
+    NotesModel.update_note_body(cells, "<p>Meiosis</p>", title="Cell division")
+    NotesModel.rename_notebook(biology, "Biology 101")
+    NotesModel.remove_notebook(history)
+    # Nothing is written until the queue's delay passes or it is flushed.
+    assert not os.path.exists(tmp_path / "index.log")
+    NotesModel.flush()
+
+    NotesModel.open_store(NoteStore(str(tmp_path)))
+    assert titles(NotesModel.get_notebooks()) == {biology: ("Biology 101", {cells: "Cell division"})}
+    assert NotesModel.get_note_body(cells) == "<p>Meiosis</p>"
+    assert NotesModel.add_notebook("Chemistry") == history + 1
+    NotesModel.flush()
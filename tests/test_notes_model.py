@@ -0,0 +1,60 @@
+# tests/test_notes_model.py
+"""
+Lazy search indexing of stored note bodies (NotesModel._index_stored_notes).
+"""
+import threading
+
+from models.note_store import NoteStore
+from models.notes_model import NotesModel
+
+
+def open_notes(tmp_path, bodies):
+    store = NoteStore(str(tmp_path))
+    NotesModel.open_store(store)
+    notebook_id = NotesModel.add_notebook("Biology")
+    note_ids = NotesModel.add_notes(notebook_id, [{"title": f"Note {i}", "body": body} for i, body in enumerate(bodies)])
+    NotesModel.flush()
+    # Reopen so the bodies are on disk only and not indexed yet.
+    store = NoteStore(str(tmp_path), cache_bytes=0)
+    NotesModel.open_store(store)
+    return store, note_ids
+
+
+def test_bodies_are_read_without_holding_the_lock(tmp_path, monkeypatch):
+    store, note_ids = open_notes(tmp_path, ["mitosis", "meiosis", "osmosis"])
+    read_body = store.read_body_uncached
+    lock_free = []
+
+    def read_and_check(note_id):
+        # Another thread, like the UI thread, can take the lock while bodies are read.
+        acquired = []
+        thread = threading.Thread(target=lambda: acquired.append(NotesModel._lock.acquire(timeout=1)) or NotesModel._lock.release())
+        thread.start()
+        thread.join()
+        lock_free.append(acquired == [True])
+        return read_body(note_id)
+
+    monkeypatch.setattr(store, "read_body_uncached", read_and_check)
+    assert [note_id for note_id, _ in NotesModel.search_notes("meiosis")] == [note_ids[1]]
+    assert lock_free == [True, True, True]
+
+
+def test_unreadable_bodies_are_retried_by_the_next_search(tmp_path, monkeypatch):
+    store, note_ids = open_notes(tmp_path, ["mitosis", "meiosis"])
+    read_body = store.read_body_uncached
+    broken = {note_ids[0]}
+
+    def flaky_read(note_id):
+        if note_id in broken:
+            raise PermissionError(f"note {note_id} is locked")
+        return read_body(note_id)
+
+    errors = []
+    monkeypatch.setattr(store, "read_body_uncached", flaky_read)
+    monkeypatch.setattr("models.notes_model.log_error", errors.append)
+    assert NotesModel.search_notes("mitosis") == []
+    assert len(errors) == 1 and "locked" in errors[0]
+    assert [note_id for note_id, _ in NotesModel.search_notes("meiosis")] == [note_ids[1]]
+
+    broken.clear()
+    assert [note_id for note_id, _ in NotesModel.search_notes("mitosis")] == [note_ids[0]]
@@ -0,0 +1,131 @@
+# tests/test_recurrence.py
+"""
+Occurrence expansion of repeating events (models/recurrence.py) against a day-by-day walk.
+"""
+import calendar
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from models.records import Event
+from models.recurrence import DAILY, MONTHLY, WEEKLY, RecurrenceRule
+
+
+def is_occurrence_day(rule, first_start, day):
+    """
+    Returns True if the rule, ignoring count, until and exceptions, repeats on `day`.
+    """
+    if day < first_start.date():
+        return False
+    if rule.frequency == DAILY:
+        return (day - first_start.date()).days % rule.interval == 0
+    if rule.frequency == MONTHLY:
+        months = (day.year - first_start.year) * 12 + day.month - first_start.month
+        return months % rule.interval == 0 and day.day == min(first_start.day, calendar.monthrange(day.year, day.month)[1])
+    first_monday = first_start.date() - timedelta(days=first_start.weekday())
+    week, weekday = divmod((day - first_monday).days, 7)
+    weekdays = rule.weekdays or (first_start.weekday(),)
+    return week % rule.interval == 0 and weekday in weekdays
+
+
+def expected_starts(rule, first_start, duration, start, end):
+    """
+    Walks every day from the first start, numbering the occurrences, and keeps those the
+    rule allows that overlap [start, end).
+    """
+    starts = []
+    day = first_start.date()
+    number = 0
+    while datetime.combine(day, first_start.time()) < end:
+        if is_occurrence_day(rule, first_start, day):
+            occurrence = datetime.combine(day, first_start.time())
+            if rule.count is not None and number >= rule.count:
+                break
+            if rule.until is not None and occurrence > rule.until:
+                break
+            number += 1
+            if day not in rule.exceptions and (occurrence + duration > start or occurrence >= start):
+                starts.append(occurrence)
+        day += timedelta(days=1)
+    return starts
+
+
+def random_rule(rng, first_start):
+    frequency = rng.choice((DAILY, WEEKLY, MONTHLY))
+    weekdays = tuple(rng.sample(range(7), rng.randint(1, 3))) if frequency == WEEKLY and rng.random() < 0.5 else ()
+    count = rng.choice((None, rng.randint(1, 40)))
+    until = rng.choice((None, first_start + timedelta(days=rng.randint(0, 400))))
+    exceptions = frozenset(first_start.date() + timedelta(days=rng.randrange(400)) for _ in range(rng.randint(0, 15)))
+    return RecurrenceRule(frequency, rng.randint(1, 3), until, count, weekdays, exceptions)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_starts_between_matches_a_day_by_day_walk(seed):
+    rng = random.Random(seed)
+    for _ in range(40):
+        # First starts late in a month exercise the clamping of monthly rules to shorter months.
+        month = rng.randint(1, 12)
+        first_start = datetime(2024, month, rng.randint(1, calendar.monthrange(2024, month)[1]),
+                               rng.randint(0, 23), rng.choice((0, 30)))
+        duration = timedelta(minutes=rng.choice((0, 30, 90, 60 * 30)))
+        rule = random_rule(rng, first_start)
+        window_start = first_start + timedelta(days=rng.randint(-20, 300), hours=rng.randint(0, 23))
+        window_end = window_start + timedelta(days=rng.randint(0, 60), hours=rng.randint(0, 23))
+        actual = list(rule.starts_between(first_start, duration, window_start, window_end))
+        assert actual == expected_starts(rule, first_start, duration, window_start, window_end), rule
+
+
+def test_exceptions_still_count_towards_count():
+    first = datetime(2025, 3, 3, 9, 0)
+    rule = RecurrenceRule(DAILY, count=5).with_exception(date(2025, 3, 4))
+    starts = list(rule.starts_between(first, timedelta(hours=1), first, first + timedelta(days=30)))
+    assert [start.day for start in starts] == [3, 5, 6, 7]
+
+
+def test_until_is_inclusive():
+    first = datetime(2025, 1, 6, 8, 0)  # A Monday.
+    rule = RecurrenceRule(WEEKLY, until=datetime(2025, 1, 20, 8, 0), weekdays=(0, 2))
+    starts = list(rule.starts_between(first, timedelta(0), first, first + timedelta(days=60)))
+    assert [start.day for start in starts] == [6, 8, 13, 15, 20]
+    assert rule.last_start(first) == datetime(2025, 1, 20, 8, 0)
+
+
+def test_monthly_rule_clamps_to_short_months():
+    first = datetime(2025, 1, 31, 12, 0)
+    rule = RecurrenceRule(MONTHLY, count=4)
+    starts = list(rule.starts_between(first, timedelta(hours=1), first, datetime(2026, 1, 1)))
+    assert [start.date() for start in starts] == [date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)]
+
+
+def test_occurrence_overlapping_the_window_start_is_included():
+    first = datetime(2025, 5, 1, 22, 0)
+    rule = RecurrenceRule(DAILY, count=3)
+    starts = list(rule.starts_between(first, timedelta(hours=4), datetime(2025, 5, 2, 1, 0), datetime(2025, 5, 2, 2, 0)))
+    assert starts == [datetime(2025, 5, 1, 22, 0)]
+
+
+def test_event_occurrences_share_the_event_id():
+    rule = RecurrenceRule(WEEKLY, count=3)
+    event = Event(7, "Seminar", datetime(2025, 9, 1, 10, 0), datetime(2025, 9, 1, 11, 0), recurrence=rule)
+    occurrences = list(event.occurrences(datetime(2025, 9, 1), datetime(2025, 12, 1)))
+    assert [occurrence.id for occurrence in occurrences] == [7, 7, 7]
+    assert [occurrence.start.day for occurrence in occurrences] == [1, 8, 15]
+    assert all(occurrence.end - occurrence.start == timedelta(hours=1) for occurrence in occurrences)
+
+
+def test_json_round_trip():
+    rule = RecurrenceRule(WEEKLY, 2, datetime(2025, 6, 1, 9, 0), None, (4, 0), frozenset({date(2025, 3, 7)}))
+    assert RecurrenceRule.from_json(rule.to_json()) == rule
+
+
+@pytest.mark.parametrize("options", [
+    {"frequency": "yearly"},
+    {"frequency": DAILY, "interval": 0},
+    {"frequency": DAILY, "count": 0},
+    {"frequency": DAILY, "weekdays": (1,)},
+    {"frequency": WEEKLY, "weekdays": (7,)},
+])
+def test_invalid_rules_are_rejected(options):
+    with pytest.raises(ValueError):
+        RecurrenceRule(**options)
@@ -0,0 +1,142 @@
+# tests/test_search_index.py
+"""
+Ranked queries of the inverted index (models/search_index.py) against a brute-force
+BM25 ranking of every document.
+"""
+import math
+import random
+
+import pytest
+
+from models.search_index import InvertedIndex, tokenize
+
+# A small vocabulary with shared prefixes, so prefix queries expand to several terms and
+# scores tie often.
+WORDS = ["cell", "cells", "cellular", "mitosis", "meiosis", "membrane", "protein", "proteins",
+         "rome", "roman", "empire", "essay", "exam", "exams", "example", "lab"]
+
+
+def random_documents(rng, count):
+    return {doc_id: " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 25))) for doc_id in range(count)}
+
+
+def brute_force(documents, query, mode, prefix):
+    """
+    Scores every document from scratch: BM25 with k1 = 1.2 and b = 0.75, where a prefix
+    token scores a document by its best matching term.
+    """
+    tokenized = {doc_id: tokenize(text) for doc_id, text in documents.items()}
+    average_length = sum(map(len, tokenized.values())) / len(tokenized)
+    document_frequencies = {}
+    for tokens in tokenized.values():
+        for term in set(tokens):
+            document_frequencies[term] = document_frequencies.get(term, 0) + 1
+    parsed = InvertedIndex().parse_query(query, prefix)
+    results = []
+    for doc_id, tokens in tokenized.items():
+        total = 0.0
+        matched_all = True
+        for token, is_prefix in parsed:
+            terms = [term for term in document_frequencies if term.startswith(token)] if is_prefix else [token]
+            best = None
+            for term in terms:
+                frequency = tokens.count(term)
+                if not frequency:
+                    continue
+                document_frequency = document_frequencies[term]
+                idf = math.log(1 + (len(tokenized) - document_frequency + 0.5) / (document_frequency + 0.5))
+                norm = 1.2 * (1 - 0.75 + 0.75 * len(tokens) / average_length)
+                score = idf * frequency * 2.2 / (frequency + norm)
+                best = score if best is None else max(best, score)
+            if best is None:
+                matched_all = False
+            else:
+                total += best
+        if (matched_all if mode == "and" else total > 0) and tokens:
+            results.append((doc_id, total))
+    results.sort(key=lambda item: item[1], reverse=True)
+    return results
+
+
+def assert_is_top(actual, expected, limit):
+    """
+    Checks `actual` is a best-first top `limit` of `expected`, allowing any order among ties.
+    """
+    scores = dict(expected)
+    assert len(actual) == min(limit, len(expected))
+    assert [score for _, score in actual] == pytest.approx([score for _, score in expected[:len(actual)]])
+    for doc_id, score in actual:
+        assert score == pytest.approx(scores[doc_id])
+    assert len({doc_id for doc_id, _ in actual}) == len(actual)
+
+
+QUERIES = ["cell", "cel", "protein exam", "ro empire", "mitosis meiosis lab", "e*", "cells roman essay*", "zebra"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("mode", ["and", "or"])
+def test_top_k_matches_a_brute_force_ranking(seed, mode):
+    rng = random.Random(seed)
+    documents = random_documents(rng, 300)
+    index = InvertedIndex()
+    for doc_id, text in documents.items():
+        index.add(doc_id, text)
+    for query in QUERIES:
+        for prefix in (True, False):
+            expected = brute_force(documents, query, mode, prefix)
+            for limit in (1, 5, 20):
+                assert_is_top(index.search(query, mode=mode, prefix=prefix, limit=limit), expected, limit)
+            everything = index.search(query, mode=mode, prefix=prefix, limit=None)
+            assert_is_top(everything, expected, len(expected))
+
+
+@pytest.mark.parametrize("mode", ["and", "or"])
+def test_ranking_follows_edits_and_removals(mode):
+    rng = random.Random(42)
+    documents = random_documents(rng, 200)
+    index = InvertedIndex()
+    for doc_id, text in documents.items():
+        index.add(doc_id, text)
+    for doc_id in rng.sample(sorted(documents), 60):
+        if rng.random() < 0.5:
+            index.remove(doc_id)
+            del documents[doc_id]
+        else:
+            documents[doc_id] = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 25)))
+            index.add(doc_id, documents[doc_id])
+    assert len(index) == len(documents)
+    for query in QUERIES:
+        assert_is_top(index.search(query, mode=mode, limit=10), brute_force(documents, query, mode, True), 10)
+
+
+@pytest.mark.parametrize("mode", ["and", "or"])
+def test_iter_search_yields_the_full_ranking_in_batches(mode):
+    rng = random.Random(7)
+    documents = random_documents(rng, 400)
+    index = InvertedIndex()
+    for doc_id, text in documents.items():
+        index.add(doc_id, text)
+    for query in QUERIES:
+        expected = brute_force(documents, query, mode, True)
+        batches = list(index.iter_search(query, mode=mode, first=10, batch_size=25))
+        assert all(len(batch) <= 25 for batch in batches[1:])
+        if expected:
+            assert len(batches[0]) == min(10, len(expected))
+        flattened = [result for batch in batches for result in batch]
+        assert_is_top(flattened, expected, len(expected))
+
+
+def test_iter_search_stops_when_cancelled():
+    index = InvertedIndex()
+    for doc_id in range(3000):
+        index.add(doc_id, f"cell {'cell ' * (doc_id % 7)}")
+    batches = index.iter_search("cell", first=5, cancelled=lambda: True)
+    assert len(next(batches)) == 5
+    assert list(batches) == []
+
+
+def test_unknown_mode_is_rejected():
+    index = InvertedIndex()
+    index.add(1, "cell")
+    with pytest.raises(ValueError):
+        index.search("cell", mode="xor")
@@ -0,0 +1,136 @@
+# tests/test_sqlite_task_store.py
+"""
+The SQLite task store and the migration from tasks.json (core/sqlite_task_store.py).
+"""
+import json
+import os
+import random
+
+import pytest
+
+from core.sqlite_task_store import SqliteTaskStore, archive_migrated_json, migrate_json_to_sqlite
+from core.task_journal import JournalTaskStore
+from models.records import Task
+
+
+def make_store(tmp_path, **options):
+    return SqliteTaskStore(str(tmp_path / "tasks.db"), **options)
+
+
+def test_saves_replace_and_survive_reopening(tmp_path):
+    store = make_store(tmp_path)
+    store.save("2025-02-03", ["Read ch. 1", Task("Quiz")])
+    store.save("2025-02-04", ["Essay"])
+    store.save("2025-02-03", ["Quiz"])
+    store.save("2025-02-04", [])
+    store.close()
+
+    reopened = make_store(tmp_path)
+    assert reopened.load("2025-02-03") == [Task("Quiz")]
+    assert reopened.load("2025-02-04") == []
+    assert reopened.items() == [("2025-02-03", [Task("Quiz")])]
+    reopened.close()
+
+
+def test_append_many_continues_after_the_stored_tasks(tmp_path):
+    store = make_store(tmp_path)
+    store.save_many([("2025-02-03", ["a", "b"]), ("2025-02-05", ["c"])])
+    assert store.task_counts("2025-02-01", "2025-02-28") == {"2025-02-03": 2, "2025-02-05": 1}
+    store.append_many([("2025-02-03", ["d"]), ("2025-02-04", ["e", "f"])])
+    store.append_many([("2025-02-03", ["g"])])
+
+    assert store.load("2025-02-03") == [Task("a"), Task("b"), Task("d"), Task("g")]
+    assert store.load("2025-02-04") == [Task("e"), Task("f")]
+    # The day counts built before the appends are kept up to date by them.
+    assert store.task_counts("2025-02-01", "2025-02-28") == {"2025-02-03": 4, "2025-02-04": 2, "2025-02-05": 1}
+    store.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 500])
+def test_iter_range_streams_the_dates_in_order(tmp_path, chunk_size):
+    rng = random.Random(chunk_size)
+    store = make_store(tmp_path)
+    stored = {}
+    for day in rng.sample(range(1, 29), 15):
+        date = f"2025-02-{day:02d}"
+        stored[date] = [Task(f"task {day}.{i}") for i in range(rng.randint(1, 4))]
+    store.save_many(stored.items())
+
+    for start, end in (("2025-02-01", "2025-02-28"), ("2025-02-05", "2025-02-12"), ("2025-03-01", "2025-03-31")):
+        expected = [(date, stored[date]) for date in sorted(stored) if start <= date <= end]
+        assert list(store.iter_range(start, end, chunk_size=chunk_size)) == expected
+    store.close()
+
+
+def write_tasks_json(tmp_path, data):
+    path = tmp_path / "tasks.json"
+    with open(path, "w") as file:
+        json.dump(data, file)
+    return str(path)
+
+
+def test_migration_copies_tasks_and_keeps_the_json_file(tmp_path):
+    json_path = write_tasks_json(tmp_path, {"2025-02-03": ["a", "b"], "2025-02-04": ["c"], "2025-02-05": []})
+    store = make_store(tmp_path, migrate_from=json_path)
+
+    assert store.items() == [("2025-02-03", [Task("a"), Task("b")]), ("2025-02-04", [Task("c")])]
+    assert os.path.exists(json_path)
+    # The migration is recorded, so it does not run again even if the tasks are removed.
+    store.save("2025-02-03", [])
+    assert migrate_json_to_sqlite(json_path, store) == 0
+    assert store.load("2025-02-03") == []
+    store.close()
+
+
+def test_migration_replays_the_journal(tmp_path):
+    json_path = str(tmp_path / "tasks.json")
+    journal = JournalTaskStore(json_path)
+    journal.save("2025-02-03", ["from the log"])
+    journal.close()
+
+    store = make_store(tmp_path)
+    assert migrate_json_to_sqlite(json_path, store) == 1
+    assert store.load("2025-02-03") == [Task("from the log")]
+    store.close()
+
+
+def test_migration_skips_a_database_that_already_holds_tasks(tmp_path):
+    json_path = write_tasks_json(tmp_path, {"2025-02-03": ["from json"]})
+    store = make_store(tmp_path)
+    store.save("2025-02-04", ["already here"])
+    assert migrate_json_to_sqlite(json_path, store) == 0
+    assert store.load("2025-02-03") == []
+    store.close()
+
+
+def test_archive_renames_the_migrated_files(tmp_path):
+    json_path = write_tasks_json(tmp_path, {"2025-02-03": ["a"]})
+    store = make_store(tmp_path, migrate_from=json_path)
+    store.load("2025-02-03")
+
+    assert archive_migrated_json(json_path, store) == [json_path]
+    assert not os.path.exists(json_path)
+    assert os.path.exists(json_path + ".migrated")
+    store.close()
+
+
+def test_archive_refuses_when_the_store_is_missing_tasks(tmp_path):
+    json_path = write_tasks_json(tmp_path, {"2025-02-03": ["a"]})
+    store = make_store(tmp_path, migrate_from=json_path)
+    store.load("2025-02-03")
+    # A task added to tasks.json after the migration is not in the database.
+    write_tasks_json(tmp_path, {"2025-02-03": ["a"], "2025-02-04": ["added later"]})
+
+    with pytest.raises(ValueError):
+        archive_migrated_json(json_path, store)
+    assert os.path.exists(json_path)
+    store.close()
+
+
+def test_archive_refuses_a_file_that_was_not_migrated(tmp_path):
+    json_path = write_tasks_json(tmp_path, {"2025-02-03": ["a"]})
+    store = make_store(tmp_path)
+    with pytest.raises(ValueError):
+        archive_migrated_json(json_path, store)
+    assert os.path.exists(json_path)
+    store.close()
@@ -0,0 +1,138 @@
+# tests/test_task_journal.py
+"""
+Replay and recovery of the journaled task store (core/task_journal.py).
+"""
+import json
+import os
+
+from core.task_journal import JournalTaskStore, encode_record, read_records
+from models.records import Task
+
+
+def make_store(tmp_path, **options):
+    return JournalTaskStore(str(tmp_path / "tasks.json"), **options)
+
+
+def test_replays_saves_after_reopening(tmp_path):
+    store = make_store(tmp_path)
+    store.save("2025-02-03", ["Read ch. 1"])
+    store.save("2025-02-04", [Task("Essay")])
+    store.save("2025-02-03", ["Read ch. 1", "Quiz"])
+    store.close()
+
+    reopened = make_store(tmp_path)
+    assert reopened.load("2025-02-03") == [Task("Read ch. 1"), Task("Quiz")]
+    assert reopened.load("2025-02-04") == [Task("Essay")]
+    reopened.close()
+
+
+def test_truncated_tail_is_dropped_and_cut_off(tmp_path):
+    store = make_store(tmp_path)
+    store.save("2025-02-03", ["kept"])
+    store.close()
+    log_path = store.log_path
+    valid_size = os.path.getsize(log_path)
+    torn = encode_record("2025-02-04", ["lost"])
+    with open(log_path, "ab") as file:
+        file.write(torn[:len(torn) // 2])
+
+    reopened = make_store(tmp_path)
+    assert reopened.load("2025-02-03") == [Task("kept")]
+    assert reopened.load("2025-02-04") == []
+    assert os.path.getsize(log_path) == valid_size
+
+    # Records appended after the recovery follow the last valid one.
+    reopened.save("2025-02-05", ["after crash"])
+    reopened.close()
+    records, _ = read_records(log_path)
+    assert records == [("2025-02-03", ["kept"]), ("2025-02-05", ["after crash"])]
+
+
+def test_checksum_mismatch_stops_the_replay(tmp_path):
+    store = make_store(tmp_path)
+    for day in range(1, 4):
+        store.save(f"2025-02-0{day}", [f"task {day}"])
+    store.close()
+    with open(store.log_path, "rb") as file:
+        lines = file.readlines()
+    # Flip one character of the second record's payload, keeping its length.
+    lines[1] = lines[1].replace(b"task 2", b"task X")
+    with open(store.log_path, "wb") as file:
+        file.writelines(lines)
+
+    records, valid_length = read_records(store.log_path)
+    assert records == [("2025-02-01", ["task 1"])]
+    assert valid_length == len(lines[0])
+
+    reopened = make_store(tmp_path)
+    assert reopened.load("2025-02-01") == [Task("task 1")]
+    assert reopened.load("2025-02-02") == []
+    assert reopened.load("2025-02-03") == []
+    reopened.close()
+
+
+def test_malformed_lines_are_rejected(tmp_path):
+    log_path = tmp_path / "tasks.json.log"
+    good = encode_record("2025-02-01", ["ok"])
+    log_path.write_bytes(good + b"not a record\n" + encode_record("2025-02-02", ["unreachable"]))
+    assert read_records(str(log_path)) == ([("2025-02-01", ["ok"])], len(good))
+
+
+def test_missing_log_replays_nothing(tmp_path):
+    assert read_records(str(tmp_path / "absent.log")) == ([], 0)
+
+
+def test_compaction_folds_the_log_into_the_snapshot(tmp_path):
+    store = make_store(tmp_path, compact_threshold=256)
+    for day in range(1, 29):
+        store.save(f"2025-02-{day:02d}", [f"task {day}"] * 3)
+    store.close()
+    assert not os.path.exists(store.compacting_log_path)
+    assert os.path.exists(store.path)
+
+    with open(store.path) as file:
+        snapshot = json.load(file)
+    records, _ = read_records(store.log_path)
+    for date, tasks in records:
+        snapshot[date] = tasks
+    assert snapshot == {f"2025-02-{day:02d}": [f"task {day}"] * 3 for day in range(1, 29)}
+
+    reopened = make_store(tmp_path)
+    assert reopened.load("2025-02-28") == [Task("task 28")] * 3
+    reopened.close()
+
+
+def test_interrupted_compaction_is_recovered(tmp_path):
+    # A crash after the log was rotated but before the snapshot replaced tasks.json leaves
+    # the old snapshot, the rotated log and a newer live log behind.
+    path = tmp_path / "tasks.json"
+    path.write_text(json.dumps({"2025-02-01": ["snapshot"], "2025-02-02": ["old"]}))
+    (tmp_path / "tasks.json.log.compacting").write_bytes(
+        encode_record("2025-02-02", ["rotated"]) + encode_record("2025-02-03", ["rotated"])
+    )
+    (tmp_path / "tasks.json.log").write_bytes(encode_record("2025-02-03", ["live"]))
+
+    store = make_store(tmp_path)
+    expected = {
+        "2025-02-01": [Task("snapshot")],
+        "2025-02-02": [Task("rotated")],
+        "2025-02-03": [Task("live")],
+    }
+    assert {date: store.load(date) for date in expected} == expected
+    store.close()
+
+    # The replay restarted the compaction, which removed the rotated log.
+    assert not os.path.exists(store.compacting_log_path)
+    reopened = make_store(tmp_path)
+    assert {date: reopened.load(date) for date in expected} == expected
+    reopened.close()
+
+
+def test_compact_drops_empty_dates(tmp_path):
+    store = make_store(tmp_path)
+    store.save("2025-02-01", ["kept"])
+    store.save("2025-02-02", [])
+    assert store.compact() == 1
+    store.close()
+    with open(store.path) as file:
+        assert json.load(file) == {"2025-02-01": ["kept"]}
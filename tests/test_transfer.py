@@ -0,0 +1,120 @@
+# tests/test_transfer.py
+"""
+Streaming import and export of tasks (core/transfer.py).
+"""
+import io
+import json
+
+import pytest
+
+from core.sqlite_task_store import SqliteTaskStore
+from core.task_journal import JournalTaskStore
+from core.task_store import TaskStore
+from core.transfer import (
+    TransferError, import_tasks, iter_json_object, read_task_records, write_task_records,
+)
+from models.records import Task
+
+# Strings holding braces, quotes, escapes and non-ASCII text, and numbers that can be cut
+# in the middle by a chunk boundary.
+TRICKY_OBJECT = (
+    '  {\n "2025-02-03" : ["Read ch. 1", "Quiz \\"2\\" {draft}"],'
+    '"2025-02-04":[],\t"emoji \\ud83d\\ude00 ä":[12345678901234567890, -1.5e-3, true, null],'
+    '"nested": {"a": [{"b": "}"}]}, "last": "\\\\"  }\n'
+)
+
+
+@pytest.mark.parametrize("chunk_size", list(range(1, 18)) + [64, 1 << 16])
+def test_iter_json_object_matches_json_loads_at_any_chunk_size(chunk_size):
+    members = list(iter_json_object(io.StringIO(TRICKY_OBJECT), chunk_size=chunk_size))
+    assert members == list(json.loads(TRICKY_OBJECT).items())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_iter_json_object_reads_an_empty_object(chunk_size):
+    assert list(iter_json_object(io.StringIO(" {  }\n"), chunk_size=chunk_size)) == []
+
+
+@pytest.mark.parametrize("text", [
+    '["2025-02-03"]',
+    '{"2025-02-03": ["a"]',
+    '{"2025-02-03" ["a"]}',
+    '{"2025-02-03": ["a"], }',
+    '{1: ["a"]}',
+    '',
+])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+def test_iter_json_object_rejects_malformed_input(text, chunk_size):
+    with pytest.raises(TransferError):
+        list(iter_json_object(io.StringIO(text), chunk_size=chunk_size))
+
+
+ITEMS = [
+    ("2025-02-03", [Task("Read ch. 1"), Task('Quiz "2", part 1')]),
+    ("2025-02-04", [Task("Essay\nsecond line")]),
+]
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv", "json"])
+def test_written_records_read_back(fmt):
+    file = io.StringIO()
+    assert write_task_records(file, ITEMS, fmt) == 3
+    file.seek(0)
+    assert list(read_task_records(file, fmt)) == [(date, task) for date, tasks in ITEMS for task in tasks]
+
+
+@pytest.mark.parametrize("fmt, text", [
+    ("jsonl", '{"date": "2025-02-03"}\n'),
+    ("jsonl", '{"date": "03/02/2025", "text": "a"}\n'),
+    ("csv", "day,text\n2025-02-03,a\n"),
+    ("json", '{"2025-02-03": "not a list"}'),
+])
+def test_malformed_task_records_are_rejected(fmt, text):
+    with pytest.raises(TransferError):
+        list(read_task_records(io.StringIO(text), fmt))
+
+
+STORES = {
+    "json": lambda tmp_path: TaskStore(str(tmp_path / "tasks.json")),
+    "journal": lambda tmp_path: JournalTaskStore(str(tmp_path / "tasks.json")),
+    "sqlite": lambda tmp_path: SqliteTaskStore(str(tmp_path / "tasks.db")),
+}
+
+
+def records(count):
+    return [(f"2025-03-{day % 5 + 1:02d}", Task(f"task {day}")) for day in range(count)]
+
+
+@pytest.mark.parametrize("mode", sorted(STORES))
+def test_import_appends_in_batches(tmp_path, mode):
+    store = STORES[mode](tmp_path)
+    store.save("2025-03-01", [Task("existing")])
+    totals = import_tasks(store, iter(records(25)), batch_size=10)
+
+    # The JSON store rewrites its file on every save, so it gets the import in one batch.
+    assert totals == {"tasks": 25, "dates": 5, "batches": 1 if mode == "json" else 3}
+    expected = {f"2025-03-{day:02d}": [] for day in range(1, 6)}
+    expected["2025-03-01"].append(Task("existing"))
+    for date, task in records(25):
+        expected[date].append(task)
+    for date, tasks in expected.items():
+        assert store.load(date) == tasks
+    store.close()
+
+
+@pytest.mark.parametrize("mode", sorted(STORES))
+def test_import_with_replace_overwrites_each_date_once(tmp_path, mode):
+    store = STORES[mode](tmp_path)
+    store.save("2025-03-01", [Task("existing")])
+    store.save("2025-03-09", [Task("untouched")])
+    import_tasks(store, iter(records(25)), replace=True, batch_size=4)
+
+    # Dates spanning several batches keep every imported task, not just the last batch's.
+    assert store.load("2025-03-01") == [task for date, task in records(25) if date == "2025-03-01"]
+    assert store.load("2025-03-09") == [Task("untouched")]
+    store.close()
+
+
+def test_import_rejects_a_batch_size_below_one(tmp_path):
+    with pytest.raises(ValueError):
+        import_tasks(TaskStore(str(tmp_path / "tasks.json")), iter(records(3)), batch_size=0)
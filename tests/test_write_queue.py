@@ -0,0 +1,107 @@
+# tests/test_write_queue.py
+"""
+Debounced background saves (core/write_queue.py) and the application-wide flush
+(utils/persistence_queue.py).
+"""
+import threading
+
+import pytest
+
+from core.write_queue import WriteQueue
+
+
+class RecordingStore:
+    """
+    Records every save; saves of dates in `failing` raise.
+    """
+
+    def __init__(self, failing=()):
+        self.saves = []
+        self.failing = set(failing)
+
+    def save(self, date, tasks):
+        if date in self.failing:
+            raise OSError(f"disk full while saving {date}")
+        self.saves.append((date, list(tasks)))
+
+
+def test_repeated_saves_of_a_date_are_coalesced():
+    store = RecordingStore()
+    queue = WriteQueue(store, delay_ms=60_000)
+    for count in range(1, 6):
+        queue.submit("2025-02-03", [f"task {i}" for i in range(count)])
+    queue.submit("2025-02-04", ["other"])
+    assert store.saves == []
+    assert queue.pending("2025-02-03") == [f"task {i}" for i in range(5)]
+
+    queue.flush()
+    assert store.saves == [("2025-02-03", [f"task {i}" for i in range(5)]), ("2025-02-04", ["other"])]
+    assert queue.pending("2025-02-03") is None
+    queue.close()
+
+
+def test_submitted_lists_are_copied():
+    store = RecordingStore()
+    queue = WriteQueue(store, delay_ms=60_000)
+    tasks = ["a"]
+    queue.submit("2025-02-03", tasks)
+    tasks.append("changed after submit")
+    queue.close()
+    assert store.saves == [("2025-02-03", ["a"])]
+
+
+def test_saves_are_written_once_the_delay_passes():
+    store = RecordingStore()
+    written = threading.Event()
+    queue = WriteQueue(store, delay_ms=20, on_saved=lambda date: written.set())
+    queue.submit("2025-02-03", ["a"])
+    assert written.wait(5)
+    assert store.saves == [("2025-02-03", ["a"])]
+    queue.close()
+
+
+def test_failures_are_reported_and_do_not_stop_the_batch():
+    store = RecordingStore(failing={"2025-02-03"})
+    saved, failed = [], []
+    queue = WriteQueue(store, delay_ms=60_000, on_saved=saved.append,
+                       on_failed=lambda date, message: failed.append((date, message)))
+    queue.submit("2025-02-03", ["lost"])
+    queue.submit("2025-02-04", ["kept"])
+    queue.flush()
+
+    assert failed == [("2025-02-03", "disk full while saving 2025-02-03")]
+    assert saved == ["2025-02-04"]
+    queue.close()
+
+
+def test_close_writes_pending_saves():
+    store = RecordingStore()
+    queue = WriteQueue(store, delay_ms=60_000)
+    queue.submit("2025-02-03", ["a"])
+    queue.close()
+    assert store.saves == [("2025-02-03", ["a"])]
+
+
+def test_flush_all_runs_the_hooks_then_flushes_every_queue(monkeypatch):
+    pytest.importorskip("PyQt5")
+    from utils import persistence_queue
+
+    monkeypatch.setattr(persistence_queue, "_queues", {})
+    monkeypatch.setattr(persistence_queue, "_flush_hooks", [])
+    first, second = RecordingStore(), RecordingStore()
+    queue = persistence_queue.get_persistence_queue(first, delay_ms=60_000)
+    assert persistence_queue.get_persistence_queue(first) is queue
+    other = persistence_queue.get_persistence_queue(second, delay_ms=60_000)
+
+    # A hook submitting a save, like the note editor saving the open note, is flushed too.
+    def hook():
+        other.submit("2025-02-05", ["from the hook"])
+    persistence_queue.add_flush_hook(hook)
+    queue.submit("2025-02-03", ["a"])
+    queue.submit("2025-02-03", ["a", "b"])
+    persistence_queue.flush_all()
+
+    assert first.saves == [("2025-02-03", ["a", "b"])]
+    assert second.saves == [("2025-02-05", ["from the hook"])]
+    queue.close()
+    other.close()
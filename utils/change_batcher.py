@@ -0,0 +1,42 @@
+# utils/change_batcher.py
+import threading
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+
+class ChangeBatcher(QObject):
+    """
+    Collects model change notifications and delivers them once per event-loop turn.
+
+    `add` may be called any number of times, from any thread; the collected changes are
+    emitted together through `changesReady` the next time the event loop runs, so a burst
+    of modifications costs one view update instead of one per change.
+    """
+    changesReady = pyqtSignal(list)
+    _flushRequested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._changes = []
+        # A queued connection defers the flush to the event loop, even when emitted from this thread.
+        self._flushRequested.connect(self.flush, Qt.QueuedConnection)
+
+    def add(self, change):
+        """
+        Queues a change for the next batch.
+        """
+        with self._lock:
+            self._changes.append(change)
+            first = len(self._changes) == 1
+        if first:
+            self._flushRequested.emit()
+
+    def flush(self):
+        """
+        Emits every queued change now.
+        """
+        with self._lock:
+            changes, self._changes = self._changes, []
+        if changes:
+            self.changesReady.emit(changes)
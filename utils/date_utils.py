@@ -1,5 +1,6 @@
 # utils/date_utils.py
-from datetime import datetime
+import calendar
+from datetime import date, datetime
 
 def format_date(date_obj, format_str="%Y-%m-%d"):
     """
@@ -26,3 +27,25 @@ def parse_date(date_str, format_str="%Y-%m-%d"):
         datetime: The resulting datetime object.
     """
     return datetime.strptime(date_str, format_str)
+
+def month_range(year, month, before=0, after=0):
+    """
+    Returns the first and last day of a span of whole months as date strings.
+
+    Args:
+        year (int): The year of the central month.
+        month (int): The central month (1-12).
+        before (int): How many months before the central month to include.
+        after (int): How many months after the central month to include.
+
+    Returns:
+        tuple: (start, end) formatted as "YYYY-MM-DD".
+    """
+    first_index = year * 12 + (month - 1) - before
+    last_index = year * 12 + (month - 1) + after
+    first_year, first_month = divmod(first_index, 12)
+    last_year, last_month = divmod(last_index, 12)
+    last_day = calendar.monthrange(last_year, last_month + 1)[1]
+    start = date(first_year, first_month + 1, 1)
+    end = date(last_year, last_month + 1, last_day)
+    return format_date(start), format_date(end)
@@ -1,22 +1,6 @@
 # utils/error_utils.py
-import logging
 from PyQt5.QtWidgets import QMessageBox
-
-# Configure logging to write error messages to a file.
-logging.basicConfig(
-    filename='app.log',
-    level=logging.ERROR,
-    format='%(asctime)s:%(levelname)s:%(message)s'
-)
-
-def log_error(message):
-    """
-    Logs an error message using Python's logging facility.
-    
-    Args:
-        message (str): The error message to log.
-    """
-    logging.error(message)
+from core.log import log_error
 
 def show_error_dialog(message):
     """
@@ -1,14 +1,8 @@
 # utils/file_utils.py
-from PyQt5.QtWidgets import QFileDialog
-import json
-import os
+# load_tasks and save_tasks moved to core/tasks.py; they are re-exported so existing imports keep working.
+from core.tasks import load_tasks, save_tasks
 
-# Define the storage folder and tasks file path
-STORAGE_FOLDER = "storage"
-TASKS_FILE = os.path.join(STORAGE_FOLDER, "tasks.json")
-
-# Ensure the storage directory exists
-os.makedirs(STORAGE_FOLDER, exist_ok=True)
+__all__ = ["import_image", "load_tasks", "save_tasks"]
 
 def import_image():
     """
@@ -17,6 +11,7 @@ def import_image():
     Returns:
         str: The path to the selected image file, or None if canceled.
     """
+    from PyQt5.QtWidgets import QFileDialog  # Only needed once the user picks a file.
     options = QFileDialog.Options()
     options |= QFileDialog.ReadOnly
     file_path, _ = QFileDialog.getOpenFileName(
@@ -27,32 +22,3 @@ def import_image():
         options=options
     )
     return file_path if file_path else None
-
-def load_tasks(date):
-    """
-    Loads tasks from the tasks.json file for a given date.
-    Returns an empty list if no tasks exist for that date.
-    """
-    if not os.path.exists(TASKS_FILE):
-        return []
-
-    with open(TASKS_FILE, "r") as file:
-        data = json.load(file)
-
-    return data.get(date, [])
-
-
-def save_tasks(date, tasks):
-    """
-    Saves tasks to the tasks.json file in the storage folder.
-    """
-    if os.path.exists(TASKS_FILE):
-        with open(TASKS_FILE, "r") as file:
-            data = json.load(file)
-    else:
-        data = {}
-
-    data[date] = tasks
-
-    with open(TASKS_FILE, "w") as file:
-        json.dump(data, file, indent=4)
\ No newline at end of file
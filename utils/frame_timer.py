@@ -0,0 +1,67 @@
+# utils/frame_timer.py
+import time
+
+
+class FrameTimer:
+    """
+    Records the cost of animation frames.
+
+    Each frame is bracketed by `begin_frame` / `end_frame`; the time between them is the
+    frame's cost, and the time between consecutive `begin_frame` calls is the frame
+    interval (how often the animation actually got to run). `add_cost` charges extra
+    work done later for the same frame, such as its paint event.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Discards every recorded frame.
+        """
+        self._costs = []
+        self._intervals = []
+        self._frame_start = None
+        self._last_begin = None
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self._last_begin is not None:
+            self._intervals.append((now - self._last_begin) * 1e3)
+        self._last_begin = now
+        self._frame_start = now
+
+    def end_frame(self):
+        if self._frame_start is None:
+            return
+        self._costs.append((time.perf_counter() - self._frame_start) * 1e3)
+        self._frame_start = None
+
+    def add_cost(self, milliseconds):
+        """
+        Adds `milliseconds` to the cost of the last recorded frame.
+        """
+        if self._costs:
+            self._costs[-1] += milliseconds
+
+    def report(self):
+        """
+        Summarizes the recorded frames.
+
+        Returns:
+            dict: The number of frames and the mean, p95 and max frame cost, plus the
+            mean and max interval between frames, all in milliseconds.
+        """
+        import statistics  # Only needed for reports; keeps it out of startup.
+
+        def p95(values):
+            return statistics.quantiles(values, n=20)[-1] if len(values) >= 2 else max(values, default=0.0)
+
+        return {
+            "frames": len(self._costs),
+            "mean_ms": statistics.fmean(self._costs) if self._costs else 0.0,
+            "p95_ms": p95(self._costs),
+            "max_ms": max(self._costs, default=0.0),
+            "mean_interval_ms": statistics.fmean(self._intervals) if self._intervals else 0.0,
+            "max_interval_ms": max(self._intervals, default=0.0),
+        }
@@ -0,0 +1,210 @@
+# utils/image_ingest.py
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QImageIOHandler, QImageReader
+from utils.config_manager import get_config
+
+# Formats kept lossless (they may have transparency); everything else is stored as JPEG.
+LOSSLESS_EXTENSIONS = (".png", ".gif")
+
+# Color of the placeholder shown while an image is being downscaled.
+PLACEHOLDER_COLOR = QColor("#e0d8c0")
+
+
+def display_size(size, max_width):
+    """
+    Returns `size` scaled down (never up) to at most `max_width` pixels wide.
+
+    Args:
+        size (QSize): The original size.
+        max_width (int): The widest size images are shown at.
+
+    Returns:
+        QSize: The display size.
+    """
+    if size.width() <= max_width:
+        return QSize(size)
+    return QSize(max_width, max(1, round(size.height() * max_width / size.width())))
+
+def read_image_size(path):
+    """
+    Reads an image's size from its header, as it will be shown (EXIF rotation applied).
+
+    Returns:
+        QSize: The size; invalid if the file is not a readable image.
+    """
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid() and reader.transformation() & QImageIOHandler.TransformationRotate90:
+        size.transpose()
+    return size
+
+def decode_scaled(path, size):
+    """
+    Decodes an image directly at `size` (JPEG decoding skips the full-resolution pass).
+    Safe to call off the GUI thread.
+
+    Args:
+        path (str): The image file.
+        size (QSize): The display size, as returned by display_size.
+
+    Returns:
+        QImage: The image; null if it could not be decoded.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    # The reader scales before applying the EXIF rotation.
+    if reader.transformation() & QImageIOHandler.TransformationRotate90:
+        size = size.transposed()
+    reader.setScaledSize(size)
+    reader.setQuality(100)  # Ask the format handler for its smoothest scaling.
+    return reader.read()
+
+
+class IngestedImage:
+    """
+    An image accepted by ImageIngest: where its display copy will be stored, the size
+    it is shown at and whether that copy still has to be made.
+    """
+    __slots__ = ("source", "path", "width", "height", "pending")
+
+    def __init__(self, source, path, width, height, pending):
+        self.source = source
+        self.path = path
+        self.width = width
+        self.height = height
+        self.pending = pending
+
+    def placeholder(self):
+        """
+        Returns a tiny flat image shown (stretched to the display size) until the copy is ready.
+        """
+        image = QImage(1, 1, QImage.Format_RGB32)
+        image.fill(PLACEHOLDER_COLOR)
+        return image
+
+
+class ImageIngest(QObject):
+    """
+    Copies images inserted into notes into the storage folder at display resolution.
+
+    `ingest` only reads the image header, so it returns at once with the display size
+    and the path the copy will have; the decode, downscale and write happen in a pool of
+    worker threads, and `imageReady` (or `imageFailed`) is emitted on the GUI thread when
+    the copy exists. Copies are named after the source file's path, size and modification
+    time, so inserting the same file again reuses the existing copy.
+    """
+    imageReady = pyqtSignal(str, QImage)  # stored path, display image
+    imageFailed = pyqtSignal(str, str)    # stored path, source path
+
+    def __init__(self, folder, max_width, workers=2, parent=None):
+        """
+        Initializes the pipeline.
+
+        Args:
+            folder (str): Where display copies are stored.
+            max_width (int): The widest size images are shown at.
+            workers (int): The number of worker threads.
+            parent (QObject, optional): The parent object.
+        """
+        super().__init__(parent)
+        self.folder = folder
+        self.max_width = max_width
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-ingest")
+        self._pending = {}  # stored path -> Future
+
+    def stored_path(self, source):
+        """
+        Returns the path of the display copy of `source`.
+        """
+        stat = os.stat(source)
+        digest = hashlib.sha1(
+            f"{os.path.abspath(source)}|{stat.st_size}|{stat.st_mtime_ns}|{self.max_width}".encode()
+        ).hexdigest()[:20]
+        extension = ".png" if source.lower().endswith(LOSSLESS_EXTENSIONS) else ".jpg"
+        return os.path.join(self.folder, digest + extension)
+
+    def ingest(self, source):
+        """
+        Starts making the display copy of an image.
+
+        Args:
+            source (str): The image file chosen by the user.
+
+        Returns:
+            IngestedImage or None: The copy's path and display size, or None if `source`
+            is not a readable image.
+        """
+        size = read_image_size(source) if os.path.isfile(source) else QSize()
+        if not size.isValid():
+            return None
+        shown = display_size(size, self.max_width)
+        path = self.stored_path(source)
+        pending = not os.path.exists(path)
+        if pending and path not in self._pending:
+            self._pending[path] = self._pool.submit(self._make_copy, source, path, shown)
+        return IngestedImage(source, path, shown.width(), shown.height(), pending)
+
+    def is_pending(self, path):
+        return path in self._pending
+
+    def _make_copy(self, source, path, size):
+        try:
+            image = decode_scaled(source, size)
+            written = not image.isNull() and self._write(image, path)
+        except OSError:
+            written = False
+        if written:
+            self._emit(self.imageReady, path, image)
+        else:
+            self._emit(self.imageFailed, path, source)
+
+    def _write(self, image, path):
+        os.makedirs(self.folder, exist_ok=True)
+        # Written under a temporary name so a half-written copy is never picked up.
+        temporary = path + ".part"
+        image_format, quality = ("PNG", -1) if path.endswith(".png") else ("JPG", 85)
+        if not image.save(temporary, image_format, quality):
+            return False
+        os.replace(temporary, path)
+        return True
+
+    def _emit(self, signal, path, value):
+        try:
+            self._pending.pop(path, None)
+            signal.emit(path, value)
+        except RuntimeError:
+            pass  # The pipeline was deleted while the copy was being made.
+
+    def wait(self):
+        """
+        Blocks until every queued copy has been written.
+        """
+        for future in list(self._pending.values()):
+            future.result()
+
+    def shutdown(self):
+        """
+        Stops the worker threads once the queued copies are done.
+        """
+        self._pool.shutdown(wait=True)
+
+
+_image_ingest = None
+
+def get_image_ingest():
+    """
+    Returns the process-wide ImageIngest, configured by NOTE_IMAGES_FOLDER,
+    NOTE_IMAGE_MAX_WIDTH and NOTE_IMAGE_WORKERS. Must first be called on the GUI thread.
+    """
+    global _image_ingest
+    if _image_ingest is None:
+        _image_ingest = ImageIngest(
+            get_config("NOTE_IMAGES_FOLDER", "storage/images"),
+            get_config("NOTE_IMAGE_MAX_WIDTH", 1024),
+            workers=get_config("NOTE_IMAGE_WORKERS", 2),
+        )
+    return _image_ingest
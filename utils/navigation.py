@@ -34,3 +34,110 @@ def go_back(current_view, previous_view):
     except Exception as e:
         print("Error closing current view:", e)
     previous_view.show()  # Assumes previous_view has a show() method.
+
+class NavigationStack:
+    """
+    Bounded history of the views the user navigated away from.
+
+    Entries are either views that were replaced on screen (`push`) or state snapshots of a
+    view that stayed on screen but changed what it shows (`push_state`).
+
+    The most recent `live_entries` entries keep their widgets (hidden) so going back to
+    them is instant. Older entries are replaced by the state snapshot returned by the
+    widget's `view_state()` method - a small serializable dictionary whose "view" key
+    names the view type - and the widget is deleted; such entries are rebuilt when the
+    user navigates back to them. Widgets without `view_state()` cannot be rebuilt and are
+    dropped instead. Beyond `depth` entries the oldest are discarded.
+    """
+
+    def __init__(self, depth=20, live_entries=2):
+        """
+        Initializes the stack.
+
+        Args:
+            depth (int): The maximum number of entries.
+            live_entries (int): How many of the newest entries keep their widgets.
+        """
+        self.depth = depth
+        self.live_entries = live_entries
+        self._entries = []  # [widget or None, state or None], oldest first
+
+    def __len__(self):
+        return len(self._entries)
+
+    def push(self, widget):
+        """
+        Records a view the user is leaving. The caller must have hidden it already.
+
+        Args:
+            widget (QWidget): The view being left.
+        """
+        self._entries.append([widget, None])
+        self._snapshot_old_entries()
+        self._trim()
+
+    def push_state(self, state):
+        """
+        Records a state the user is leaving within a view that stays on screen, such as the
+        dashboard section that was open before switching to another one.
+
+        Args:
+            state (dict): The snapshot, as returned by the view's `view_state()`.
+        """
+        self._entries.append([None, state])
+        self._trim()
+
+    def _trim(self):
+        while len(self._entries) > self.depth:
+            old_widget, _ = self._entries.pop(0)
+            if old_widget is not None:
+                old_widget.deleteLater()
+
+    def _snapshot_old_entries(self):
+        for entry in self._entries[:max(0, len(self._entries) - self.live_entries)]:
+            widget = entry[0]
+            if widget is None:
+                continue
+            entry[0] = None
+            if hasattr(widget, "view_state"):
+                entry[1] = widget.view_state()
+            widget.deleteLater()
+        self._entries = [entry for entry in self._entries if entry[0] is not None or entry[1] is not None]
+
+    def pop(self):
+        """
+        Removes the newest entry.
+
+        Returns:
+            tuple or None: (widget, None) for a live entry, (None, state) for a snapshot,
+                           or None if the stack is empty.
+        """
+        if not self._entries:
+            return None
+        widget, state = self._entries.pop()
+        return widget, state
+
+    def clear(self):
+        """
+        Drops every entry, deleting the live widgets.
+        """
+        for widget, _ in self._entries:
+            if widget is not None:
+                widget.deleteLater()
+        self._entries = []
+
+    def snapshots(self):
+        """
+        Returns the serializable state of every entry, oldest first. Live entries are
+        snapshotted on the fly; entries that cannot be snapshotted are left out.
+
+        Returns:
+            list: State dictionaries.
+        """
+        states = []
+        for widget, state in self._entries:
+            if widget is not None:
+                state = widget.view_state() if hasattr(widget, "view_state") else None
+            if state is not None:
+                states.append(state)
+        return states
@@ -0,0 +1,95 @@
+# utils/persistence_queue.py
+from PyQt5.QtCore import QObject, pyqtSignal
+from core.write_queue import WriteQueue
+
+# Process-wide queues, keyed by the id of the store they write to.
+_queues = {}
+# Callables run by flush_all before the queues are flushed, e.g. to save open notes.
+_flush_hooks = []
+
+
+class PersistenceQueue(QObject):
+    """
+    Qt front end of core.write_queue.WriteQueue.
+
+    Saves are written on the queue's worker thread as before; its results are re-emitted
+    as `saved` and `failed`, which Qt delivers on the UI thread.
+    """
+    saved = pyqtSignal(str)        # date
+    failed = pyqtSignal(str, str)  # date, error message
+
+    def __init__(self, store, delay_ms=300, parent=None):
+        """
+        Initializes the queue and starts its worker thread.
+
+        Args:
+            store: The task store to write to.
+            delay_ms (int): How long to wait for further saves before writing.
+            parent (QObject, optional): The parent object.
+        """
+        super().__init__(parent)
+        self.store = store
+        self._queue = WriteQueue(store, delay_ms, on_saved=self.saved.emit, on_failed=self.failed.emit)
+
+    def submit(self, date, tasks):
+        """
+        Marks a date as dirty and restarts the debounce delay.
+        """
+        self._queue.submit(date, tasks)
+
+    def pending(self, date):
+        """
+        Returns the tasks queued for a date that have not been written yet, or None.
+        """
+        return self._queue.pending(date)
+
+    def flush(self):
+        """
+        Writes every pending date and blocks until the worker is done.
+        """
+        self._queue.flush()
+
+    def close(self):
+        """
+        Flushes pending saves and stops the worker thread.
+        """
+        self._queue.close()
+
+
+def get_persistence_queue(store, delay_ms=300):
+    """
+    Returns the process-wide PersistenceQueue for a store, creating it on first use.
+
+    Args:
+        store: The task store the queue writes to.
+        delay_ms (int): The debounce delay used when the queue is created.
+
+    Returns:
+        PersistenceQueue: The shared queue for that store.
+    """
+    queue = _queues.get(id(store))
+    if queue is None:
+        queue = _queues[id(store)] = PersistenceQueue(store, delay_ms)
+    return queue
+
+
+def add_flush_hook(hook):
+    """
+    Registers a callable that flush_all runs first, for edits kept outside the queues
+    (such as the text of an open note).
+
+    Args:
+        hook (callable): Called with no arguments.
+    """
+    if hook not in _flush_hooks:
+        _flush_hooks.append(hook)
+
+def flush_all():
+    """
+    Runs the flush hooks, then synchronously writes everything still queued in every
+    persistence queue.
+    """
+    for hook in list(_flush_hooks):
+        hook()
+    for queue in list(_queues.values()):
+        queue.flush()
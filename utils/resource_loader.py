@@ -1,29 +1,243 @@
 # utils/resource_loader.py
-from PyQt5.QtGui import QPixmap
+import threading
 
-def load_image(path, size=None):
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache
+from utils.config_manager import get_config
+from core.lru_cache import ByteLRUCache
+
+# Room left in QPixmapCache for Qt's own entries (styles cache their rendered pixmaps there).
+QT_PIXMAP_CACHE_HEADROOM = 10 * 1024 * 1024
+
+
+def pixmap_key(path, size=None, smooth=False, keep_aspect=False):
+    """
+    Returns the cache key of an image variant.
+
+    Args:
+        path (str): The path to the image file.
+        size (tuple, optional): (width, height) the image is scaled to, or None for the original.
+        smooth (bool): Whether the scaling is smooth (bilinear) rather than fast.
+        keep_aspect (bool): Whether the scaling keeps the aspect ratio.
+
+    Returns:
+        str: The key, as used in QPixmapCache.
+    """
+    if size is None:
+        return f"resource:{path}"
+    mode = ("smooth" if smooth else "fast") + ("-keep" if keep_aspect else "")
+    return f"resource:{path}@{size[0]}x{size[1]}:{mode}"
+
+def pixmap_bytes(pixmap):
+    """
+    Returns the memory taken by a pixmap's pixels.
+    """
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+def scale_image(image, size, smooth=False, keep_aspect=False):
+    """
+    Scales a QImage or QPixmap with the given transform and aspect modes.
+    """
+    return image.scaled(
+        size[0], size[1],
+        Qt.KeepAspectRatio if keep_aspect else Qt.IgnoreAspectRatio,
+        Qt.SmoothTransformation if smooth else Qt.FastTransformation,
+    )
+
+
+class PixmapCache(QObject):
+    """
+    Caches decoded and scaled images in QPixmapCache.
+
+    Every variant (path, size, transform, aspect) is cached under its own key, and a
+    scaled variant is made from the cached original, so an image file is decoded once
+    however many sizes it is shown at. Entries are tracked in a ByteLRUCache with the
+    cache's byte budget; evicting an entry there removes it from QPixmapCache. Qt may also
+    drop entries on its own, which simply shows up as a miss.
+
+    `preload` decodes images on a worker thread (as QImages, which unlike QPixmaps may be
+    created off the GUI thread) and converts them to pixmaps on the GUI thread.
+    """
+    imageDecoded = pyqtSignal(str, QImage)  # key, decoded and scaled image
+
+    def __init__(self, max_bytes, parent=None):
+        """
+        Initializes the cache and raises QPixmapCache's limit to fit its budget.
+
+        Args:
+            max_bytes (int): The budget for the cached pixels in bytes.
+            parent (QObject, optional): The parent object.
+        """
+        super().__init__(parent)
+        self._index = ByteLRUCache(max_bytes, on_evict=lambda key, _: QPixmapCache.remove(key))
+        self.hits = 0
+        self.misses = 0
+        self.preloaded = 0
+        self.imageDecoded.connect(self._insert_image)
+        limit_kb = (max_bytes + QT_PIXMAP_CACHE_HEADROOM) // 1024
+        if QPixmapCache.cacheLimit() < limit_kb:
+            QPixmapCache.setCacheLimit(limit_kb)
+
+    def pixmap(self, path, size=None, smooth=False, keep_aspect=False):
+        """
+        Returns an image, decoding and scaling it only if that variant is not cached.
+
+        Args:
+            path (str): The path to the image file.
+            size (tuple, optional): A tuple (width, height) to scale the image to.
+            smooth (bool): Use smooth instead of fast scaling.
+            keep_aspect (bool): Fit the image inside `size` instead of stretching it.
+
+        Returns:
+            QPixmap: The image; a null pixmap if the file could not be read.
+        """
+        key = pixmap_key(path, size, smooth, keep_aspect)
+        pixmap = self._find(key)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+        pixmap = self._original(path)
+        if size is not None and not pixmap.isNull():
+            pixmap = scale_image(pixmap, size, smooth, keep_aspect)
+            self._insert(key, pixmap)
+        return pixmap
+
+    def _original(self, path):
+        key = pixmap_key(path)
+        pixmap = self._find(key)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            self._insert(key, pixmap)
+        return pixmap
+
+    def preload(self, images):
+        """
+        Decodes images on a worker thread so later `pixmap` calls hit the cache.
+
+        Args:
+            images (iterable): Tuples of `pixmap` arguments, e.g. ("a.png", (30, 30), True, True).
+
+        Returns:
+            threading.Thread: The worker thread.
+        """
+        thread = threading.Thread(target=self._decode, args=(list(images),), name="image-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _decode(self, images):
+        originals = {}
+        for image in images:
+            path, size, smooth, keep_aspect = (tuple(image) + (None, False, False))[:4]
+            key = pixmap_key(path, size, smooth, keep_aspect)
+            if key in self._index:
+                continue
+            if path not in originals:
+                originals[path] = QImage(path)
+            decoded = originals[path]
+            if decoded.isNull():
+                continue
+            if size is not None:
+                decoded = scale_image(decoded, size, smooth, keep_aspect)
+            try:
+                self.imageDecoded.emit(key, decoded)
+            except RuntimeError:
+                return  # The cache was deleted while decoding.
+
+    def _insert_image(self, key, image):
+        if key not in self._index:
+            self._insert(key, QPixmap.fromImage(image))
+            self.preloaded += 1
+
+    def _find(self, key):
+        if self._index.peek(key) is None:
+            return None
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            self._index.pop(key)  # Dropped by Qt to make room for other entries.
+            return None
+        self._index.get(key)  # Mark as recently used.
+        return pixmap
+
+    def _insert(self, key, pixmap):
+        if pixmap.isNull():
+            return
+        if QPixmapCache.insert(key, pixmap):
+            self._index.put(key, key, pixmap_bytes(pixmap))
+
+    def clear(self):
+        """
+        Removes every cached image.
+        """
+        for key in self._index.keys():
+            QPixmapCache.remove(key)
+        self._index.clear()
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: Entry count, bytes used, byte budget, hits, misses, evictions, images
+            preloaded and hit rate.
+        """
+        index = self._index.stats()
+        lookups = self.hits + self.misses
+        return {
+            "entries": index["entries"],
+            "bytes": index["bytes"],
+            "max_bytes": index["max_bytes"],
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": index["evictions"],
+            "preloaded": self.preloaded,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_pixmap_cache = None
+
+def get_pixmap_cache():
+    """
+    Returns the process-wide PixmapCache, created with PIXMAP_CACHE_BYTES on first use.
+    Must first be called on the GUI thread, after the QApplication exists.
+    """
+    global _pixmap_cache
+    if _pixmap_cache is None:
+        _pixmap_cache = PixmapCache(get_config("PIXMAP_CACHE_BYTES", 16 * 1024 * 1024))
+    return _pixmap_cache
+
+def load_image(path, size=None, smooth=False, keep_aspect=False):
     """
     Loads an image from the specified path and optionally resizes it.
-    
+    Decoded and scaled images are cached (see PixmapCache).
+
     Args:
         path (str): The path to the image file.
         size (tuple, optional): A tuple (width, height) to resize the image.
-        
+        smooth (bool): Use smooth instead of fast scaling.
+        keep_aspect (bool): Fit the image inside `size` instead of stretching it.
+
     Returns:
         QPixmap: The loaded image as a QPixmap.
     """
-    pixmap = QPixmap(path)
-    if size:
-        pixmap = pixmap.scaled(size[0], size[1])
-    return pixmap
+    return get_pixmap_cache().pixmap(path, size, smooth, keep_aspect)
+
+def preload_images(images=None):
+    """
+    Starts decoding the images listed in PRELOAD_IMAGES (or `images`) in the background.
+    """
+    if images is None:
+        images = get_config("PRELOAD_IMAGES", ())
+    return get_pixmap_cache().preload(images)
 
 def load_stylesheet(path):
     """
     Loads a stylesheet (CSS/QSS file) from the specified path.
-    
+
     Args:
         path (str): The path to the stylesheet file.
-        
+
     Returns:
         str: The content of the stylesheet.
     """
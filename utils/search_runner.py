@@ -0,0 +1,98 @@
+# utils/search_runner.py
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.log import log_error
+
+
+class SearchRunner(QObject):
+    """
+    Runs searches (or any other cancellable query) on a worker thread, keeping only the
+    most recent query.
+
+    Every call to `start` supersedes the previous query: a query that has not started yet
+    is dropped, and a running one sees its `cancelled()` callback turn True and stops
+    between batches. Batches are delivered through `resultsReady` tagged with the query's
+    generation number so the UI can ignore results from superseded queries. A query that
+    raises is logged and reported through `failed`; the worker keeps serving later queries.
+    """
+    resultsReady = pyqtSignal(int, list)  # generation, batch of results
+    finished = pyqtSignal(int)            # generation
+    failed = pyqtSignal(int, str)         # generation, error message
+
+    def __init__(self, search, parent=None):
+        """
+        Initializes the runner and starts its worker thread.
+
+        Args:
+            search (callable): Called as search(query, cancelled) on the worker thread; must
+                               return an iterable of result batches.
+            parent (QObject, optional): The parent object.
+        """
+        super().__init__(parent)
+        self._search = search
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._query = None  # (generation, query) waiting to be run.
+        self._stopped = False
+        self._worker = threading.Thread(target=self._run, name="search-runner", daemon=True)
+        self._worker.start()
+
+    def start(self, query):
+        """
+        Queues a query, cancelling the one currently running or waiting.
+
+        Args:
+            query (str): The query to run.
+
+        Returns:
+            int: The generation number that tags this query's results.
+        """
+        with self._condition:
+            self._generation += 1
+            self._query = (self._generation, query)
+            self._condition.notify_all()
+            return self._generation
+
+    def cancel(self):
+        """
+        Cancels the running or waiting query without starting a new one.
+        """
+        with self._condition:
+            self._generation += 1
+            self._query = None
+
+    def stop(self):
+        """
+        Cancels any query and stops the worker thread.
+        """
+        with self._condition:
+            self._generation += 1
+            self._query = None
+            self._stopped = True
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._query is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                generation, query = self._query
+                self._query = None
+
+            def cancelled():
+                return generation != self._generation
+
+            try:
+                for batch in self._search(query, cancelled):
+                    if cancelled():
+                        break
+                    self.resultsReady.emit(generation, batch)
+                else:
+                    self.finished.emit(generation)
+            except Exception as e:
+                log_error(f"Search for {query!r} failed: {e!r}")
+                self.failed.emit(generation, str(e))
@@ -0,0 +1,149 @@
+# utils/startup_profiler.py
+"""
+Startup timeline for `python main.py --profile-startup`.
+
+Only uses the standard library at import time, so main.py can start it before importing
+Qt or any of the application's modules.
+"""
+import builtins
+import json
+import sys
+import time
+
+
+class StartupProfiler:
+    """
+    Records when each startup phase ends and how long every module took to import.
+
+    Phases are closed with `mark(name)`: a phase lasts from the previous mark (or the
+    profiler's start) to this one. Imports are timed by wrapping `__import__` between
+    `start()` and `stop_tracing()`; each module imported for the first time is recorded
+    with its start offset, cumulative time (including the modules it imported) and self
+    time.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []   # (name, end offset in ms, duration in ms)
+        self.imports = []  # (module, start offset in ms, cumulative ms, self ms, depth)
+        self._last_mark = self.started
+        self._original_import = None
+        self._child_time = []  # Time spent in nested imports, one entry per open import.
+
+    @classmethod
+    def start(cls):
+        """
+        Creates a profiler and starts timing imports.
+        """
+        profiler = cls()
+        profiler._original_import = builtins.__import__
+        builtins.__import__ = profiler._traced_import
+        return profiler
+
+    def stop_tracing(self):
+        """
+        Stops timing imports.
+        """
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _traced_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+        self._child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._child_time.pop()
+            if self._child_time:
+                self._child_time[-1] += elapsed
+            self.imports.append((
+                name,
+                (start - self.started) * 1e3,
+                elapsed * 1e3,
+                (elapsed - children) * 1e3,
+                len(self._child_time),
+            ))
+
+    def mark(self, name):
+        """
+        Ends the current phase and names it.
+        """
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.started) * 1e3, (now - self._last_mark) * 1e3))
+        self._last_mark = now
+
+    def timeline(self):
+        """
+        Returns the recorded phases and imports.
+
+        Returns:
+            dict: "phases" as {"name", "end_ms", "ms"} and "imports" as {"module",
+            "start_ms", "cumulative_ms", "self_ms", "depth"}, in the order they happened.
+        """
+        return {
+            "phases": [{"name": name, "end_ms": end, "ms": duration} for name, end, duration in self.phases],
+            "imports": [
+                {"module": module, "start_ms": start, "cumulative_ms": total, "self_ms": own, "depth": depth}
+                for module, start, total, own, depth in sorted(self.imports, key=lambda entry: entry[1])
+            ],
+        }
+
+    def report(self, top=20):
+        """
+        Formats the phases and the `top` slowest top-level imports as text.
+        """
+        lines = ["Startup phases (ms):", f"{'at':>9} {'took':>8}  phase"]
+        for name, end, duration in self.phases:
+            lines.append(f"{end:>9.1f} {duration:>8.1f}  {name}")
+        slowest = sorted(self.imports, key=lambda entry: entry[2], reverse=True)[:top]
+        lines += ["", f"Slowest imports (ms, {len(self.imports)} modules imported):",
+                  f"{'at':>9} {'total':>8} {'self':>8}  module"]
+        for module, start, total, own, depth in slowest:
+            lines.append(f"{start:>9.1f} {total:>8.1f} {own:>8.1f}  {'  ' * depth}{module}")
+        return "\n".join(lines)
+
+
+def startup_profile_mode(argv):
+    """
+    Returns the --profile-startup mode given on the command line: "text", "json" or None.
+    """
+    for arg in argv[1:]:
+        if arg == "--profile-startup":
+            return "text"
+        if arg.startswith("--profile-startup="):
+            return arg.split("=", 1)[1] or "text"
+    return None
+
+def write_report(profiler, mode, stream=None):
+    """
+    Writes the profiler's report (as text or JSON) to `stream`, stderr by default.
+    """
+    stream = stream or sys.stderr
+    if mode == "json":
+        json.dump(profiler.timeline(), stream)
+        stream.write("\n")
+    else:
+        stream.write(profiler.report() + "\n")
+    stream.flush()
+
+def on_first_paint(widget, callback):
+    """
+    Calls `callback()` once, when `widget` receives its first paint event.
+    """
+    from PyQt5.QtCore import QEvent, QObject
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                watched.removeEventFilter(self)
+                callback()
+            return False
+
+    event_filter = FirstPaintFilter(widget)
+    widget.installEventFilter(event_filter)
+    return event_filter
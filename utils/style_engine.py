@@ -0,0 +1,220 @@
+# utils/style_engine.py
+import os
+import re
+
+from utils.resource_loader import load_stylesheet
+
+# objectName of MainWindow's central widget. Its descendant rule gives every widget the
+# window's translucent look, so component rules are also emitted under it to win over it.
+WINDOW_SCOPE = "#CentralWidget"
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+
+# The translucent gradient of the main window, applied to it and everything inside it.
+WINDOW_RULES = """
+QWidget#CentralWidget, #CentralWidget QWidget {
+    background: qlineargradient(
+        x1: 0, y1: 0,
+        x2: 0, y2: 1,
+        stop: 0 rgba(255, 245, 230, 200),
+        stop: 0.5 rgba(255, 245, 230, 150),
+        stop: 1 rgba(255, 245, 230, 100)
+    );
+    border: 1px solid rgba(255, 255, 255, 100);
+    border-radius: 10px;
+}
+"""
+
+# Widgets opt in with set_style_role(widget, role, variant); variants are dynamic properties,
+# so changing one is a property flip rather than a new style sheet.
+COMPONENT_RULES = """
+QPushButton[styleRole="button"] {
+    color: black;
+    padding: 0px;
+    border-radius: 0px;
+    font-size: 14px;
+    font-family: Arial;
+    border: none;
+    border-bottom: 2px solid #c9c3be;
+}
+QPushButton[styleRole="button"]:hover {
+    background-color: #c9c3be;
+}
+
+QLabel[styleRole="label"] {
+    font-size: 14px;
+    color: #333;
+    font-family: Arial;
+}
+QLabel[styleRole="label"][styleVariant="title"] {
+    font-size: 18px;
+    color: #000;
+}
+QLabel[styleRole="label"][styleVariant="muted"] {
+    font-size: 16px;
+    color: #555;
+}
+
+QSplitter[styleRole="dashboard"]::handle {
+    border: 2px dotted #c9c3be;
+}
+
+QCalendarWidget[styleRole="calendar"] {
+    background-color: #f5f5dc;
+    color: #555;
+    font-size: 16px;
+    border: 1px solid #c9c3be;
+}
+QCalendarWidget[styleRole="calendar"] QWidget#qt_calendar_navigationbar {
+    background-color: #e0d8c0;
+    color: #555;
+    font-size: 18px;
+    padding: 5px;
+}
+QCalendarWidget[styleRole="calendar"] QToolButton {
+    background-color: #d0c8b0;
+    color: #555;
+    font-size: 16px;
+    border: 1px solid #c9c3be;
+    padding: 5px;
+}
+
+QWidget#TitleBar, QWidget#TitleBar QWidget {
+    background-color: #2E3440;
+    color: #D8DEE9;
+    border-top-left-radius: 10px;
+    border-top-right-radius: 10px;
+}
+QWidget#TitleBar QPushButton {
+    background-color: transparent;
+    border: none;
+    color: #D8DEE9;
+    padding: 5px;
+}
+QWidget#TitleBar QPushButton:hover {
+    background-color: #4C566A;
+}
+
+QWidget#FloatingControl QPushButton {
+    background-color: #c9c3be;
+    color: white;
+    border: none;
+    border-radius: 15px;
+    font-size: 16px;
+}
+QWidget#FloatingControl QPushButton:hover {
+    background-color: #a6a19d;
+}
+QWidget#FloatingControl QLabel {
+    background: transparent;
+}
+"""
+
+
+def scope_rules(qss, scope):
+    """
+    Returns the rules of `qss` with every selector emitted both as written and under `scope`.
+
+    Args:
+        qss (str): Style sheet text without nested blocks.
+        scope (str): A selector such as "#CentralWidget".
+
+    Returns:
+        str: The rewritten style sheet.
+    """
+    rules = []
+    for selectors, body in _RULE_RE.findall(_COMMENT_RE.sub("", qss)):
+        selectors = [selector.strip() for selector in selectors.split(",") if selector.strip()]
+        scoped = selectors + [f"{scope} {selector}" for selector in selectors]
+        rules.append(f"{', '.join(scoped)} {{{body}}}")
+    return "\n".join(rules)
+
+
+class StyleEngine:
+    """
+    Collects the application's style rules into one style sheet that is compiled once.
+
+    Rules are added in named layers; later layers come after earlier ones in the compiled
+    sheet. Applying the sheet to the QApplication lets Qt parse it a single time instead
+    of once per widget, and widgets pick up their rules through objectName and dynamic
+    properties (see set_style_role).
+    """
+
+    def __init__(self):
+        self._layers = {}
+        self._compiled = None
+
+    def add_rules(self, name, qss, scope=None):
+        """
+        Adds or replaces a layer of rules.
+
+        Args:
+            name (str): The layer name.
+            qss (str): The style sheet text.
+            scope (str, optional): Also emit every rule under this selector.
+        """
+        self._layers[name] = scope_rules(qss, scope) if scope else qss
+        self._compiled = None
+
+    def compile(self):
+        """
+        Returns the combined style sheet, building it on first use.
+        """
+        if self._compiled is None:
+            self._compiled = "\n\n".join(self._layers.values())
+        return self._compiled
+
+    def apply(self, target):
+        """
+        Installs the compiled style sheet on a QApplication (or a top-level widget).
+        """
+        target.setStyleSheet(self.compile())
+
+
+_engine = None
+
+def get_style_engine(root=""):
+    """
+    Returns the process-wide StyleEngine, loading the default layers on first use:
+    resources/styles.css, the window look and the component rules.
+
+    Args:
+        root (str): The folder holding the resources folder (the working directory by default).
+    """
+    global _engine
+    if _engine is None:
+        _engine = StyleEngine()
+        _engine.add_rules("base", load_stylesheet(os.path.join(root, "resources", "styles.css")))
+        _engine.add_rules("window", WINDOW_RULES)
+        _engine.add_rules("components", COMPONENT_RULES, scope=WINDOW_SCOPE)
+    return _engine
+
+def apply_styles(app, root=""):
+    """
+    Compiles the application style sheet and installs it on `app`. Called once at startup.
+    """
+    get_style_engine(root).apply(app)
+
+def set_style_role(widget, role, variant=None):
+    """
+    Tags a widget for the component rules. Call before the widget is first shown.
+
+    Args:
+        widget (QWidget): The widget.
+        role (str): The styleRole property, e.g. "button" or "label".
+        variant (str, optional): The styleVariant property, e.g. "title".
+    """
+    widget.setProperty("styleRole", role)
+    if variant is not None:
+        widget.setProperty("styleVariant", variant)
+
+def set_style_variant(widget, variant):
+    """
+    Switches a widget that is already shown to another variant and re-polishes only that widget.
+    """
+    widget.setProperty("styleVariant", variant)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -1,5 +1,6 @@
 # utils/ui_helpers.py
 from PyQt5.QtWidgets import QPushButton, QLabel
+from utils.style_engine import set_style_role
 
 def set_window_default_background(widget):
     """
@@ -16,14 +17,15 @@ def set_window_default_background(widget):
     global_style = "background-color: #f9f9f9; font-family: Arial; font-size: 14px;"
     widget.setStyleSheet(global_style)
 
-def create_button(parent, text, command, **options):
+def create_button(parent, text, command, variant=None, **options):
     """
-    Creates a standardized QPushButton with inline QSS that mimics the following CSS:
+    Creates a standardized QPushButton styled by the application style sheet
+    (the "button" rules in utils/style_engine.py):
     
     QPushButton {
-        background-color: #9C8676;
-        color: white;
+        color: black;
         border: none;
+        border-bottom: 2px solid #c9c3be;
         padding: 0px;
         border-radius: 0px;
         font-size: 14px;
@@ -31,11 +33,13 @@ def create_button(parent, text, command, **options):
     }
     
     QPushButton:hover {
-        background-color: #C3A793;
+        background-color: #c9c3be;
     }
     
-    You can override any of these properties by passing keyword arguments. For example:
+    Prefer a `variant` registered in the style engine over per-button overrides. Keyword
+    overrides are still accepted, for example:
       create_button(parent, "Click Me", callback, background_color="#123456", hover={"background-color": "#654321"})
+    but they give the button its own style sheet, which Qt has to parse separately.
     
     Note: In Python keyword arguments use underscores instead of hyphens. They will be
     converted to hyphenated CSS property names.
@@ -44,6 +48,7 @@ def create_button(parent, text, command, **options):
         parent (QWidget): The parent widget.
         text (str): The button label.
         command (callable): The function to execute on button click.
+        variant (str, optional): A button variant defined in the style engine.
         **options: Additional styling options to override defaults. To override hover styles,
                    pass a dictionary using the key 'hover'.
     
@@ -51,51 +56,22 @@ def create_button(parent, text, command, **options):
         QPushButton: The created button with the defined styling.
     """
     button = QPushButton(text, parent)
-    
-    # Default normal state style as a dictionary.
-    normal_default = {
-        # "background-color": "#9C8676",
-        "color": "black",
-        "border": "none",
-        "padding": "0px",
-        "border-radius": "0px",
-        "font-size": "14px",
-        "font-family": "Arial",
-        "border": "none",  # Clear any default borders.
-        "border-bottom": "2px solid #c9c3be"  # Only bottom border.
-    }
-    # Default hover style.
-    hover_default = {
-        "background-color": "#c9c3be"
-    }
+    set_style_role(button, "button", variant)
     
     # Extract hover options if provided.
     hover_options = options.pop("hover", {})
-    
-    # Convert Python-style keys (with underscores) to CSS keys (with hyphens).
-    def convert_keys(style_dict):
-        return {k.replace("_", "-"): v for k, v in style_dict.items()}
-    
-    normal_override = convert_keys(options)
-    hover_override = convert_keys(hover_options)
-    
-    # Merge default styles with any overrides (overrides take precedence).
-    normal_style = {**normal_default, **normal_override}
-    hover_style = {**hover_default, **hover_override}
-    
-    # Convert the style dictionaries into CSS strings.
-    normal_style_string = "; ".join(f"{k}: {v}" for k, v in normal_style.items())
-    hover_style_string = "; ".join(f"{k}: {v}" for k, v in hover_style.items())
-    
-    # Construct the final QSS style.
-    style = f"QPushButton {{ {normal_style_string}; }} QPushButton:hover {{ {hover_style_string}; }}"
-    button.setStyleSheet(style)
+    if options or hover_options:
+        style = f"QPushButton {{ {style_declarations(options)}; }}"
+        if hover_options:
+            style += f" QPushButton:hover {{ {style_declarations(hover_options)}; }}"
+        button.setStyleSheet(style)
     button.clicked.connect(command)
     return button
 
-def create_label(parent, text, **options):
+def create_label(parent, text, variant=None, **options):
     """
-    Creates a standardized QLabel with inline styling equivalent to:
+    Creates a standardized QLabel styled by the application style sheet
+    (the "label" rules in utils/style_engine.py):
     
     QLabel {
         font-size: 14px;
@@ -103,36 +79,31 @@ def create_label(parent, text, **options):
         font-family: Arial;
     }
     
-    Extra styling options can be provided as keyword arguments. For example:
-      create_label(parent, "Title", font_size="18px", color="#000")
+    The "title" variant uses 18px black text and "muted" 16px grey text, for example:
+      create_label(parent, "Title", variant="title")
+    Keyword overrides (e.g. font_size="18px") are still accepted but give the label its
+    own style sheet.
     
     Note: Use underscores in place of hyphens in property names.
     
     Args:
         parent (QWidget): The parent widget.
         text (str): The text to display.
+        variant (str, optional): A label variant defined in the style engine.
         **options: Additional styling options.
     
     Returns:
         QLabel: The created label with the defined styling.
     """
     label = QLabel(text, parent)
-    
-    # Default label style.
-    default_style = {
-        "font-size": "14px",
-        "color": "#333",
-        "font-family": "Arial"
-    }
-    
-    # Convert keyword arguments from underscores to hyphens.
-    def convert_keys(style_dict):
-        return {k.replace("_", "-"): v for k, v in style_dict.items()}
-    
-    override_style = convert_keys(options)
-    
-    # Merge the default style with any overrides.
-    combined_style = {**default_style, **override_style}
-    style_string = "; ".join(f"{k}: {v}" for k, v in combined_style.items())
-    label.setStyleSheet(style_string)
+    set_style_role(label, "label", variant)
+    if options:
+        label.setStyleSheet(style_declarations(options))
     return label
+
+def style_declarations(options):
+    """
+    Converts keyword styling options into QSS declarations, e.g. {"font_size": "18px"}
+    into "font-size: 18px".
+    """
+    return "; ".join(f"{key.replace('_', '-')}: {value}" for key, value in options.items())
@@ -0,0 +1,172 @@
+# utils/view_cache.py
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QWidget
+
+# Rough memory cost of one widget and its style data, used when a view has no estimate of its own.
+WIDGET_BYTES = 4 * 1024
+
+EVICTION_POLICIES = ("lru", "largest")
+
+
+def estimate_view_bytes(view):
+    """
+    Estimates the memory held by a view.
+
+    A view can report its own estimate through a `memory_estimate()` method; otherwise
+    every widget in it is counted at WIDGET_BYTES.
+
+    Args:
+        view (QWidget): The view.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    estimate = getattr(view, "memory_estimate", None)
+    if callable(estimate):
+        return estimate()
+    return (len(view.findChildren(QWidget)) + 1) * WIDGET_BYTES
+
+
+class ViewCache:
+    """
+    Keeps recently used views alive (hidden) so switching back to them is instant.
+
+    Views are created on a miss by the factory passed to `get`, and kept until the cache
+    holds more than `max_views` views or more than `max_bytes` estimated bytes. Eviction
+    then deletes views chosen by the policy: "lru" drops the least recently shown view,
+    "largest" the one with the biggest estimate. The view passed to `get` last is never
+    evicted, since it is the one on screen.
+    """
+
+    def __init__(self, max_views=4, max_bytes=32 * 1024 * 1024, policy="lru", on_evict=None):
+        """
+        Initializes the cache.
+
+        Args:
+            max_views (int): The maximum number of cached views; 0 disables caching.
+            max_bytes (int): The budget for the views' estimated memory.
+            policy (str): "lru" or "largest".
+            on_evict (callable, optional): Called as on_evict(key, view) before a view is deleted.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_views = max_views
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.on_evict = on_evict
+        self._entries = OrderedDict()  # key -> (view, estimated bytes), least recently used first
+        self._current = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def is_cached(self, view):
+        """
+        Returns True if `view` is held by the cache.
+        """
+        return any(entry[0] is view for entry in self._entries.values())
+
+    def get(self, key, factory):
+        """
+        Returns the cached view for `key`, creating it with `factory()` on a miss.
+        The view becomes the current one and is protected from eviction.
+
+        Args:
+            key: Identifies the view, e.g. "calendar".
+            factory (callable): Builds the view.
+
+        Returns:
+            QWidget: The view.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            self._current = key
+            return entry[0]
+        self.misses += 1
+        view = factory()
+        if self.max_views <= 0:
+            return view
+        self._entries[key] = (view, estimate_view_bytes(view))
+        self._current = key
+        self._evict()
+        return view
+
+    def refresh_size(self, key):
+        """
+        Re-estimates a cached view's memory, e.g. after it loaded more data, and evicts if needed.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (entry[0], estimate_view_bytes(entry[0]))
+            self._evict()
+
+    def discard(self, key):
+        """
+        Removes a view from the cache without deleting it.
+
+        Returns:
+            QWidget or None: The view, or None if it was not cached.
+        """
+        entry = self._entries.pop(key, None)
+        if key == self._current:
+            self._current = None
+        return None if entry is None else entry[0]
+
+    def clear(self):
+        """
+        Deletes every cached view except the current one.
+        """
+        for key in [key for key in self._entries if key != self._current]:
+            self._delete(key)
+
+    def total_bytes(self):
+        return sum(size for _, size in self._entries.values())
+
+    def _victim(self):
+        candidates = [key for key in self._entries if key != self._current]
+        if not candidates:
+            return None
+        if self.policy == "largest":
+            return max(candidates, key=lambda key: self._entries[key][1])
+        return candidates[0]
+
+    def _evict(self):
+        while len(self._entries) > self.max_views or self.total_bytes() > self.max_bytes:
+            key = self._victim()
+            if key is None:
+                return
+            self._delete(key)
+            self.evictions += 1
+
+    def _delete(self, key):
+        view, _ = self._entries.pop(key)
+        if self.on_evict is not None:
+            self.on_evict(key, view)
+        view.deleteLater()
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: Views cached, estimated bytes, hits, misses and evictions.
+        """
+        return {
+            "views": len(self._entries),
+            "bytes": self.total_bytes(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -1,9 +1,14 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QCalendarWidget, QLabel
-from PyQt5.QtCore import QDate
+from PyQt5.QtCore import QDate, Qt
+from PyQt5.QtGui import QColor, QTextCharFormat
 from components.task_list import TaskList
+from utils.style_engine import set_style_role
 
 
 class CalendarView(QWidget):
+    # Background colours for days with tasks, as (minimum task count, colour), strongest last.
+    HEAT_LEVELS = ((1, "#efe6d6"), (3, "#e0cfb4"), (6, "#c9b08a"))
+
     def __init__(self, parent=None):
         """
         Constructs the calendar view UI with task list.
@@ -27,7 +32,7 @@ class CalendarView(QWidget):
         layout.addWidget(self.calendar)
 
         self.date_label = QLabel("Selected Date: ", self)
-        self.date_label.setStyleSheet("font-size: 16px; color: #555;")
+        set_style_role(self.date_label, "label", "muted")
         layout.addWidget(self.date_label)
 
         # Task List Component
@@ -38,26 +43,60 @@ class CalendarView(QWidget):
 
     def customize_calendar_style(self):
         """
-        Applies custom styling to the QCalendarWidget.
-        """
-        self.calendar.setStyleSheet("""
-            QCalendarWidget {
-                background-color: #f5f5dc;
-                color: #555;
-                font-size: 16px;
-                border: 1px solid #c9c3be;
-            }
-            QCalendarWidget QWidget#qt_calendar_navigationbar {
-                background-color: #e0d8c0;
-                color: #555;
-                font-size: 18px;
-                padding: 5px;
-            }
-            QCalendarWidget QToolButton {
-                background-color: #d0c8b0;
-                color: #555;
-                font-size: 16px;
-                border: 1px solid #c9c3be;
-                padding: 5px;
-            }
-        """)
+        Tags the QCalendarWidget for the "calendar" rules of the application style sheet.
+        """
+        set_style_role(self.calendar, "calendar")
+
+    def visible_date_range(self):
+        """
+        Returns the first and last date of the 6x7 day grid shown for the current month.
+
+        Returns:
+            tuple: (first QDate, last QDate).
+        """
+        first_of_month = QDate(self.calendar.yearShown(), self.calendar.monthShown(), 1)
+        offset = (first_of_month.dayOfWeek() - int(self.calendar.firstDayOfWeek())) % 7
+        # Like QCalendarWidget, show a full week of the previous month when the month starts the first row.
+        if offset == 0:
+            offset = 7
+        first = first_of_month.addDays(-offset)
+        return first, first.addDays(6 * 7 - 1)
+
+    def heat_format(self, count):
+        """
+        Returns the text format used to shade a day holding `count` tasks.
+        """
+        if not hasattr(self, "_heat_formats"):
+            self._heat_formats = []
+            for minimum, colour in self.HEAT_LEVELS:
+                fmt = QTextCharFormat()
+                fmt.setBackground(QColor(colour))
+                fmt.setFontWeight(75)
+                self._heat_formats.append((minimum, fmt))
+        chosen = QTextCharFormat()
+        for minimum, fmt in self._heat_formats:
+            if count >= minimum:
+                chosen = fmt
+        return chosen
+
+    def apply_task_heat(self, counts):
+        """
+        Shades the visible days according to how many tasks they hold.
+
+        Args:
+            counts (dict): Non-zero task counts keyed by "YYYY-MM-DD" for the visible days.
+        """
+        # A null date clears the formats set for the previous page.
+        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+        for date_key, count in counts.items():
+            self.calendar.setDateTextFormat(QDate.fromString(date_key, Qt.ISODate), self.heat_format(count))
+
+    def set_day_task_count(self, date, count):
+        """
+        Updates the shading of a single day.
+
+        Args:
+            date (QDate): The day to update.
+            count (int): The number of tasks it now holds.
+        """
+        self.calendar.setDateTextFormat(date, self.heat_format(count))
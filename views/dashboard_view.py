@@ -2,8 +2,9 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSplitter
 from PyQt5.QtCore import Qt
 from utils.ui_helpers import create_button, create_label
-from controllers.calendar_controller import CalendarController  # Import the CalendarController
-from views.notes_view import NotesView
+from utils.style_engine import set_style_role
+from utils.view_cache import ViewCache
+from utils.config_manager import get_config
 
 check_list = """**What is done:**
     * Created file structure...............................................02/02/2025
@@ -47,6 +48,14 @@ class DashboardView(QWidget):
         """
         super().__init__()
         self.main_window = main_window
+        # Views shown in the right section are kept alive (hidden) and reused on the next visit.
+        self.view_cache = ViewCache(
+            max_views=get_config("VIEW_CACHE_MAX_VIEWS", 4),
+            max_bytes=get_config("VIEW_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+            policy=get_config("VIEW_CACHE_POLICY", "lru"),
+        )
+        # Cache key of the view shown in the right section.
+        self.current_section = "home"
         self.init_ui()
 
     def init_ui(self):
@@ -56,14 +65,9 @@ class DashboardView(QWidget):
         # Create a horizontal splitter for the left (navigation) and right (content) sections.
         splitter = QSplitter(Qt.Horizontal, self)
         
-        # Set the handle to be a thin, dotted line.
+        # Set the handle to be a thin, dotted line (see the "dashboard" rules in utils/style_engine.py).
         splitter.setHandleWidth(2)  # Adjust the width of the splitter handle.
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                border: 2px dotted #c9c3be;  /* Dotted line with a light gray color */
-                # background: transparent;     /* Transparent background for the handle */
-            }
-        """)
+        set_style_role(splitter, "dashboard")
 
         # -----------------------------
         # Left Section: Navigation Buttons
@@ -77,7 +81,7 @@ class DashboardView(QWidget):
         calendar_button = create_button(
             left_widget,
             "Calendar",
-            self.show_calendar  # Calls the method to update the right section.
+            lambda: self.open_section("calendar")  # Updates the right section through the history.
         )
         left_layout.addWidget(calendar_button)
         
@@ -85,7 +89,7 @@ class DashboardView(QWidget):
         notes_button = create_button(
             left_widget,
             "Notes",
-            self.show_notes  # Calls the method to update the right section.
+            lambda: self.open_section("notes")  # Updates the right section through the history.
         )
         left_layout.addWidget(notes_button)
         
@@ -100,9 +104,7 @@ class DashboardView(QWidget):
         self.right_layout.setSpacing(0)
         
         # Add a placeholder so the right section isn't empty on startup.
-        placeholder = create_label(self.right_widget, check_list, font_size="16px", color="#555")
-        self.right_layout.addWidget(placeholder)
-        self.right_layout.addStretch()
+        self.update_right_section(self.view_cache.get("home", self.create_placeholder))
 
         # Add the two sections to the splitter.
         splitter.addWidget(left_widget)
@@ -128,36 +130,134 @@ class DashboardView(QWidget):
     def update_right_section(self, widget):
         """
         Clears the right section and adds the provided widget.
+        Widgets held by the view cache are only hidden; the others are deleted.
 
         Args:
             widget (QWidget): The widget (CalendarView or NotesView) to display in the right section.
         """
         # Remove any existing widgets from the right layout.
         while self.right_layout.count():
-            child = self.right_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            child = self.right_layout.takeAt(0).widget()
+            if child is None or child is widget:
+                continue
+            # Hidden first in both cases, which lets the view save its state (e.g. the open note).
+            child.hide()
+            if not self.view_cache.is_cached(child):
+                child.deleteLater()
         # Add the new widget.
         self.right_layout.addWidget(widget)
+        widget.show()
+
+    def create_placeholder(self):
+        """
+        Builds the default content of the right section.
+        """
+        return create_label(self.right_widget, check_list, variant="muted")
+
+    def open_section(self, section):
+        """
+        Opens a section through the main window, which records the change in its navigation
+        history. Falls back to switching directly when the main window keeps no history.
+
+        Args:
+            section (str): "calendar", "notes" or "home".
+        """
+        if hasattr(self.main_window, "open_section"):
+            self.main_window.open_section(section)
+        else:
+            self.show_section(section)
+
+    def go_home(self):
+        """
+        Returns the right section to its placeholder through the navigation history.
+        """
+        self.open_section("home")
+
+    def show_section(self, section):
+        """
+        Displays a section in the right section without recording it in the history.
+
+        Args:
+            section (str): "calendar", "notes" or "home".
+
+        Returns:
+            bool: True if the section is now shown.
+        """
+        if section == "calendar":
+            self.show_calendar()
+        elif section == "notes":
+            return self.show_notes()
+        else:
+            self.go_back()
+        return True
 
     def show_calendar(self):
         """
         Displays the Calendar view in the right section.
         """
-        calendar_controller = CalendarController(self)  # Create an instance of CalendarController
+        # Imported on first use so startup does not pay for the calendar subsystem.
+        from controllers.calendar_controller import CalendarController
+        calendar_controller = self.view_cache.get("calendar", lambda: CalendarController(self))
+        self.current_section = "calendar"
         self.update_right_section(calendar_controller)  # Update the right section with the calendar view
 
     def show_notes(self):
         """
         Displays the Notes view in the right section.
+
+        Returns:
+            bool: False if the notes could not be loaded.
         """
-        notes_view = NotesView(self)
+        from views.notes_view import NotesView  # Imported on first use, like the calendar.
+        from core.notes import ensure_notes_storage
+        try:
+            ensure_notes_storage()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            from utils.error_utils import show_error_dialog
+            show_error_dialog(f"Your notes could not be loaded.\n\n{e}")
+            return False
+        notes_view = self.view_cache.get("notes", lambda: NotesView(self))
+        self.current_section = "notes"
         self.update_right_section(notes_view)
+        return True
 
     def go_back(self):
         """
         Resets the right section to its default placeholder content.
         This method can be called from subviews (e.g. CalendarView or NotesView) when a "Back" action is needed.
         """
-        placeholder = create_label(self.right_widget, check_list, font_size="16px", color="#555")
+        placeholder = self.view_cache.get("home", self.create_placeholder)
+        self.current_section = "home"
         self.update_right_section(placeholder)
+
+    def current_view(self):
+        """
+        Returns the widget shown in the right section.
+        """
+        item = self.right_layout.itemAt(0)
+        return item.widget() if item is not None else None
+
+    def view_state(self):
+        """
+        Returns a serializable snapshot of the dashboard: which section is open and that
+        section's own state.
+
+        Returns:
+            dict: The view type, open section and section state.
+        """
+        state = {"view": "dashboard", "section": self.current_section}
+        view = self.current_view()
+        if hasattr(view, "view_state"):
+            state["section_state"] = view.view_state()
+        return state
+
+    def restore_state(self, state):
+        """
+        Reopens the section captured by view_state and restores its state.
+        """
+        section = state.get("section", "home")
+        if not self.show_section(section) or section == "home":
+            return
+        view = self.current_view()
+        if "section_state" in state and hasattr(view, "restore_state"):
+            view.restore_state(state["section_state"])
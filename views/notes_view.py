@@ -1,8 +1,34 @@
 # views/notes_view.py
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListWidget, QHBoxLayout, QLineEdit
-from controllers.notes_controller import get_notebooks, add_notebook
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListView, QListWidget, QListWidgetItem, QHBoxLayout, QLineEdit
+from PyQt5.QtCore import Qt
+from core.notes import (
+    get_notebooks, add_notebook, add_note, iter_search_notes, find_note, subscribe_to_notes, unsubscribe_from_notes,
+)
 from utils.ui_helpers import create_button, create_label
+from utils.search_runner import SearchRunner
+from utils.change_batcher import ChangeBatcher
 from components.note_editor import NoteEditor
+from components.notebook_list import NotebookListModel
+
+# Shared background runner for note searches, created on first use.
+_search_runner = None
+
+def get_search_runner():
+    """
+    Returns the process-wide SearchRunner used for note searches.
+    """
+    global _search_runner
+    if _search_runner is None:
+        _search_runner = SearchRunner(iter_search_notes)
+    return _search_runner
+
+def note_title(note):
+    """
+    Returns the text shown for a note in lists: its title, or the start of its body.
+    """
+    if note.title:
+        return note.title
+    return (note.body or "").strip().split("\n", 1)[0][:60] or "Untitled note"
 
 class NotesView(QWidget):
     def __init__(self, main_window):
@@ -21,7 +47,7 @@ class NotesView(QWidget):
         Constructs the UI elements for the notes view.
         """
         layout = QVBoxLayout(self)
-        title = create_label(self, "Notes", **{"font-size": "18px", "color": "#000"})
+        title = create_label(self, "Notes", variant="title")
         layout.addWidget(title)
 
         # Horizontal layout for adding a new notebook.
@@ -32,35 +58,137 @@ class NotesView(QWidget):
         add_layout.addWidget(add_button)
         layout.addLayout(add_layout)
 
-        # List widget to display existing notebooks.
-        self.notebook_list = QListWidget(self)
+        # Search field; matching notes stream into the results list as they are found.
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText("Search notes...")
+        self.search_input.textChanged.connect(self.search_notes_action)
+        layout.addWidget(self.search_input)
+        self.search_results = QListWidget(self)
+        self.search_results.hide()
+        self.search_results.itemActivated.connect(self.open_search_result)
+        layout.addWidget(self.search_results)
+        self.search_generation = None
+        self.search_runner = get_search_runner()
+        self.search_runner.resultsReady.connect(self.on_search_results)
+
+        # List of existing notebooks, updated row by row as the notes model changes.
+        self.notebook_model = NotebookListModel(get_notebooks, self)
+        self.notebook_list = QListView(self)
+        self.notebook_list.setUniformItemSizes(True)
+        # Batched layout only lays out the rows near the viewport after an insert.
+        self.notebook_list.setLayoutMode(QListView.Batched)
+        self.notebook_list.setModel(self.notebook_model)
         layout.addWidget(self.notebook_list)
-        self.load_notebooks()
+        self.notes_changes = ChangeBatcher(self)
+        self.notes_changes.changesReady.connect(self.notebook_model.apply_changes)
+        listener = self.notes_changes.add
+        subscribe_to_notes(listener)
+        self.destroyed.connect(lambda: unsubscribe_from_notes(listener))
+
+        # Button to create a note in the selected notebook.
+        new_note_button = create_button(self, "New Note", self.add_note_action)
+        layout.addWidget(new_note_button)
 
         # Include the note editor component.
         self.note_editor = NoteEditor(self)
         layout.addWidget(self.note_editor)
 
-        # Back button to return to the dashboard.
-        back_button = create_button(self, "Back", self.main_window.go_back)
+        # Back button to return to the dashboard home; the switch is recorded in the navigation history.
+        back_button = create_button(self, "Back", self.main_window.go_home)
         layout.addWidget(back_button)
         self.setLayout(layout)
 
     def load_notebooks(self):
         """
-        Loads and displays the list of notebooks from the model.
+        Reloads the whole list of notebooks from the model.
+        Not needed after edits, which reach the list as change notifications.
         """
-        self.notebook_list.clear()
-        notebooks = get_notebooks()
-        for notebook_id, notebook in notebooks.items():
-            self.notebook_list.addItem(f"{notebook_id}: {notebook['name']}")
+        self.notebook_model.reload()
 
     def add_notebook_action(self):
         """
-        Reads the notebook name from the input field, adds a new notebook, and refreshes the list.
+        Reads the notebook name from the input field and adds a new notebook.
+        The list picks the notebook up from the model's change notification.
         """
         name = self.notebook_input.text().strip()
         if name:
             add_notebook(name)
-            self.load_notebooks()
             self.notebook_input.clear()
+
+    def view_state(self):
+        """
+        Returns a serializable snapshot of what the notes view shows.
+        The note itself is saved by the editor (when it is hidden and as typing pauses).
+
+        Returns:
+            dict: The view type, open note, search text, selected notebook and list scroll position.
+        """
+        current = self.notebook_list.currentIndex()
+        top = self.notebook_list.indexAt(self.notebook_list.viewport().rect().topLeft())
+        return {
+            "view": "notes",
+            "open_note": self.note_editor.note_id,
+            "search": self.search_input.text(),
+            "notebook_id": current.data(Qt.UserRole) if current.isValid() else None,
+            "notebook_row": max(0, top.row()),
+        }
+
+    def restore_state(self, state):
+        """
+        Reopens the note, search and list position captured by view_state.
+        """
+        if state.get("notebook_id") is not None:
+            row = self.notebook_model.row_of(state["notebook_id"])
+            if row >= 0:
+                self.notebook_list.setCurrentIndex(self.notebook_model.index(row))
+        top_row = state.get("notebook_row", 0)
+        if top_row < self.notebook_model.rowCount():
+            self.notebook_list.scrollTo(self.notebook_model.index(top_row), QListView.PositionAtTop)
+        if state.get("open_note") is not None and find_note(state["open_note"]) is not None:
+            self.note_editor.open_note(state["open_note"])
+        self.search_input.setText(state.get("search", ""))
+
+    def search_notes_action(self, text):
+        """
+        Starts a background search for the typed text, superseding any search in progress.
+        """
+        self.search_results.clear()
+        if not text.strip():
+            self.search_runner.cancel()
+            self.search_generation = None
+            self.search_results.hide()
+            return
+        self.search_results.show()
+        self.search_generation = self.search_runner.start(text)
+
+    def on_search_results(self, generation, batch):
+        """
+        Appends a batch of search results, ignoring batches from superseded searches.
+        """
+        if generation != self.search_generation:
+            return
+        self.search_results.setUpdatesEnabled(False)
+        for note_id, _score in batch:
+            found = find_note(note_id)
+            if found is not None:
+                item = QListWidgetItem(note_title(found[1]))
+                item.setData(Qt.UserRole, note_id)
+                self.search_results.addItem(item)
+        self.search_results.setUpdatesEnabled(True)
+
+    def open_search_result(self, item):
+        """
+        Opens the activated search result in the note editor.
+        """
+        self.note_editor.open_note(item.data(Qt.UserRole))
+
+    def add_note_action(self):
+        """
+        Creates an empty note in the selected notebook and opens it in the editor.
+        """
+        index = self.notebook_list.currentIndex()
+        if not index.isValid():
+            return
+        note_id = add_note(index.data(Qt.UserRole), {"title": "Untitled note", "body": ""})
+        if note_id is not None:
+            self.note_editor.open_note(note_id)